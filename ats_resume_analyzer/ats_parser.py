@@ -1,30 +1,78 @@
 import os
 import re
+import threading
 from typing import Dict, Any
-from pdfminer.high_level import extract_text as pdf_extract_text
-import docx2txt
-from io import StringIO
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
 from skills_library import (
     TECHNICAL_SKILLS, SOFT_SKILLS, EXPERIENCE_KEYWORDS,
     EDUCATION_KEYWORDS, FORMATTING_GUIDELINES
 )
+from skill_matcher import SkillMatcher
+from parse_cache import ParseCache, file_content_hash
+
+# Bump whenever parse_resume output changes so cached results are not reused
+PARSER_VERSION = '4'
+
+# Anything that is neither a letter, a digit nor whitespace ('_' is a word
+# character for the regex but not alphanumeric)
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]|_')
+SMART_QUOTES = '\u201c\u201d\u2018\u2019'
+BULLET_CHARS = ('•', '·', '-')
+
+
+def get_context(text: str, position: int, radius: int = 20) -> str:
+    """Return the text around position on one line, as shown in reports."""
+    return text[max(0, position - radius):position + radius].replace('\n', ' ').strip()
+
+
+class NLTKResources:
+    """NLTK tokenizers and English stopwords, downloading the data if it is missing."""
 
-class ATSParser:
     def __init__(self):
-        """Initialize the ATS Parser with necessary NLTK data."""
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.tokenize import sent_tokenize, word_tokenize
         try:
             nltk.data.find('tokenizers/punkt')
             nltk.data.find('corpora/stopwords')
         except LookupError:
             nltk.download('punkt')
             nltk.download('stopwords')
-        self.stop_words = set(stopwords.words('english'))
+        self.sent_tokenize = sent_tokenize
+        self.word_tokenize = word_tokenize
+        self.stop_words = frozenset(stopwords.words('english'))
+
+
+_nltk_resources = None
+_nltk_lock = threading.Lock()
+
+
+def get_nltk_resources() -> NLTKResources:
+    """Load NLTK on first use and share it across all parsers in the process."""
+    global _nltk_resources
+    with _nltk_lock:
+        if _nltk_resources is None:
+            _nltk_resources = NLTKResources()
+        return _nltk_resources
+
+class ATSParser:
+    def __init__(self, use_cache: bool = True):
+        """Initialize the ATS Parser; NLTK and the text extractors are loaded when first needed."""
+        self.skill_matcher = SkillMatcher()
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = ParseCache(PARSER_VERSION)
+            except Exception as e:
+                print(f"Warning: Could not open parse cache: {e}")
+
+    @property
+    def stop_words(self) -> frozenset:
+        """English stopwords from the shared NLTK resources."""
+        return get_nltk_resources().stop_words
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF using pdfminer.six for accurate ATS simulation."""
+        from pdfminer.high_level import extract_text as pdf_extract_text
         try:
             return pdf_extract_text(pdf_path)
         except Exception as e:
@@ -33,6 +81,7 @@ class ATSParser:
 
     def extract_text_from_docx(self, docx_path: str) -> str:
         """Extract text from DOCX using docx2txt for accurate ATS simulation."""
+        import docx2txt
         try:
             return docx2txt.process(docx_path)
         except Exception as e:
@@ -50,24 +99,42 @@ class ATSParser:
             raise ValueError(f"Unsupported file format: {file_extension}")
 
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
-        """Parse resume using NLP techniques for comprehensive analysis."""
+        """
+        Parse resume using NLP techniques for comprehensive analysis.
+        Results are cached by file content, so an unchanged resume is only parsed once.
+        """
+        content_hash = None
+        if self.cache is not None:
+            try:
+                content_hash = file_content_hash(file_path)
+            except OSError:
+                pass
+            if content_hash and (cached := self.cache.get(content_hash)) is not None:
+                return cached
+        
         # Get raw text
         raw_text = self.extract_text(file_path)
+        nltk_resources = get_nltk_resources()
         
         # Tokenize text
-        sentences = sent_tokenize(raw_text)
-        words = word_tokenize(raw_text.lower())
-        words = [w for w in words if w not in self.stop_words and w.isalnum()]
+        sentences = nltk_resources.sent_tokenize(raw_text)
+        words = nltk_resources.word_tokenize(raw_text.lower())
+        words = [w for w in words if w not in nltk_resources.stop_words and w.isalnum()]
         
         # Parse and analyze
+        sections = self._identify_sections(raw_text)
         parsed_data = {
             'raw_text': raw_text,
-            'sections': self._identify_sections(raw_text),
+            'sections': sections,
             'skills': self._extract_skills(raw_text, words),
-            'formatting': self._analyze_formatting(raw_text, sentences),
+            'formatting': self._analyze_formatting(raw_text, sentences, sections),
             'readability': self._analyze_readability(sentences, words)
         }
         
+        # Failed extractions return no text and are retried next time
+        if content_hash and raw_text.strip():
+            self.cache.put(content_hash, parsed_data)
+        
         return parsed_data
 
     def _identify_sections(self, text: str) -> Dict[str, bool]:
@@ -92,70 +159,35 @@ class ATSParser:
         }
 
     def _extract_skills(self, text: str, words: list) -> Dict[str, list]:
-        """Extract skills using keyword matching and NLP."""
-        text_lower = text.lower()
-        found_skills = {
-            'technical': [],
-            'soft': [],
-            'other': [],
-            'locations': {}  # Store where skills are found
-        }
-        
-        # Check technical skills
-        for category, skills in TECHNICAL_SKILLS.items():
-            for skill in skills:
-                skill_lower = skill.lower()
-                if skill_lower in text_lower:
-                    found_skills['technical'].append(skill)
-                    # Find all occurrences of the skill
-                    start = 0
-                    skill_locations = []
-                    while True:
-                        idx = text_lower.find(skill_lower, start)
-                        if idx == -1:
-                            break
-                        skill_locations.append(idx)
-                        start = idx + 1
-                    found_skills['locations'][skill] = skill_locations
-        
-        # Check soft skills
-        for category, skills in SOFT_SKILLS.items():
-            for skill in skills:
-                skill_lower = skill.lower()
-                if skill_lower in text_lower:
-                    found_skills['soft'].append(skill)
-                    # Find all occurrences of the skill
-                    start = 0
-                    skill_locations = []
-                    while True:
-                        idx = text_lower.find(skill_lower, start)
-                        if idx == -1:
-                            break
-                        skill_locations.append(idx)
-                        start = idx + 1
-                    found_skills['locations'][skill] = skill_locations
-        
-        return found_skills
+        """Extract skills as whole-word matches of the skills library, found in one pass over the text."""
+        return self.skill_matcher.extract(text)
 
-    def _analyze_formatting(self, text: str, sentences: list) -> Dict[str, Any]:
-        """Analyze resume formatting as typically processed by ATS."""
-        lines = text.split('\n')
-        
-        # Analyze special characters
+    def _analyze_formatting(self, text: str, sentences: list, sections: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Analyze resume formatting as typically processed by ATS.
+        Special characters are found in a single regex scan and recorded by position;
+        use get_context to show the text around one.
+        """
+        # Positions of each special character; smart quotes and bullets are counted from these
         special_chars = {}
-        for i, char in enumerate(text):
-            if not char.isalnum() and not char.isspace():
-                context = text[max(0, i-20):min(len(text), i+20)]
-                if char not in special_chars:
-                    special_chars[char] = []
-                special_chars[char].append({
-                    'position': i,
-                    'context': context.replace('\n', ' ').strip()
-                })
+        for match in SPECIAL_CHAR_PATTERN.finditer(text):
+            special_chars.setdefault(match.group(), []).append(match.start())
+        
+        smart_quotes = sorted(
+            ({'position': position, 'char': char}
+             for char in SMART_QUOTES for position in special_chars.get(char, [])),
+            key=lambda quote: quote['position']
+        )
         
-        # Detect table-like structures
+        # Line statistics and table-like structures
+        lines = text.split('\n')
+        empty_lines = 0
+        total_line_length = 0
         table_indicators = []
         for i, line in enumerate(lines):
+            total_line_length += len(line)
+            if not line.strip():
+                empty_lines += 1
             if '\t' in line or '|' in line or line.count('  ') > 2:
                 table_indicators.append({
                     'line_number': i + 1,
@@ -163,29 +195,17 @@ class ATSParser:
                     'type': 'tab_separated' if '\t' in line else 'pipe_separated' if '|' in line else 'space_separated'
                 })
         
-        # Detect smart quotes and other problematic characters
-        smart_quotes = []
-        problematic_quotes = ['"', '"', ''', ''', "'"]
-        for i, char in enumerate(text):
-            if char in problematic_quotes:
-                context = text[max(0, i-20):min(len(text), i+20)]
-                smart_quotes.append({
-                    'position': i,
-                    'char': char,
-                    'context': context.replace('\n', ' ').strip()
-                })
-        
         return {
             'total_lines': len(lines),
-            'empty_lines': len([l for l in lines if not l.strip()]),
-            'avg_line_length': sum(len(l) for l in lines) / len(lines) if lines else 0,
-            'special_chars_count': len([c for c in text if not c.isalnum() and not c.isspace()]),
+            'empty_lines': empty_lines,
+            'avg_line_length': total_line_length / len(lines) if lines else 0,
+            'special_chars_count': sum(len(positions) for positions in special_chars.values()),
             'special_chars_details': special_chars,
             'has_tables': bool(table_indicators),
             'table_indicators': table_indicators,
-            'bullet_points': text.count('•') + text.count('·') + text.count('-'),
+            'bullet_points': sum(len(special_chars.get(char, [])) for char in BULLET_CHARS),
             'smart_quotes': smart_quotes,
-            'sections': self._identify_sections(text)
+            'sections': sections if sections is not None else self._identify_sections(text)
         }
 
     def _analyze_readability(self, sentences: list, words: list) -> Dict[str, float]:
@@ -194,6 +214,7 @@ class ATSParser:
             return {'score': 0.0}
         
         # Analyze sentence length
+        word_tokenize = get_nltk_resources().word_tokenize
         sentence_analysis = []
         for sentence in sentences:
             words_in_sentence = len(word_tokenize(sentence))
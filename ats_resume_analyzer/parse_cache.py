@@ -0,0 +1,109 @@
+"""Persistent cache of resume parse results, keyed by file content hash and parser version."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.ats_resume_analyzer', 'parse_cache.sqlite3')
+
+
+def file_content_hash(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    SQLite-backed cache of parse_resume results.
+    Entries are stored as zlib-compressed JSON under the content hash of the
+    resume file, so renamed or copied files still hit the cache. Entries from
+    other parser versions are dropped when the cache is opened, and the least
+    recently used entries are evicted once the stored data exceeds max_bytes.
+    """
+
+    def __init__(self, version: str, path: str = DEFAULT_CACHE_PATH, max_bytes: int = 50 * 1024 * 1024):
+        self.version = version
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS parses ('
+                'content_hash TEXT PRIMARY KEY, '
+                'version TEXT NOT NULL, '
+                'data BLOB NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS parses_accessed_at ON parses (accessed_at)')
+            self._conn.execute('DELETE FROM parses WHERE version != ?', (version,))
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse result for content_hash, or None on a miss or an unreadable entry."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT data FROM parses WHERE content_hash = ? AND version = ?',
+                (content_hash, self.version)
+            ).fetchone()
+            if not row:
+                return None
+            try:
+                parsed_data = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+            except (zlib.error, ValueError):
+                # Corrupt entries are dropped so the resume is parsed and stored again
+                self._conn.execute('DELETE FROM parses WHERE content_hash = ?', (content_hash,))
+                return None
+            self._conn.execute(
+                'UPDATE parses SET accessed_at = ? WHERE content_hash = ?', (time.time(), content_hash)
+            )
+        return parsed_data
+
+    def put(self, content_hash: str, parsed_data: Dict[str, Any]) -> None:
+        """Store a parse result and evict old entries if the cache is over its size limit."""
+        data = zlib.compress(json.dumps(parsed_data, separators=(',', ':')).encode('utf-8'))
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parses (content_hash, version, data, size, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (content_hash, self.version, data, len(data), time.time())
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until the stored data fits in max_bytes."""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM parses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute('SELECT content_hash, size FROM parses ORDER BY accessed_at ASC').fetchall()
+        stale = []
+        for content_hash, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((content_hash,))
+            total -= size
+        self._conn.executemany('DELETE FROM parses WHERE content_hash = ?', stale)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM parses').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
@@ -1,23 +1,29 @@
 import os
+import csv
+import glob
 import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
-from ats_parser import ATSParser
+from typing import Dict, Any, List
+from ats_parser import ATSParser, get_context
 from skills_library import (
     TECHNICAL_SKILLS, SOFT_SKILLS, EXPERIENCE_KEYWORDS,
     EDUCATION_KEYWORDS, FORMATTING_GUIDELINES
 )
 
 class ATSResumeAnalyzer:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """Initialize the ATS Resume Analyzer with ATS parser."""
-        self.parser = ATSParser()
+        self.parser = ATSParser(use_cache=use_cache)
 
-    def analyze_resume(self, file_path: str) -> Dict[str, Any]:
+    def analyze_resume(self, file_path: str, save_report: bool = True) -> Dict[str, Any]:
         """Analyze resume using ATS simulation techniques."""
         # Parse resume using multiple ATS simulation techniques
         parsed_data = self.parser.parse_resume(file_path)
+        if not parsed_data['raw_text'].strip():
+            raise ValueError("No text could be extracted from the resume")
         
         # Calculate ATS compatibility score
         ats_score = self._calculate_ats_score(parsed_data)
@@ -33,7 +39,8 @@ class ATSResumeAnalyzer:
         }
         
         # Save detailed report
-        self._save_detailed_report(analysis_results)
+        if save_report:
+            self._save_detailed_report(analysis_results, file_path)
         
         return analysis_results
 
@@ -70,18 +77,29 @@ class ATSResumeAnalyzer:
         
         return round(score, 2)
 
-    def _save_detailed_report(self, analysis_results: Dict[str, Any]) -> None:
-        """Save detailed analysis report to user's documents folder."""
+    def _save_detailed_report(self, analysis_results: Dict[str, Any], file_path: str) -> str:
+        """Save detailed analysis report to user's documents folder and return its path."""
         # Get user's documents folder
         docs_folder = str(Path.home() / "Documents")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_folder = os.path.join(docs_folder, "ATS_Analysis_Reports")
         os.makedirs(report_folder, exist_ok=True)
         
-        # Create report filename
-        report_file = os.path.join(report_folder, f"ats_analysis_{timestamp}.txt")
+        # Name the report after the resume; batch workers finishing in the same
+        # second (or resumes with the same name) get a numbered file instead of
+        # overwriting each other's report
+        report_name = f"ats_analysis_{Path(file_path).stem}_{timestamp}"
+        report_file = os.path.join(report_folder, f"{report_name}.txt")
+        copy = 1
+        while True:
+            try:
+                f = open(report_file, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                copy += 1
+                report_file = os.path.join(report_folder, f"{report_name}_{copy}.txt")
         
-        with open(report_file, 'w', encoding='utf-8') as f:
+        with f:
             f.write("=== ATS Resume Analysis Report ===\n\n")
             
             # Overall Score
@@ -93,6 +111,7 @@ class ATSResumeAnalyzer:
             skills = analysis_results['parsed_data']['skills']
             f.write(f"1. Technical Skills Coverage: {len(skills['technical'])} skills detected\n")
             formatting = analysis_results['parsed_data']['formatting']
+            raw_text = analysis_results['parsed_data']['raw_text']
             f.write(f"2. Bullet Points Usage: {formatting['bullet_points']} bullet points found\n")
             
             f.write("\nAreas for Improvement:\n")
@@ -132,10 +151,10 @@ class ATSResumeAnalyzer:
             
             if formatting['special_chars_details']:
                 f.write("\nDetailed Special Characters Found:\n")
-                for char, occurrences in formatting['special_chars_details'].items():
-                    f.write(f"- '{char}' ({len(occurrences)} times)\n")
+                for char, positions in formatting['special_chars_details'].items():
+                    f.write(f"- '{char}' ({len(positions)} times)\n")
                     # Show first occurrence context
-                    f.write(f"  Example: ...{occurrences[0]['context']}...\n")
+                    f.write(f"  Example: ...{get_context(raw_text, positions[0])}...\n")
             
             if formatting['table_indicators']:
                 f.write("\nTable-like Structures Found:\n")
@@ -145,7 +164,7 @@ class ATSResumeAnalyzer:
             if formatting['smart_quotes']:
                 f.write("\nSmart Quotes Found:\n")
                 for quote in formatting['smart_quotes']:
-                    f.write(f"- '{quote['char']}' in context: ...{quote['context']}...\n")
+                    f.write(f"- '{quote['char']}' in context: ...{get_context(raw_text, quote['position'])}...\n")
             
             # Readability Analysis
             f.write("\n=== Readability Analysis ===\n")
@@ -197,21 +216,147 @@ class ATSResumeAnalyzer:
             f.write("* Always tailor your resume for specific job descriptions.\n")
         
         print(f"\nDetailed analysis report saved to: {report_file}")
+        return report_file
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+BATCH_COLUMNS = [
+    'file', 'ats_score', 'technical_skills_count', 'soft_skills_count',
+    'technical_skills', 'soft_skills', 'critical_issues', 'important_improvements', 'error'
+]
+
+# Analyzer held by each batch worker process, so NLTK data loads once per worker
+_worker_analyzer = None
+
+
+def _init_batch_worker(use_cache: bool = True) -> None:
+    """Create the analyzer for this worker process."""
+    global _worker_analyzer
+    _worker_analyzer = ATSResumeAnalyzer(use_cache=use_cache)
+
+
+def _analyze_for_batch(file_path: str, save_report: bool = False) -> Dict[str, Any]:
+    """Analyze one resume in a worker and return its summary row; errors are reported in the row."""
+    row = {column: '' for column in BATCH_COLUMNS}
+    row['file'] = file_path
+    try:
+        results = _worker_analyzer.analyze_resume(file_path, save_report=save_report)
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+        return row
+
+    skills = results['parsed_data']['skills']
+    row.update({
+        'ats_score': results['ats_score'],
+        'technical_skills_count': len(skills['technical']),
+        'soft_skills_count': len(skills['soft']),
+        'technical_skills': '; '.join(skills['technical']),
+        'soft_skills': '; '.join(skills['soft']),
+        'critical_issues': '; '.join(results['recommendations']['critical']),
+        'important_improvements': '; '.join(results['recommendations']['important']),
+    })
+    return row
+
+
+def find_resumes(inputs: List[str]) -> List[str]:
+    """Expand directories and glob patterns into a sorted list of PDF and DOCX files."""
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, name) for name in os.listdir(item)]
+        elif glob.has_magic(item):
+            candidates = glob.glob(item, recursive=True)
+        else:
+            candidates = [item]
+        files.update(
+            path for path in candidates
+            if os.path.isfile(path) and os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS
+        )
+    return sorted(files)
+
+
+def analyze_batch(file_paths: List[str], output_path: str, workers: int = None,
+                  save_reports: bool = False, use_cache: bool = True) -> Dict[str, int]:
+    """
+    Analyze many resumes across a process pool and stream one summary row per
+    file to a CSV or JSONL file (chosen by extension) as each one finishes.
+    Returns the number of files analyzed and failed.
+    """
+    if os.path.dirname(output_path):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    use_jsonl = output_path.lower().endswith(('.jsonl', '.json'))
+    total = len(file_paths)
+    counts = {'analyzed': 0, 'failed': 0}
+
+    with open(output_path, 'w', newline='', encoding='utf-8') as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                initargs=(use_cache,)) as executor:
+        writer = None if use_jsonl else csv.DictWriter(f, fieldnames=BATCH_COLUMNS)
+        if writer:
+            writer.writeheader()
+
+        futures = [executor.submit(_analyze_for_batch, path, save_reports) for path in file_paths]
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = future.result()
+            if use_jsonl:
+                f.write(json.dumps(row) + '\n')
+            else:
+                writer.writerow(row)
+            f.flush()
+
+            if row['error']:
+                counts['failed'] += 1
+                status = f"failed ({row['error']})"
+            else:
+                counts['analyzed'] += 1
+                status = f"score {row['ats_score']}%"
+            print(f"[{done}/{total}] {os.path.basename(row['file'])}: {status}")
+
+    return counts
+
 
 def main():
     """Main function to run the resume analyzer."""
     import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python resume_analyzer.py <path_to_resume>")
-        sys.exit(1)
-        
-    resume_path = sys.argv[1]
+
+    arg_parser = argparse.ArgumentParser(description='Analyze resumes for ATS compatibility.')
+    arg_parser.add_argument('paths', nargs='+',
+                            help='Resume file, or for batch mode directories and glob patterns of PDF/DOCX files')
+    arg_parser.add_argument('-o', '--output',
+                            help='Batch results file (.csv or .jsonl); defaults to a CSV in the reports folder')
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help='Number of worker processes for batch mode (default: CPU count)')
+    arg_parser.add_argument('--save-reports', action='store_true',
+                            help='Also write the detailed text report for every resume in batch mode')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='Parse every resume from scratch instead of reusing cached results')
+    args = arg_parser.parse_args()
+
+    batch_mode = (len(args.paths) > 1 or args.output or os.path.isdir(args.paths[0])
+                  or glob.has_magic(args.paths[0]))
+    if batch_mode:
+        file_paths = find_resumes(args.paths)
+        if not file_paths:
+            print("Error: No PDF or DOCX files found.")
+            sys.exit(1)
+
+        output_path = args.output or os.path.join(
+            str(Path.home() / "Documents"), "ATS_Analysis_Reports",
+            f"ats_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        print(f"Analyzing {len(file_paths)} resumes...")
+        counts = analyze_batch(file_paths, output_path, workers=args.workers,
+                               save_reports=args.save_reports, use_cache=not args.no_cache)
+        print(f"\nAnalyzed {counts['analyzed']} resumes, {counts['failed']} failed.")
+        print(f"Results saved to: {output_path}")
+        return
+
+    resume_path = args.paths[0]
     if not os.path.exists(resume_path):
         print("Error: File not found. Please provide a valid file path.")
         sys.exit(1)
         
-    analyzer = ATSResumeAnalyzer()
+    analyzer = ATSResumeAnalyzer(use_cache=not args.no_cache)
     
     try:
         results = analyzer.analyze_resume(resume_path)
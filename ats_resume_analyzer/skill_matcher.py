@@ -0,0 +1,121 @@
+"""Aho-Corasick matcher that finds every skill from the skills library in one pass."""
+from collections import deque
+from typing import Dict, List, Tuple
+
+from skills_library import TECHNICAL_SKILLS, SOFT_SKILLS
+
+
+# A single-letter skill followed by one of these is another language, e.g. 'C' in 'C++' or 'C#'
+LANGUAGE_SUFFIXES = '+#'
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Multi-pattern automaton over a skills library.
+
+    All skills are matched case-insensitively in a single scan of the text. A
+    match only counts when it is not part of a longer word, so 'R' and 'Go'
+    are not found inside 'React' or 'Google'. Boundaries are only enforced on
+    sides of a skill that end in a letter or digit, which keeps skills such as
+    'C++' and 'C#' matchable. A single-letter skill directly followed by '+'
+    or '#' is not matched either, so 'C' is not found in 'C++' or 'C#'.
+    """
+
+    def __init__(self, technical_skills: Dict[str, list] = TECHNICAL_SKILLS,
+                 soft_skills: Dict[str, list] = SOFT_SKILLS):
+        # Skills in library order per kind, as _extract_skills has always reported them
+        self.skills = {
+            'technical': [skill for skills in technical_skills.values() for skill in skills],
+            'soft': [skill for skills in soft_skills.values() for skill in skills],
+        }
+        self.patterns: List[str] = []
+        pattern_ids = {}
+        for skills in self.skills.values():
+            for skill in skills:
+                pattern = skill.lower()
+                if pattern and pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(self.patterns)
+                    self.patterns.append(pattern)
+        self._build(self.patterns)
+
+    def _build(self, patterns: List[str]) -> None:
+        """Build the trie, failure links and merged output lists"""
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Fold the failure links into the transitions (breadth first, so a state's
+        # failure target is complete before the state itself) so the scan takes
+        # exactly one lookup per character
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions = dict(delta[fail[state]]) if state else {}
+            transitions.update(goto[state])
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fail[next_state] = delta[fail[state]].get(char, 0) if state else 0
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+            if state:
+                delta[state] = transitions
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def find_all(self, text_lower: str) -> List[Tuple[int, int]]:
+        """Return (pattern_id, start) for every whole-word skill occurrence in lowercased text"""
+        delta, outputs, patterns = self._delta, self._outputs, self.patterns
+        length = len(text_lower)
+        matches = []
+        state = 0
+        for end, char in enumerate(text_lower):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for pattern_id in outputs[state]:
+                pattern = patterns[pattern_id]
+                start = end - len(pattern) + 1
+                if _is_word_char(pattern[0]) and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < length and _is_word_char(pattern[-1]) and (
+                        _is_word_char(text_lower[end + 1])
+                        or (len(pattern) == 1 and text_lower[end + 1] in LANGUAGE_SUFFIXES)):
+                    continue
+                matches.append((pattern_id, start))
+        return matches
+
+    def extract(self, text: str) -> Dict[str, list]:
+        """Find skills in text, returning the found_skills structure used by ATSParser"""
+        locations_by_pattern: Dict[str, list] = {}
+        for pattern_id, start in self.find_all(text.lower()):
+            locations_by_pattern.setdefault(self.patterns[pattern_id], []).append(start)
+
+        found_skills = {
+            'technical': [],
+            'soft': [],
+            'other': [],
+            'locations': {}  # Store where skills are found
+        }
+        for kind, skills in self.skills.items():
+            for skill in skills:
+                skill_locations = locations_by_pattern.get(skill.lower())
+                if skill_locations:
+                    found_skills[kind].append(skill)
+                    found_skills['locations'][skill] = sorted(skill_locations)
+        return found_skills
@@ -0,0 +1,68 @@
+"""Batch mode writes one detailed report per resume."""
+import zipfile
+from xml.sax.saxutils import escape
+
+import pytest
+
+import resume_analyzer
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+
+def write_docx(path, lines):
+    """Write a minimal DOCX with one paragraph per line."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    paragraphs = ''.join(f'<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>' for line in lines)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('[Content_Types].xml', CONTENT_TYPES)
+        docx.writestr('word/document.xml', document)
+    return str(path)
+
+
+@pytest.fixture
+def nltk_data():
+    nltk = pytest.importorskip('nltk')
+    for resource in ('tokenizers/punkt', 'corpora/stopwords'):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            pytest.skip(f"NLTK data '{resource}' is not installed")
+
+
+def test_batch_writes_one_report_per_resume(tmp_path, monkeypatch, nltk_data):
+    pytest.importorskip('docx2txt')
+    monkeypatch.setenv('HOME', str(tmp_path))
+    resumes = [
+        write_docx(tmp_path / 'resumes' / f'resume_{index}.docx', [
+            f'Candidate {index}',
+            'Experience',
+            'Data analyst building Python and SQL reports with Tableau.',
+            'Education',
+            "Bachelor's degree in Statistics.",
+            'Skills',
+            'Python, SQL, Tableau, communication, leadership.',
+        ])
+        for index in range(8)
+    ]
+    # Same file name in another folder
+    resumes.append(write_docx(tmp_path / 'other' / 'resume_0.docx', ['Experience', 'Python developer.']))
+
+    counts = resume_analyzer.analyze_batch(resumes, str(tmp_path / 'batch.csv'), workers=4,
+                                           save_reports=True, use_cache=False)
+
+    assert counts == {'analyzed': len(resumes), 'failed': 0}
+    reports = list((tmp_path / 'Documents' / 'ATS_Analysis_Reports').glob('ats_analysis_*.txt'))
+    assert len(reports) == len(resumes)
+    assert sum(report.name.startswith('ats_analysis_resume_0_') for report in reports) == 2
@@ -0,0 +1,71 @@
+"""Formatting metrics of a known resume text, and the special character scan against a per-character test."""
+import sys
+
+from ats_parser import SPECIAL_CHAR_PATTERN, ATSParser, get_context
+
+TEXT = ("Jane Doe | jane_doe@example.com\n"
+        "\n"
+        "EXPERIENCE\n"
+        "• Built “self-serve” dashboards\n"
+        "- Cut costs 20%\n"
+        "Skills:\tSQL\tPython")
+
+
+def analyze(text):
+    return ATSParser(use_cache=False)._analyze_formatting(text, [])
+
+
+def test_special_chars():
+    formatting = analyze(TEXT)
+    assert formatting['special_chars_details'] == {
+        '|': [9], '_': [15], '@': [19], '.': [27], '•': [44], '“': [52],
+        '-': [57, 76], '”': [63], '%': [90], ':': [98],
+    }
+    assert list(formatting['special_chars_details']) == ['|', '_', '@', '.', '•', '“', '-', '”', '%', ':']
+    assert formatting['special_chars_count'] == 11
+    assert formatting['bullet_points'] == 3
+    assert formatting['smart_quotes'] == [{'position': 52, 'char': '“'}, {'position': 63, 'char': '”'}]
+
+
+def test_context_strings():
+    contexts = {char: [get_context(TEXT, position) for position in positions]
+                for char, positions in analyze(TEXT)['special_chars_details'].items()}
+    assert contexts['|'] == ['Jane Doe | jane_doe@example.c']
+    assert contexts['•'] == ['ple.com  EXPERIENCE • Built “self-serve”']
+    assert contexts['-'] == ['RIENCE • Built “self-serve” dashboards -',
+                             'f-serve” dashboards - Cut costs 20% Skil']
+    assert contexts[':'] == ['Cut costs 20% Skills:\tSQL\tPython']
+
+
+def test_line_metrics():
+    formatting = analyze(TEXT)
+    assert formatting['total_lines'] == 6
+    assert formatting['empty_lines'] == 1
+    assert formatting['avg_line_length'] == 17.5
+    assert formatting['has_tables']
+    assert formatting['table_indicators'] == [
+        {'line_number': 1, 'content': 'Jane Doe | jane_doe@example.com', 'type': 'pipe_separated'},
+        {'line_number': 6, 'content': 'Skills:\tSQL\tPython', 'type': 'tab_separated'},
+    ]
+    assert formatting['sections']['present']['experience']
+    assert formatting['sections']['locations'] == {'experience': 33, 'skills': 92}
+
+
+def test_sections_passed_in_are_reused():
+    sections = {'present': {}, 'locations': {}}
+    assert ATSParser(use_cache=False)._analyze_formatting(TEXT, [], sections)['sections'] is sections
+
+
+def test_plain_text():
+    formatting = analyze('Summary\nData analyst')
+    assert formatting['special_chars_details'] == {}
+    assert formatting['special_chars_count'] == formatting['bullet_points'] == 0
+    assert formatting['smart_quotes'] == []
+    assert not formatting['has_tables']
+
+
+def test_pattern_matches_per_character_test_on_every_code_point():
+    # Surrogates cannot be encoded and never occur in extracted text
+    text = ''.join(chr(i) for i in range(sys.maxunicode + 1) if not 0xD800 <= i <= 0xDFFF)
+    assert [match.start() for match in SPECIAL_CHAR_PATTERN.finditer(text)] == [
+        i for i, char in enumerate(text) if not char.isalnum() and not char.isspace()]
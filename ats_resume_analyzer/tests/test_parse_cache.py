@@ -0,0 +1,141 @@
+"""Parse results are cached by file content and parser version."""
+import itertools
+import zlib
+
+import pytest
+
+import ats_parser
+import parse_cache
+from ats_parser import ATSParser
+from parse_cache import ParseCache, file_content_hash
+
+PARSED = {'raw_text': 'Jane Doe\nSkills: SQL', 'skills': {'technical': ['SQL'], 'soft': []}}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'parse_cache.sqlite3')
+
+
+@pytest.fixture
+def cache(cache_path):
+    cache = ParseCache('1', cache_path)
+    yield cache
+    cache.close()
+
+
+def test_round_trip(cache):
+    assert cache.get('abc') is None
+    cache.put('abc', PARSED)
+    assert cache.get('abc') == PARSED
+    assert len(cache) == 1
+
+
+def test_entries_survive_reopening(cache_path):
+    cache = ParseCache('1', cache_path)
+    cache.put('abc', PARSED)
+    cache.close()
+    cache = ParseCache('1', cache_path)
+    assert cache.get('abc') == PARSED
+    cache.close()
+
+
+def test_new_parser_version_drops_entries(cache_path):
+    cache = ParseCache('1', cache_path)
+    cache.put('abc', PARSED)
+    cache.close()
+    cache = ParseCache('2', cache_path)
+    assert cache.get('abc') is None
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_corrupt_entry_is_a_miss_and_dropped(cache):
+    cache.put('abc', PARSED)
+    cache.put('def', PARSED)
+    with cache._conn:
+        cache._conn.execute("UPDATE parses SET data = ? WHERE content_hash = 'abc'", (b'not zlib',))
+        cache._conn.execute("UPDATE parses SET data = ? WHERE content_hash = 'def'", (zlib.compress(b'{"cut'),))
+    assert cache.get('abc') is None
+    assert cache.get('def') is None
+    assert len(cache) == 0
+    cache.put('abc', PARSED)
+    assert cache.get('abc') == PARSED
+
+
+def test_least_recently_used_entries_are_evicted(cache_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(parse_cache.time, 'time', lambda: next(clock))
+    entry_size = len(zlib.compress(b'{}'))
+    cache = ParseCache('1', cache_path, max_bytes=2 * entry_size)
+    cache.put('a', {})
+    cache.put('b', {})
+    assert cache.get('a') == {}  # 'b' is now the least recently used
+    cache.put('c', {})
+    assert (cache.get('a'), cache.get('b'), cache.get('c')) == ({}, None, {})
+    cache.close()
+
+
+def test_content_hash_follows_file_content(tmp_path):
+    first, copy = tmp_path / 'resume.txt', tmp_path / 'renamed.txt'
+    first.write_text('Jane Doe')
+    copy.write_text('Jane Doe')
+    assert file_content_hash(str(first)) == file_content_hash(str(copy))
+    first.write_text('Jane Doe, SQL')
+    assert file_content_hash(str(first)) != file_content_hash(str(copy))
+
+
+class Extracted(Exception):
+    """Raised instead of extracting text, to show parse_resume missed the cache"""
+
+
+@pytest.fixture
+def parser(cache_path, monkeypatch):
+    monkeypatch.setattr(ats_parser, 'ParseCache', lambda version: ParseCache(version, cache_path))
+    parser = ATSParser()
+
+    def extract_text(file_path):
+        raise Extracted(file_path)
+    parser.extract_text = extract_text
+    yield parser
+    parser.cache.close()
+
+
+def test_parse_resume_reads_cached_result(parser, tmp_path):
+    resume = tmp_path / 'resume.docx'
+    resume.write_bytes(b'resume contents')
+    parser.cache.put(file_content_hash(str(resume)), PARSED)
+    assert parser.parse_resume(str(resume)) == PARSED
+
+
+def test_parse_resume_reparses_changed_file(parser, tmp_path):
+    resume = tmp_path / 'resume.docx'
+    resume.write_bytes(b'resume contents')
+    parser.cache.put(file_content_hash(str(resume)), PARSED)
+    resume.write_bytes(b'edited resume contents')
+    with pytest.raises(Extracted):
+        parser.parse_resume(str(resume))
+
+
+@pytest.fixture
+def old_version_entry(cache_path, tmp_path):
+    resume = tmp_path / 'resume.docx'
+    resume.write_bytes(b'resume contents')
+    old_cache = ParseCache('0', cache_path)
+    old_cache.put(file_content_hash(str(resume)), PARSED)
+    old_cache.close()
+    return resume
+
+
+def test_parse_resume_reparses_other_parser_version(old_version_entry, parser):
+    assert parser.cache.version == ats_parser.PARSER_VERSION != '0'
+    with pytest.raises(Extracted):
+        parser.parse_resume(str(old_version_entry))
+
+
+def test_unreadable_cache_file_disables_cache(tmp_path, monkeypatch, capsys):
+    path = tmp_path / 'parse_cache.sqlite3'
+    path.write_bytes(b'not a database' * 100)
+    monkeypatch.setattr(ats_parser, 'ParseCache', lambda version: ParseCache(version, str(path)))
+    assert ATSParser().cache is None
+    assert 'Warning: Could not open parse cache' in capsys.readouterr().out
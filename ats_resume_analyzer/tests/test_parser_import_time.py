@@ -0,0 +1,17 @@
+"""Importing ats_parser stays cheap: NLTK and the text extractors are loaded on first use."""
+import os
+
+from import_timing import import_times, loaded_packages
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time allowed for ats_parser; importing NLTK alone takes over a second
+IMPORT_BUDGET_SECONDS = 0.25
+LAZY_PACKAGES = {'nltk', 'pdfminer', 'docx2txt'}
+
+
+def test_import_does_not_load_nltk_or_text_extractors():
+    assert not loaded_packages(import_times('ats_parser', PACKAGE_DIR)) & LAZY_PACKAGES
+
+
+def test_import_time_within_budget():
+    assert import_times('ats_parser', PACKAGE_DIR)['ats_parser'] < IMPORT_BUDGET_SECONDS
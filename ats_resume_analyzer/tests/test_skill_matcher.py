@@ -0,0 +1,73 @@
+"""SkillMatcher against a brute-force word-boundary matcher on randomized text."""
+import random
+import re
+
+import pytest
+
+from skill_matcher import SkillMatcher
+from skills_library import SOFT_SKILLS, TECHNICAL_SKILLS
+
+# Skills whose edges are symbols, single letters or prefixes of other skills
+TRICKY_SKILLS = {
+    'languages': ['C', 'C++', 'C#', 'F#', '.NET', 'ASP.NET', 'R', 'Go', 'Node.js', 'Vue.js'],
+    'tools': ['CI/CD', 'Git', 'GitHub', 'A/B Testing', 'Machine Learning', 'Learning'],
+}
+FILLER = ['and', 'with', 'using', 'Google', 'React', 'Rust', 'cargo', 'net', 'dotnet', 'c', 'go-to', 'r&d']
+SEPARATORS = [' ', ' ', ', ', '. ', '\n', '/', '-', '(', ')', '', '_', '+', '#', '.']
+
+
+def brute_force_find(patterns, text_lower):
+    """(pattern_id, start) of every occurrence of each pattern that is not part of a longer word."""
+    matches = []
+    for pattern_id, pattern in enumerate(patterns):
+        # Boundaries only apply on the sides of a skill that end in a word character
+        before = r'(?<!\w)' if re.match(r'\w', pattern[0]) else ''
+        after = r'(?!\w)' if re.match(r'\w', pattern[-1]) else ''
+        # A single letter followed by '+' or '#' is part of another language, as in 'C++' or 'C#'
+        if len(pattern) == 1 and after:
+            after = r'(?![\w+#])'
+        # Lookahead so overlapping occurrences are all found
+        regex = re.compile(f'(?=({before}{re.escape(pattern)}{after}))')
+        matches.extend((pattern_id, match.start()) for match in regex.finditer(text_lower))
+    return matches
+
+
+def random_text(rng, skills, words):
+    parts = []
+    for _ in range(rng.randint(1, 60)):
+        word = rng.choice(skills) if rng.random() < 0.5 else rng.choice(words)
+        if rng.random() < 0.3:
+            word = word.upper() if rng.random() < 0.5 else word.lower()
+        parts.append(word + rng.choice(SEPARATORS))
+    return ''.join(parts)
+
+
+@pytest.mark.parametrize('technical_skills, soft_skills', [
+    (TRICKY_SKILLS, {}),
+    (TECHNICAL_SKILLS, SOFT_SKILLS),
+])
+def test_matches_brute_force(technical_skills, soft_skills):
+    matcher = SkillMatcher(technical_skills, soft_skills)
+    skills = [skill for library in (technical_skills, soft_skills)
+              for group in library.values() for skill in group]
+    rng = random.Random(11)
+    for _ in range(500):
+        text_lower = random_text(rng, skills, FILLER).lower()
+        assert sorted(matcher.find_all(text_lower)) == sorted(brute_force_find(matcher.patterns, text_lower)), text_lower
+
+
+@pytest.mark.parametrize('text, found', [
+    ('Python, C++ and C# on .NET', ['C++', 'C#', '.NET']),
+    ('c++/c#', ['C++', 'C#']),
+    ('C, C++ and C#', ['C', 'C++', 'C#']),
+    ('C/C++', ['C', 'C++']),
+    ('F#', ['F#']),
+    ('ASP.NET Core', ['.NET', 'ASP.NET']),
+    ('Used Google, React and Rust', []),
+    ('dotnet and cnet', []),
+    ('R&D in R', ['R']),
+    ('CI/CD with Git on GitHub', ['CI/CD', 'Git', 'GitHub']),
+])
+def test_symbol_skills(text, found):
+    assert SkillMatcher(TRICKY_SKILLS, {}).extract(text)['technical'] == [
+        skill for skill in TRICKY_SKILLS['languages'] + TRICKY_SKILLS['tools'] if skill in found]
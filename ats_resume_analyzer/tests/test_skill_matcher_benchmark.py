@@ -0,0 +1,28 @@
+"""
+Speed of SkillMatcher against one regex search per skill over a resume-sized text.
+Needs pytest-benchmark (pip install -r requirements-dev.txt): python -m pytest tests/test_skill_matcher_benchmark.py
+"""
+import random
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from skill_matcher import SkillMatcher
+from skills_library import SOFT_SKILLS, TECHNICAL_SKILLS
+from test_skill_matcher import FILLER, brute_force_find, random_text
+
+SKILLS = [skill for library in (TECHNICAL_SKILLS, SOFT_SKILLS) for group in library.values() for skill in group]
+TEXT = random_text(random.Random(0), SKILLS + FILLER * 10, FILLER).lower() * 20
+
+
+@pytest.mark.benchmark(group='skills')
+def test_skill_matcher(benchmark):
+    matcher = SkillMatcher()
+    benchmark(matcher.find_all, TEXT)
+
+
+@pytest.mark.benchmark(group='skills')
+def test_brute_force(benchmark):
+    patterns = SkillMatcher().patterns
+    benchmark(brute_force_find, patterns, TEXT)
@@ -0,0 +1,23 @@
+"""Import time measurement shared by the job_scraper and ats_resume_analyzer tests."""
+import subprocess
+import sys
+
+
+def import_times(module, cwd):
+    """Import module in a fresh interpreter run in cwd; returns {imported module: cumulative seconds}"""
+    command = [sys.executable, '-X', 'importtime', '-c', f'import {module}']
+    # The first run compiles the .pyc files, so only the second one is timed
+    subprocess.run(command, cwd=cwd, check=True, capture_output=True)
+    result = subprocess.run(command, cwd=cwd, check=True, capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def loaded_packages(times):
+    """Top-level packages among the modules in an import_times result"""
+    return {name.split('.')[0] for name in times}
@@ -0,0 +1,91 @@
+"""Resumable pagination checkpoints for scraper runs."""
+import hashlib
+import json
+import os
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.expanduser('~'), '.job_scraper', 'checkpoints')
+
+
+class ScrapeCheckpoint:
+    """
+    Progress of one scrape, identified by its source and search parameters.
+
+    Holds the last completed result page, the job URLs already seen, the job
+    cards collected from finished pages and the jobs stored so far. The
+    state is written to a JSON file after every change so an interrupted run
+    can continue where it stopped.
+    """
+
+    def __init__(self, source, search_params, directory=DEFAULT_CHECKPOINT_DIR):
+        self.source = source
+        self.search_params = search_params
+        key = hashlib.sha1(self._params_key(search_params).encode('utf-8')).hexdigest()
+        self.path = os.path.join(directory, f"{source.lower()}_{key[:16]}.json")
+        self.last_completed_page = -1
+        self.processed_urls = set()
+        self.job_cards = []
+        self.jobs = []
+
+    @staticmethod
+    def _params_key(search_params):
+        return json.dumps(search_params, sort_keys=True, default=str)
+
+    @property
+    def next_page(self):
+        """Index of the first result page that has not been completed"""
+        return self.last_completed_page + 1
+
+    def load(self):
+        """Load saved progress for this scrape. Returns True if a checkpoint was found."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read checkpoint {self.path}: {str(e)}")
+            return False
+        if not isinstance(state, dict) or state.get('source') != self.source or \
+                self._params_key(state.get('search_params')) != self._params_key(self.search_params):
+            print(f"Warning: Ignoring checkpoint {self.path}, which was saved for a different search")
+            return False
+
+        self.last_completed_page = state.get('last_completed_page', -1)
+        self.processed_urls = set(state.get('processed_urls', []))
+        self.job_cards = state.get('job_cards', [])
+        self.jobs = state.get('jobs', [])
+        return True
+
+    def save(self):
+        """Write the current progress atomically"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        state = {
+            'source': self.source,
+            'search_params': self.search_params,
+            'last_completed_page': self.last_completed_page,
+            'processed_urls': sorted(self.processed_urls),
+            'job_cards': self.job_cards,
+            'jobs': self.jobs,
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)
+
+    def complete_page(self, page):
+        """Mark a result page as finished and save"""
+        self.last_completed_page = page
+        self.save()
+
+    def add_job(self, job):
+        """Record a stored job and save. Returns the job."""
+        self.jobs.append(job)
+        self.save()
+        return job
+
+    def clear(self):
+        """Delete the checkpoint once the scrape has finished"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,171 @@
+"""Pool of warm browser sessions shared across scrapers, sources and runs."""
+import threading
+import time
+
+
+class PooledDriver:
+    """A browser session owned by a DriverPool, with its usage counters"""
+
+    def __init__(self, driver, pid, overflow=False):
+        self.driver = driver
+        self.pid = pid
+        self.overflow = overflow  # Created past the pool size; quit on release
+        self.pages = 0
+        self.leases = 0
+        self.created_at = time.time()
+
+    def record_page(self):
+        """Count a page load against this session's recycle limit"""
+        self.pages += 1
+
+
+class DriverPool:
+    """
+    Keeps up to size browser sessions alive between scraper runs and leases them out.
+
+    factory() must return (driver, pid) for a new session and is_alive(pid)
+    reports whether its process still exists. Idle sessions are health-checked
+    before each lease and reset when they are returned. A session is recycled
+    once it has loaded max_pages pages or its processes use more than
+    max_memory_mb. Leases beyond size get a temporary session that is quit on
+    release instead of blocking.
+    """
+
+    def __init__(self, factory, is_alive=None, size=2, max_pages=200, max_memory_mb=1500):
+        self._factory = factory
+        self._is_alive = is_alive
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._idle = []
+        self._leased = {}  # id(driver) -> leased PooledDriver
+        self._pending = 0  # Sessions being started for a lease
+        self._lock = threading.Lock()
+
+    def warm(self, count=None):
+        """Start idle sessions until count (default: size) are ready"""
+        count = min(self.size if count is None else count, self.size)
+        while True:
+            with self._lock:
+                if len(self._idle) + len(self._leased) + self._pending >= self.size or len(self._idle) >= count:
+                    return
+            entry = self._new_session()
+            with self._lock:
+                self._idle.append(entry)
+
+    def acquire(self):
+        """Lease a healthy session, starting a new one if none are idle"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    overflow = len(self._leased) + self._pending >= self.size
+                    self._pending += 1
+                    break
+                entry = self._idle.pop()
+            if self._is_healthy(entry):
+                return self._lease(entry)
+            self._destroy(entry)
+
+        try:
+            entry = self._new_session(overflow=overflow)
+        finally:
+            with self._lock:
+                self._pending -= 1
+        return self._lease(entry)
+
+    def _lease(self, entry):
+        with self._lock:
+            self._leased[id(entry.driver)] = entry
+        entry.leases += 1
+        return entry
+
+    def record_page(self, driver):
+        """Count a page load for a leased driver; drivers not from this pool are ignored"""
+        entry = self._leased.get(id(driver))
+        if entry is not None:
+            entry.record_page()
+
+    def release(self, entry):
+        """Return a leased session, resetting it for the next lease or recycling it"""
+        with self._lock:
+            self._leased.pop(id(entry.driver), None)
+
+        if entry.overflow or self._needs_recycle(entry) or not self._reset(entry):
+            self._destroy(entry)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(entry)
+                return
+        self._destroy(entry)
+
+    def close(self):
+        """Quit all idle sessions; leased sessions are quit when released"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self.size = 0
+        for entry in idle:
+            self._destroy(entry)
+
+    def _new_session(self, overflow=False):
+        driver, pid = self._factory()
+        return PooledDriver(driver, pid, overflow=overflow)
+
+    def _is_healthy(self, entry):
+        """Check that the browser process exists and the session still responds"""
+        if self._is_alive and entry.pid and not self._is_alive(entry.pid):
+            return False
+        try:
+            entry.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _memory_mb(self, entry):
+        """Resident memory of the session's driver and browser processes, if measurable"""
+        if not entry.pid:
+            return None
+        try:
+            import psutil
+            process = psutil.Process(entry.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+    def _needs_recycle(self, entry):
+        if entry.pages >= self.max_pages:
+            return True
+        memory = self._memory_mb(entry)
+        return memory is not None and memory > self.max_memory_mb
+
+    @staticmethod
+    def _reset(entry):
+        """Clear browsing state left by the previous lease. Returns False if the session is unusable."""
+        driver = entry.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # Storage is not accessible on every page
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _destroy(entry):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,74 @@
+"""
+BeautifulSoup parsing of result and job pages with a selectable backend.
+
+Indeed pages are parsed with a SoupStrainer, so only the job cards or the
+job description and pay sections are built into a tree instead of the whole
+page, and the full page is parsed only when those sections are not found.
+"""
+import importlib.util
+
+# BeautifulSoup tree builders, fastest first; lxml is in requirements.txt, html.parser is always there
+HTML_PARSERS = ('lxml', 'html.parser')
+
+INDEED_CARD_CLASSES = ['job_seen_beacon', 'jobsearch-ResultsList', 'tapItem']
+# Sections of an Indeed job page that hold the description and the Pay header with its value
+INDEED_DETAIL_IDS = ['jobDescriptionText', 'jobDetailsSection', 'salaryInfoAndJobType']
+# A Pay header anywhere in the page, e.g. <h3>Pay</h3>
+INDEED_PAY_MARKER = '>Pay<'
+
+
+def available_parsers():
+    """The backends in HTML_PARSERS that are installed"""
+    return [parser for parser in HTML_PARSERS
+            if parser == 'html.parser' or importlib.util.find_spec(parser) is not None]
+
+
+def default_parser():
+    return available_parsers()[0]
+
+
+def parse_html(html, parser=None, parse_only=None):
+    """BeautifulSoup of html with the given backend (default: the fastest installed one)"""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, parser or default_parser(), parse_only=parse_only)
+
+
+def _has_card_class(value):
+    # The strainer sees the raw class attribute, e.g. 'cardOutline tapItem', not the split class list
+    classes = value.split() if isinstance(value, str) else value or []
+    return any(name in INDEED_CARD_CLASSES for name in classes)
+
+
+def indeed_cards_strainer():
+    from bs4 import SoupStrainer
+    return SoupStrainer('div', class_=_has_card_class)
+
+
+def indeed_detail_strainer():
+    from bs4 import SoupStrainer
+    return SoupStrainer('div', id=INDEED_DETAIL_IDS)
+
+
+def parse_indeed_results(html, parser=None, strained=True):
+    """The job cards of an Indeed results page, as Tags"""
+    if strained:
+        soup = parse_html(html, parser, parse_only=indeed_cards_strainer())
+    else:
+        soup = parse_html(html, parser)
+    return soup.find_all('div', {'class': INDEED_CARD_CLASSES})
+
+
+def parse_indeed_detail(html, parser=None, strained=True):
+    """
+    Soup of an Indeed job page for JobScraper.extract_job_details.
+    With strained=True only the description and pay sections are parsed; the
+    whole page is parsed instead if the description is missing (the summary
+    then comes from section headers anywhere in the page) or if the page has
+    a Pay header outside those sections.
+    """
+    if strained:
+        soup = parse_html(html, parser, parse_only=indeed_detail_strainer())
+        if soup.find('div', {'id': 'jobDescriptionText'}) and (
+                INDEED_PAY_MARKER not in html or soup.find('h3', string='Pay')):
+            return soup
+    return parse_html(html, parser)
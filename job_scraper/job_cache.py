@@ -0,0 +1,122 @@
+"""Persistent on-disk cache of parsed job postings, keyed by normalized URL."""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.job_scraper', 'job_cache.sqlite3')
+
+# Query parameters that only track clicks and never identify a posting
+TRACKING_PARAMS = {
+    'from', 'tk', 'vjs', 'advn', 'adid', 'sjdu', 'acatk', 'pub', 'camk',
+    'xkcb', 'xpse', 'refid', 'trackingid', 'trk', 'ebp',
+}
+
+
+def normalize_job_url(url):
+    """
+    Reduce a job URL to a stable cache key.
+    Indeed and LinkedIn postings are keyed by their job ID so the same posting
+    reached through different tracking links maps to one entry.
+    """
+    parsed = urllib.parse.urlsplit(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urllib.parse.parse_qs(parsed.query)
+
+    if host.endswith('indeed.com') and query.get('jk'):
+        return f"indeed.com/viewjob?jk={query['jk'][0]}"
+
+    if host.endswith('linkedin.com'):
+        if match := re.search(r'/jobs/view/(?:[^/]*-)?(\d+)', parsed.path):
+            return f"linkedin.com/jobs/view/{match.group(1)}"
+        if query.get('currentJobId'):
+            return f"linkedin.com/jobs/view/{query['currentJobId'][0]}"
+
+    kept = sorted(
+        (key, value) for key, values in query.items()
+        if key.lower() not in TRACKING_PARAMS and not key.startswith('utm_')
+        for value in values
+    )
+    key = f"{host}{parsed.path.rstrip('/')}"
+    if kept:
+        key += '?' + urllib.parse.urlencode(kept)
+    return key
+
+
+class JobCache:
+    """
+    SQLite-backed cache of parsed job details.
+    Entries older than ttl_hours are treated as misses, and the least recently
+    used entries are evicted once the cache holds more than max_entries.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_hours=24, max_entries=5000):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'url TEXT PRIMARY KEY, '
+                'record TEXT NOT NULL, '
+                'fetched_at REAL NOT NULL, '
+                'accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_accessed_at ON jobs (accessed_at)')
+
+    def get(self, url):
+        """Return the cached record for url if it is younger than the TTL, else None"""
+        key = normalize_job_url(url)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT record, fetched_at FROM jobs WHERE url = ?', (key,)
+            ).fetchone()
+            if not row or now - row[1] > self.ttl_seconds:
+                return None
+            self._conn.execute('UPDATE jobs SET accessed_at = ? WHERE url = ?', (now, key))
+        return json.loads(row[0])
+
+    def put(self, url, record):
+        """Store a parsed record for url and evict old entries if over capacity"""
+        key = normalize_job_url(url)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO jobs (url, record, fetched_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(record), now, now)
+            )
+            self._evict()
+
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries"""
+        count = self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                'DELETE FROM jobs WHERE url IN '
+                '(SELECT url FROM jobs ORDER BY accessed_at ASC LIMIT ?)',
+                (count - self.max_entries,)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
@@ -0,0 +1,128 @@
+"""Near-duplicate detection for jobs collected from several sources, using MinHash and LSH."""
+import re
+
+import numpy as np
+
+from job_cache import normalize_job_url
+
+# Columns added to merged records: every source and URL a posting was found under
+DEDUPE_COLUMNS = ['sources', 'urls']
+
+_HASH_MASK = 0xFFFFFFFF
+
+
+def _shingles(text, size=3):
+    """
+    Word n-grams of the normalized text, hashed to 32-bit integers.
+    Python's hash is salted per process, so signatures are only comparable within one run.
+    """
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < size:
+        grams = [tuple(words)] if words else []
+    else:
+        grams = zip(*(words[i:] for i in range(size)))
+    return np.fromiter({hash(gram) & _HASH_MASK for gram in grams}, dtype=np.uint64)
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles.
+    The share of equal positions in two signatures estimates the Jaccard
+    similarity of the texts' shingle sets.
+    """
+
+    def __init__(self, num_perm=64, seed=1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        # Multiply-shift hashing: (a * x + b) mod 2**64, keeping the top 32 bits; a must be odd
+        self._a = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, texts, chunk_size=1000):
+        """
+        Signature matrix with one row per text, computed for many texts at once.
+        Also returns a mask of the texts that had any words; rows of empty texts are meaningless.
+        """
+        signatures = np.zeros((len(texts), self.num_perm), dtype=np.uint32)
+        has_words = np.zeros(len(texts), dtype=bool)
+        for chunk_start in range(0, len(texts), chunk_size):
+            shingle_sets = [_shingles(text) for text in texts[chunk_start:chunk_start + chunk_size]]
+            sizes = np.array([hashes.size for hashes in shingle_sets])
+            rows = np.flatnonzero(sizes) + chunk_start
+            if not rows.size:
+                continue
+            hashes = np.concatenate(shingle_sets)
+            permuted = (self._a[:, None] * hashes + self._b[:, None]) >> np.uint64(32)
+            offsets = np.concatenate(([0], np.cumsum(sizes[sizes > 0])[:-1]))
+            signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=1).T
+            has_words[rows] = True
+        return signatures, has_words
+
+
+def _job_text(job):
+    return ' '.join(str(job.get(field) or '') for field in ('title', 'company', 'summary'))
+
+
+def find_duplicate_groups(jobs, threshold=0.7, num_perm=64, bands=16):
+    """
+    Group jobs that are the same posting.
+    Jobs with the same normalized URL are always grouped. Otherwise LSH banding
+    over MinHash signatures of title, company and summary proposes candidates,
+    which are grouped if their estimated similarity reaches threshold. Each
+    candidate is only compared with the first job in its bucket, so the cost
+    stays linear in the number of jobs.
+    Returns lists of job indexes, in input order.
+    """
+    parent = list(range(len(jobs)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(first, second):
+        first, second = find(first), find(second)
+        if first != second:
+            parent[max(first, second)] = min(first, second)
+
+    first_by_url = {}
+    for index, job in enumerate(jobs):
+        if job.get('url'):
+            union(first_by_url.setdefault(normalize_job_url(job['url']), index), index)
+
+    signatures, has_words = MinHasher(num_perm=num_perm).signatures([_job_text(job) for job in jobs])
+    indexes = np.flatnonzero(has_words)
+    rows = num_perm // bands
+    for band in range(bands):
+        band_keys = np.ascontiguousarray(signatures[indexes, band * rows:(band + 1) * rows])
+        band_keys = band_keys.view(np.dtype((np.void, band_keys.dtype.itemsize * rows))).ravel()
+        _, first_in_bucket, bucket = np.unique(band_keys, return_index=True, return_inverse=True)
+        firsts = indexes[first_in_bucket[bucket]]
+        candidates = firsts != indexes
+        pairs_first, pairs_other = firsts[candidates], indexes[candidates]
+        similarity = (signatures[pairs_first] == signatures[pairs_other]).mean(axis=1)
+        for first, other in zip(pairs_first[similarity >= threshold], pairs_other[similarity >= threshold]):
+            union(int(first), int(other))
+
+    groups = {}
+    for index in range(len(jobs)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+def dedupe_jobs(jobs, threshold=0.7):
+    """
+    Merge near-duplicate jobs into one record per posting.
+    The record with a salary and the longest summary is kept, and its
+    'sources' and 'urls' list every source and URL the posting was found under.
+    """
+    merged = []
+    for group in find_duplicate_groups(jobs, threshold=threshold):
+        records = [jobs[index] for index in group]
+        best = max(records, key=lambda job: (job.get('salary_value') is not None, len(job.get('summary') or '')))
+        record = dict(best)
+        record['sources'] = ', '.join(dict.fromkeys(job.get('source') for job in records if job.get('source')))
+        record['urls'] = ' '.join(dict.fromkeys(job['url'] for job in records if job.get('url')))
+        merged.append(record)
+    return merged
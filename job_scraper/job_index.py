@@ -0,0 +1,199 @@
+"""Persistent full-text index of every scraped job, searchable without a new scrape."""
+import datetime
+import os
+import re
+import sqlite3
+import threading
+
+from job_cache import normalize_job_url
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.job_scraper', 'job_index.sqlite3')
+
+INDEX_COLUMNS = [
+    'title', 'company', 'summary', 'salary_text', 'salary_value', 'rating',
+    'match_score', 'source', 'url', 'first_seen', 'last_seen'
+]
+
+
+# Bump when the indexed text changes; older indexes are rebuilt on open
+SCHEMA_VERSION = 1
+
+# Skills that the unicode61 tokenizer would cut down to a single letter or a common word
+SYMBOL_TOKENS = {'c++': 'cplusplus', 'c#': 'csharp', 'f#': 'fsharp', '.net': 'dotnet'}
+_SYMBOL_TOKEN_PATTERN = re.compile(r'(?<![\w.+#])(c\+\+|c#|f#|\.net)(?![\w+#])', re.IGNORECASE)
+
+
+def _fts_text(text):
+    """Text as it is indexed and queried, with symbol skills such as C++ and C# spelled as words"""
+    if text is None:
+        return None
+    return _SYMBOL_TOKEN_PATTERN.sub(lambda match: SYMBOL_TOKENS[match.group(1).lower()], str(text))
+
+
+def _fts_phrase(text):
+    """Quote the words of text as one FTS5 phrase so user input is never parsed as query syntax"""
+    words = re.findall(r'\w+', _fts_text(text).lower())
+    return '"' + ' '.join(words) + '"' if words else None
+
+
+class JobIndex:
+    """
+    SQLite FTS5 index over all jobs ever scraped.
+
+    Jobs are keyed by normalized URL, so scraping a posting again updates its
+    entry and last_seen date instead of adding a duplicate. Title, company and
+    summary are full-text indexed, with C++, C#, F# and .NET indexed as
+    words of their own so they can be searched for; salary, source and dates are plain indexed
+    columns for range filters.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function('fts_text', 1, _fts_text, deterministic=True)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            rebuild = self._conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION
+            if rebuild:
+                # Indexes from before SCHEMA_VERSION hold the raw text; drop them and index it again below
+                self._conn.executescript('''
+                    DROP TRIGGER IF EXISTS jobs_ai;
+                    DROP TRIGGER IF EXISTS jobs_ad;
+                    DROP TRIGGER IF EXISTS jobs_au;
+                    DROP TABLE IF EXISTS jobs_fts;
+                ''')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id INTEGER PRIMARY KEY, '
+                'url_key TEXT UNIQUE NOT NULL, '
+                'title TEXT, company TEXT, summary TEXT, salary_text TEXT, '
+                'salary_value REAL, rating INTEGER, match_score REAL, source TEXT, url TEXT, '
+                'first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_salary_value ON jobs (salary_value)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen)')
+            # External-content FTS table kept in sync with jobs by triggers. It indexes
+            # fts_text() of the columns rather than the columns themselves, so only
+            # MATCH and bm25() are used on it; its column values are read from jobs
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+                "title, company, summary, content='jobs', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            self._conn.executescript('''
+                CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts (rowid, title, company, summary)
+                    VALUES (new.id, fts_text(new.title), fts_text(new.company), fts_text(new.summary));
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, summary)
+                    VALUES ('delete', old.id, fts_text(old.title), fts_text(old.company), fts_text(old.summary));
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, summary)
+                    VALUES ('delete', old.id, fts_text(old.title), fts_text(old.company), fts_text(old.summary));
+                    INSERT INTO jobs_fts (rowid, title, company, summary)
+                    VALUES (new.id, fts_text(new.title), fts_text(new.company), fts_text(new.summary));
+                END;
+            ''')
+            if rebuild:
+                self._conn.execute(
+                    'INSERT INTO jobs_fts (rowid, title, company, summary) '
+                    'SELECT id, fts_text(title), fts_text(company), fts_text(summary) FROM jobs'
+                )
+                self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def add(self, job):
+        """Add or update one job"""
+        self.add_many([job])
+
+    def add_many(self, jobs):
+        """Add or update several jobs in one transaction"""
+        today = datetime.date.today().isoformat()
+        rows = [
+            (
+                normalize_job_url(job['url']), job.get('title'), job.get('company'), job.get('summary'),
+                job.get('salary_text'), job.get('salary_value'), job.get('rating'),
+                job.get('match_score'), job.get('source'), job['url'], today, today
+            )
+            for job in jobs if job.get('url')
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO jobs (url_key, title, company, summary, salary_text, salary_value, rating, '
+                'match_score, source, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (url_key) DO UPDATE SET '
+                'title = excluded.title, company = excluded.company, summary = excluded.summary, '
+                'salary_text = excluded.salary_text, salary_value = excluded.salary_value, '
+                'rating = excluded.rating, match_score = excluded.match_score, '
+                'source = excluded.source, url = excluded.url, last_seen = excluded.last_seen',
+                rows
+            )
+
+    def search(self, keywords=None, skills=None, min_salary=None, max_salary=None,
+               source=None, since=None, limit=200):
+        """
+        Find indexed jobs.
+        keywords must all appear in the title, company or summary, and each of
+        skills must appear as a phrase. Salary bounds are inclusive, since is
+        an ISO date compared with last_seen. Full-text matches are ordered by
+        relevance, other queries by most recently seen.
+        Returns a list of job dicts.
+        """
+        terms = []
+        if keywords:
+            # Split on whitespace only, so 'C++' stays one keyword
+            terms.extend(filter(None, (_fts_phrase(word) for word in keywords.split())))
+        for skill in skills or []:
+            if phrase := _fts_phrase(skill):
+                terms.append(phrase)
+
+        conditions = []
+        params = []
+        if terms:
+            conditions.append('jobs_fts MATCH ?')
+            params.append(' AND '.join(terms))
+        if min_salary is not None:
+            conditions.append('jobs.salary_value >= ?')
+            params.append(min_salary)
+        if max_salary is not None:
+            conditions.append('jobs.salary_value <= ?')
+            params.append(max_salary)
+        if source:
+            conditions.append('jobs.source = ?')
+            params.append(source)
+        if since:
+            conditions.append('jobs.last_seen >= ?')
+            params.append(since)
+
+        columns = ', '.join(f'jobs.{column}' for column in INDEX_COLUMNS)
+        if terms:
+            query = f'SELECT {columns} FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid'
+            order = 'ORDER BY bm25(jobs_fts)'
+        else:
+            query = f'SELECT {columns} FROM jobs'
+            order = 'ORDER BY jobs.last_seen DESC, jobs.id DESC'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += f' {order} LIMIT ?'
+        params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
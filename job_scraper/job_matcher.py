@@ -0,0 +1,65 @@
+"""Score scraped jobs against a resume by the skills they have in common."""
+import os
+import sys
+
+import numpy as np
+from scipy import sparse
+
+# The resume parser and skills library live in the sibling ats_resume_analyzer folder
+ATS_ANALYZER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ats_resume_analyzer')
+if ATS_ANALYZER_DIR not in sys.path:
+    sys.path.append(ATS_ANALYZER_DIR)
+
+from ats_parser import ATSParser
+
+
+class JobMatcher:
+    """
+    Match job descriptions against one resume.
+
+    The resume is parsed once with ATSParser. Skills are found in each job
+    description with the same skills library, and every job is scored in one
+    sparse matrix product as the cosine similarity (0-100) between its skills
+    and the resume's.
+    """
+
+    def __init__(self, resume_path, parser=None):
+        self.parser = parser or ATSParser()
+        self.skill_matcher = self.parser.skill_matcher
+        self.pattern_count = len(self.skill_matcher.patterns)
+
+        skills = self.parser.parse_resume(resume_path)['skills']
+        self.resume_skills = skills['technical'] + skills['soft']
+        pattern_ids = {pattern: index for index, pattern in enumerate(self.skill_matcher.patterns)}
+        resume_ids = sorted({pattern_ids[skill.lower()] for skill in self.resume_skills})
+        self._resume_vector = np.zeros(self.pattern_count)
+        self._resume_vector[resume_ids] = 1.0
+        self._resume_norm = np.sqrt(len(resume_ids))
+
+    def skill_matrix(self, texts):
+        """Binary jobs x skills matrix of the skills found in each text"""
+        rows = []
+        cols = []
+        for row, text in enumerate(texts):
+            pattern_ids = {pattern_id for pattern_id, _ in self.skill_matcher.find_all(str(text or '').lower())}
+            rows.extend([row] * len(pattern_ids))
+            cols.extend(pattern_ids)
+        data = np.ones(len(rows))
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(texts), self.pattern_count))
+
+    def score_jobs(self, texts):
+        """Return a 0-100 match score per text; texts without any known skill score 0"""
+        texts = list(texts)
+        if not texts or not self._resume_norm:
+            return np.zeros(len(texts))
+
+        matrix = self.skill_matrix(texts)
+        overlap = matrix @ self._resume_vector
+        job_norms = np.sqrt(np.asarray(matrix.sum(axis=1)).ravel())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(job_norms > 0, overlap / (job_norms * self._resume_norm), 0.0)
+        return np.round(scores * 100, 1)
+
+    def score_job(self, text):
+        """Match score for a single job description"""
+        return float(self.score_jobs([text])[0])
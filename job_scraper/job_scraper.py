@@ -1,63 +1,257 @@
-import pandas as pd
+# pandas, numpy, requests, BeautifulSoup, selenium and undetected_chromedriver are
+# imported where they are first needed, so importing this module stays cheap
 import re
 import time
 import random
-from fake_useragent import UserAgent
 import urllib.parse
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
 import os
 import datetime
 import atexit
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from job_cache import JobCache
+from job_index import JobIndex
+from result_writer import ResultWriter, RESULT_COLUMNS, check_format
+from checkpoints import ScrapeCheckpoint
+from driver_pool import DriverPool
+from progress import ProgressReporter
+from perf import RunProfiler, timed
+from html_parsing import parse_html, parse_indeed_results, parse_indeed_detail
 
 import argparse
 import logging
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    '-d', '--debug', 
-    help="Print lots of debugging statements",
-    action="store_const", 
-    dest="loglevel", 
-    const=logging.DEBUG, 
-    default=logging.INFO
+# Text that shows up on bot-check pages instead of the real job posting
+CHALLENGE_MARKERS = (
+    'just a moment...',
+    'challenge-platform',
+    'cf-chl',
+    'captcha',
+    'additional verification required',
 )
-parser.add_argument(
-    "-o", "--output", 
-    action='store', 
-    nargs='?',
-    type=argparse.FileType('w'), 
-    dest='output',
-    help="Directs the output to a name of your choice"
-)
-parser.add_argument(
-    '-v', '--verbose',
-    help="Be verbose",
-    action="store_const", 
-    dest="loglevel", 
-    const=logging.DEBUG,
+
+# Elements that signal a page is ready to be parsed, as (By, value) locators
+INDEED_RESULTS_READY = ('css selector', '#mosaic-provider-jobcards, .job_seen_beacon, .jobsearch-NoResult-messageContainer')
+INDEED_DETAIL_READY = ('id', 'jobDescriptionText')
+LINKEDIN_RESULTS_READY = ('css selector', '.jobs-search-results-list, .jobs-search-results__list, .jobs-search__results-list, .scaffold-layout__list')
+LINKEDIN_DETAILS_READY = ('css selector', '.jobs-description__content, .jobs-description, .jobs-details__main-content')
+LINKEDIN_CARDS = ".job-card-container, .jobs-search-results__list-item, .job-card-container--clickable"
+
+# LinkedIn pages are read from one HTML snapshot per step and parsed locally,
+# instead of one WebDriver round-trip per element
+LINKEDIN_CARD_TITLE = ".job-card-list__title, .jobs-search-results__list-item-title, .job-card-list__title--link"
+LINKEDIN_CARD_COMPANY = ".job-card-container__company-name, .job-card-container__primary-description, .artdeco-entity-lockup__caption"
+LINKEDIN_DETAILS_PANE = ".jobs-search__job-details, .scaffold-layout__detail, .jobs-details"
+LINKEDIN_DESCRIPTION_SELECTORS = [".jobs-description__content", ".jobs-description", ".jobs-details__main-content"]
+LINKEDIN_SALARY_SELECTORS = [
+    ".salary-range",
+    ".compensation",
+    ".job-details-jobs-unified-top-card__job-insight",
+    "div[class*='job-details-preferences-and-skills__pill'][role*='presentation']",
+]
+LINKEDIN_TOP_CARD_TITLE = ".job-details-jobs-unified-top-card__job-title, .jobs-unified-top-card__job-title"
+LINKEDIN_TOP_CARD_COMPANY = ".job-details-jobs-unified-top-card__company-name, .jobs-unified-top-card__company-name"
+# Scroll the card into view (LinkedIn only renders cards near the viewport) and click its title link
+LINKEDIN_CLICK_CARD_JS = """
+const card = document.querySelector(`[data-job-id="${arguments[0]}"], [data-occludable-job-id="${arguments[0]}"]`);
+if (!card) return false;
+card.scrollIntoView({block: 'center'});
+(card.querySelector('a.job-card-list__title, a.job-card-container__link, a') || card).click();
+return true;
+"""
+# Snapshot of the details pane once it shows the given job, otherwise null so the wait polls again.
+# LinkedIn updates the URL before the pane, so the pane's own job links and data-job-id
+# attributes must name the job too. Panes without them are returned with verified false
+# and the description text, for the caller to compare with the previous job's.
+LINKEDIN_DETAILS_SNAPSHOT_JS = """
+const jobId = arguments[0];
+if (jobId && !window.location.href.includes(jobId)) return null;
+const pane = document.querySelector(arguments[2]) || document.body;
+const description = pane.querySelector(arguments[1]);
+if (!description) return null;
+const owners = Array.from(pane.querySelectorAll('[data-job-id], a[href*="/jobs/view/"]'));
+const idPattern = new RegExp(`(^|[^0-9])${jobId}([^0-9]|$)`);
+const verified = Boolean(jobId) && owners.some(el => idPattern.test(
+    el.getAttribute('data-job-id') || (el.getAttribute('href') || '').split('/jobs/view/')[1] || ''));
+if (jobId && owners.length && !verified) return null;
+return {html: pane.outerHTML, verified: verified, description: description.innerText};
+"""
+
+# One pass over the text finds the amount or range, a K suffix per number and
+# the pay period, e.g. "$50K - $60K a year", "$25/hr" or "$4,000 per month"
+_SALARY_AMOUNT = r'(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)(k)?(?:/(yr|hr))?'
+SALARY_PATTERN = re.compile(
+    r'\$' + _SALARY_AMOUNT +
+    r'(?:\s*-\s*\$?' + _SALARY_AMOUNT + r')?'
+    r'(?:\s*(a year|annually|annual|/year|per year|/yr|yr'
+    r'|an hour|/hour|per hour|hourly|/hr|hr'
+    r'|a month|monthly|/month|per month))?',
+    re.IGNORECASE
 )
-args = parser.parse_args()    
-logging.basicConfig(filename='logname.txt',
-                    filemode='a',
-                    format='%(asctime)s,%(msecs)03d %(name)s %(levelname)s %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S',
-                    level= logging.INFO)
+SALARY_PERIODS = {
+    'a year': 'yearly', 'annually': 'yearly', 'annual': 'yearly', '/year': 'yearly',
+    'per year': 'yearly', '/yr': 'yearly', 'yr': 'yearly',
+    'an hour': 'hourly', '/hour': 'hourly', 'per hour': 'hourly', 'hourly': 'hourly',
+    '/hr': 'hourly', 'hr': 'hourly',
+    'a month': 'monthly', 'monthly': 'monthly', '/month': 'monthly', 'per month': 'monthly',
+}
+YEARLY_MULTIPLIERS = {'yearly': 1, 'hourly': 40 * 52, 'monthly': 12}  # 40-hour weeks
+
+def parse_salary(text):
+    """
+    Extract a yearly salary from text, or None if no salary is found.
+    Ranges are averaged, and a bare dollar amount only counts when it is part
+    of a range or followed by a pay period. Ranges without a period are yearly.
+    """
+    if not text:
+        return None
+    
+    for match in SALARY_PATTERN.finditer(text):
+        low, low_k, low_unit, high, high_k, high_unit, period_text = match.groups()
+        
+        unit = period_text or high_unit or low_unit
+        period = SALARY_PERIODS[unit.lower()] if unit else None
+        if high is None and period is None:
+            continue
+        
+        salary = float(low.replace(',', '')) * (1000 if low_k else 1)
+        if high is not None:
+            high_value = float(high.replace(',', '')) * (1000 if high_k else 1)
+            salary = (salary + high_value) / 2  # Average of range
+        
+        salary *= YEARLY_MULTIPLIERS[period or 'yearly']
+        logging.debug(f'Extracted salary: {salary} from {text}')
+        return salary
+    
+    return None
+
+@lru_cache(maxsize=32)
+def rating_thresholds(salary_range, top_percent, bottom_percent):
+    """
+    Compute the salary thresholds used to rate jobs.
+    Returns (top_threshold, bottom_buffer_low, bottom_buffer_high).
+    """
+    min_salary, max_salary = salary_range
+    span = max_salary - min_salary
+    
+    # Calculate thresholds using specified percentages
+    top_threshold = max_salary - (span * (top_percent / 100))
+    bottom_threshold = min_salary + (span * (bottom_percent / 100))
+    
+    # Calculate buffer zone around bottom threshold (10% up and down)
+    buffer_size = bottom_threshold * (bottom_percent / 100)
+    return top_threshold, bottom_threshold - buffer_size, bottom_threshold + buffer_size
+
+def extract_salaries(texts):
+    """Extract yearly salaries for many texts at once, parsing repeated texts only once"""
+    parsed = {}
+    return [
+        parsed[text] if text in parsed else parsed.setdefault(text, parse_salary(text))
+        for text in texts
+    ]
+
+def _element_text(element):
+    """Visible text of a parsed element, one line per block like WebElement.text"""
+    return '\n'.join(element.stripped_strings)
+
+def parse_linkedin_cards(html, parser=None):
+    """
+    Read the job cards from a snapshot of the LinkedIn results list.
+    Returns dicts with job_id, title and company in page order; title and
+    company are None for cards LinkedIn has not rendered yet.
+    """
+    soup = parse_html(html, parser)
+    cards = []
+    seen_ids = set()
+    for card in soup.select(LINKEDIN_CARDS):
+        # Cards are matched both as list items and as the container inside them
+        job_id = card.get('data-job-id') or card.get('data-occludable-job-id')
+        if not job_id and (inner := card.select_one('[data-job-id]')):
+            job_id = inner['data-job-id']
+        if not job_id or job_id in seen_ids:
+            continue
+        seen_ids.add(job_id)
+        title = card.select_one(LINKEDIN_CARD_TITLE)
+        company = card.select_one(LINKEDIN_CARD_COMPANY)
+        cards.append({
+            'job_id': job_id,
+            'title': _element_text(title).split('\n')[0] if title else None,
+            'company': _element_text(company) if company else None,
+        })
+    return cards
+
+def _has_own_text(tag, phrases):
+    """Whether any of tag's direct text nodes contains one of phrases (like XPath contains(text(), ...))"""
+    return any(phrase in text for text in tag.find_all(string=True, recursive=False) for phrase in phrases)
+
+def parse_linkedin_details(html, parser=None):
+    """
+    Read a snapshot of the LinkedIn details pane.
+    Returns a dict with summary, salary_text and the title and company from
+    the pane's top card, or None if no description was found.
+    """
+    soup = parse_html(html, parser)
+    description = None
+    for selector in LINKEDIN_DESCRIPTION_SELECTORS:
+        if description := soup.select_one(selector):
+            break
+    if description is None:
+        return None
+    
+    salary_text = None
+    for selector in LINKEDIN_SALARY_SELECTORS:
+        if (element := soup.select_one(selector)) is None:
+            continue
+        text = _element_text(element)
+        if text and any(i.isdigit() for i in text):
+            salary_text = text.split('Matches your job preferences')[0].strip()
+            break
+    
+    if salary_text is None:
+        # Salary pills and compensation paragraphs without a known class
+        fallbacks = [
+            lambda tag: (tag.name == 'div' and 'job-details-preferences-and-skills__pill' in ' '.join(tag.get('class', []))
+                         and _has_own_text(tag, ('yr', 'hr'))),
+            lambda tag: tag.name == 'p' and _has_own_text(tag, ('Compensation Range', '/yr', '/hr', 'per year')),
+        ]
+        for fallback in fallbacks:
+            if (element := soup.find(fallback)) is not None and (text := _element_text(element)):
+                salary_text = text
+                break
+    
+    title = soup.select_one(LINKEDIN_TOP_CARD_TITLE)
+    company = soup.select_one(LINKEDIN_TOP_CARD_COMPANY)
+    return {
+        'summary': _element_text(description),
+        'salary_text': salary_text,
+        'title': _element_text(title).split('\n')[0] if title else None,
+        'company': _element_text(company) if company else None,
+    }
 
 class JobScraper:
+    # undetected_chromedriver patches the chromedriver binary on launch, which
+    # is not safe to do from several threads at once
+    _driver_launch_lock = threading.Lock()
+    # Where run progress is saved; subclasses can keep it elsewhere
+    checkpoint_class = ScrapeCheckpoint
+
     def __init__(self, keywords=None, job_title=None, salary_range=None, resume=None, 
                  remote_only=True, location=None, distance=None, 
                  experience_levels=None, education_level=None,
                  include_no_salary=False, top_percent=10, bottom_percent=10,
-                 require_experience=False):
+                 require_experience=False, detail_workers=1, fetch_mode='http-first',
+                 use_cache=True, cache_ttl_hours=24, politeness_delay=(0.5, 1.5),
+                 output_format='csv', retain_jobs=True, resume_run=False,
+                 use_driver_pool=True, driver_pool_size=2, use_index=True, html_parser=None,
+                 prefilter_cards=True):
         self.keywords = keywords or []
         self.job_title = job_title
         self.salary_range = salary_range
-        self.resume = resume
+        self.resume = resume  # Path to a PDF/DOCX resume; jobs get a match_score against it
+        self._job_matcher = None
+        self._job_matcher_resume = None
         self.remote_only = remote_only
         self.location = location
         self.distance = distance  # Distance in miles
@@ -68,8 +262,52 @@ class JobScraper:
         self.top_percent = top_percent
         self.bottom_percent = bottom_percent
         self.require_experience = require_experience
+        # Number of browser workers used to fetch Indeed job detail pages
+        self.detail_workers = max(1, int(detail_workers or 1))
+        # 'http-first' tries a plain HTTP request before falling back to Chrome,
+        # 'browser' always renders job pages in Chrome
+        self.fetch_mode = fetch_mode
+        self.fetch_stats = {}  # Per-source HTTP hits vs. browser fallbacks
+        # Skip the job pages of Indeed cards whose salary snippet is already below the rating threshold
+        self.prefilter_cards = prefilter_cards
+        self._fetch_stats_lock = threading.Lock()
+        self._http_local = threading.local()
+        # Persistent cache of parsed job details, opened on first use
+        self.use_cache = use_cache
+        self.cache_ttl_hours = cache_ttl_hours
+        self._job_cache = None
+        # Searchable history of every job scraped, opened on first use
+        self.use_index = use_index
+        self._job_index = None
+        # Random (min, max) seconds to pause before each request; (0, 0) disables it
+        self.politeness_delay = politeness_delay
+        # BeautifulSoup backend for result and job pages ('lxml' or 'html.parser'); None picks the fastest installed
+        self.html_parser = html_parser
+        # Timing spans and counters for the current run, written as a JSON report next to the results
+        self.profiler = RunProfiler()
         self.jobs = []
-        self.user_agent = UserAgent()
+        # Results are streamed to '<Documents>/job_results_<date>_<source>.<output_format>'
+        # (csv, jsonl or parquet) as they are rated; retain_jobs=False keeps them out of memory
+        check_format(output_format)  # Fail here rather than once the first job is stored
+        self.output_format = output_format
+        self.retain_jobs = retain_jobs
+        self._writers = {}  # Open result writers per source
+        # Off for per-source scrapers in a multi-source run, whose jobs are merged and saved together
+        self.stream_results = True
+        # On for those per-source scrapers instead: their jobs still go to the source's '.part' file,
+        # so a crashed run keeps them, and the file is removed once the merged results are saved
+        self.stream_partial_results = False
+        self.job_count = 0  # Jobs processed this run, whether or not they are retained
+        # Continue from the last checkpoint of the same search instead of starting over
+        self.resume_run = resume_run
+        # Lease browsers from the shared warm pool instead of launching one per run
+        self.use_driver_pool = use_driver_pool
+        self.driver_pool_size = driver_pool_size
+        self._driver_lease = None
+        # Progress events and the cancel flag; replace with a reporter that has a callback to follow a run
+        self.progress = ProgressReporter()
+        self._user_agent = None
+        self._last_linkedin_description = None  # Description in the last LinkedIn details snapshot
         self.driver = None
         self.wait = None
         self._driver_shared = False
@@ -79,16 +317,18 @@ class JobScraper:
 
     def __del__(self):
         """Ensure driver is cleaned up when object is deleted, but only if not already cleaned up"""
-        if not self._is_cleaned_up:
+        # A scraper whose __init__ raised has no driver to clean up
+        if not getattr(self, '_is_cleaned_up', True):
             self.cleanup_driver()
 
-    def _is_driver_running(self):
-        """Check if the Chrome process is still running"""
-        if not self._driver_pid:
+    def _is_driver_running(self, pid=None):
+        """Check if the Chrome process (this scraper's, or the given pid) is still running"""
+        pid = pid or self._driver_pid
+        if not pid:
             return False
         try:
             import psutil
-            return psutil.pid_exists(self._driver_pid)
+            return psutil.pid_exists(pid)
         except (ImportError, Exception):
             return True  # Assume it's running if we can't check
 
@@ -138,7 +378,10 @@ class JobScraper:
             
         self._cleanup_lock = True
         try:
-            if self.driver and not self._driver_shared:
+            if self._driver_lease is not None:
+                self.release_driver()
+                self._is_cleaned_up = True
+            elif self.driver and not self._driver_shared:
                 # Only attempt cleanup if the driver process is still running
                 if self._is_driver_running():
                     try:
@@ -171,47 +414,60 @@ class JobScraper:
         finally:
             self._cleanup_lock = False
 
+    @classmethod
+    def _create_driver(cls):
+        """Launch a new undetected Chrome instance and return it with its process ID"""
+        import undetected_chromedriver as uc
+        options = uc.ChromeOptions()
+        options.add_argument('--start-maximized')
+        options.add_argument('--disable-popup-blocking')
+        options.add_argument('--disable-notifications')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--no-sandbox')
+        
+        # Add arguments to help with cleanup
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-breakpad')
+        options.add_argument('--disable-component-extensions-with-background-pages')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-features=TranslateUI')
+        options.add_argument('--disable-ipc-flooding-protection')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
+        options.add_argument('--force-color-profile=srgb')
+        options.add_argument('--metrics-recording-only')
+        options.add_argument('--no-first-run')
+        
+        with cls._driver_launch_lock:
+            driver = uc.Chrome(options=options)
+        
+        # Store the process ID for later cleanup
+        try:
+            driver_pid = driver.service.process.pid
+        except Exception:
+            try:
+                # Fallback to getting PID from service directly
+                driver_pid = driver.service.process.pid if driver.service.process else None
+            except Exception:
+                driver_pid = None
+            
+        driver.set_page_load_timeout(30)
+        return driver, driver_pid
+
     def setup_driver(self):
         """Set up undetected ChromeDriver with enhanced process tracking"""
+        from selenium.webdriver.support.ui import WebDriverWait
         try:
             if self.driver:
                 self.cleanup_driver()
                 
-            options = uc.ChromeOptions()
-            options.add_argument('--start-maximized')
-            options.add_argument('--disable-popup-blocking')
-            options.add_argument('--disable-notifications')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--no-sandbox')
-            
-            # Add arguments to help with cleanup
-            options.add_argument('--disable-background-networking')
-            options.add_argument('--disable-background-timer-throttling')
-            options.add_argument('--disable-backgrounding-occluded-windows')
-            options.add_argument('--disable-breakpad')
-            options.add_argument('--disable-component-extensions-with-background-pages')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-features=TranslateUI')
-            options.add_argument('--disable-ipc-flooding-protection')
-            options.add_argument('--disable-renderer-backgrounding')
-            options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
-            options.add_argument('--force-color-profile=srgb')
-            options.add_argument('--metrics-recording-only')
-            options.add_argument('--no-first-run')
-            
-            self.driver = uc.Chrome(options=options)
-            
-            # Store the process ID for later cleanup
-            try:
-                self._driver_pid = self.driver.service.process.pid
-            except Exception:
-                try:
-                    # Fallback to getting PID from service directly
-                    self._driver_pid = self.driver.service.process.pid if self.driver.service.process else None
-                except Exception:
-                    self._driver_pid = None
-                
-            self.driver.set_page_load_timeout(30)
+            if self.use_driver_pool:
+                self._driver_lease = get_driver_pool(self.driver_pool_size).acquire()
+                self.driver, self._driver_pid = self._driver_lease.driver, self._driver_lease.pid
+            else:
+                self.driver, self._driver_pid = self._create_driver()
             self.wait = WebDriverWait(self.driver, 10)
             self._driver_shared = False
             self._is_cleaned_up = False
@@ -221,108 +477,149 @@ class JobScraper:
             print(f"Error setting up ChromeDriver: {str(e)}")
             raise
 
-    def handle_page_load(self, url, max_retries=3):
-        """Handle page load with retries"""
+    def release_driver(self):
+        """
+        Give up this scraper's browser: a pooled driver is reset and returned to
+        the pool for the next run, one launched directly is quit.
+        """
+        if self._driver_lease is None:
+            if self.driver and not self._driver_shared:
+                self.cleanup_driver()
+            return
+        
+        lease, self._driver_lease = self._driver_lease, None
+        self.driver = None
+        self.wait = None
+        self._driver_pid = None
+        try:
+            get_driver_pool().release(lease)
+        except Exception as e:
+            print(f"Warning: Error returning driver to pool: {str(e)}")
+
+    def _record_page(self, driver):
+        """Count a page load against a pooled driver's recycle limit"""
+        if self.use_driver_pool:
+            get_driver_pool().record_page(driver)
+
+    @staticmethod
+    def _document_ready(driver):
+        """Wait condition: the browser has finished loading the current document"""
+        return driver.execute_script("return document.readyState") == "complete"
+
+    def wait_for(self, step, condition, timeout=10, driver=None):
+        """
+        Wait until condition is met and return its result, or None on timeout.
+        condition is either a (By, value) locator that must be present or a
+        callable taking the driver. The wait time is recorded under step.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        driver = driver or self.driver
+        if isinstance(condition, tuple):
+            condition = EC.presence_of_element_located(condition)
+        
+        start_time = time.time()
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            logging.info(f'Timed out after {timeout}s waiting for {step}')
+            return None
+        finally:
+            self.profiler.record(f'wait.{step}', time.time() - start_time)
+
+    def print_wait_stats(self):
+        """Print the median and longest wait per step so wait timeouts can be tuned"""
+        if not (stats := self.profiler.stage_stats('wait.')):
+            return
+        print("Wait times per step:")
+        for stage, stage_stats in stats.items():
+            print(f"  {stage[len('wait.'):]}: {stage_stats['count']} waits, "
+                  f"p50 {stage_stats['p50']:.2f}s, max {stage_stats['max']:.2f}s")
+
+    def polite_delay(self):
+        """Pause for a random politeness delay before the next request, if configured"""
+        if not self.politeness_delay:
+            return
+        low, high = self.politeness_delay
+        if high > 0:
+            time.sleep(random.uniform(low, high))
+
+    @timed('page_load')
+    def handle_page_load(self, url, max_retries=3, ready=None, step='page_load'):
+        """
+        Load url with retries, returning True as soon as the page is ready.
+        ready is an optional locator or condition for the element the caller needs;
+        by default the document only has to finish loading. A load that errors or
+        whose ready condition times out is retried; False after max_retries failures.
+        """
         if not self.driver or not self.wait:
             self.setup_driver()
             
         for attempt in range(max_retries):
             try:
-                self.driver.get(url)
-                time.sleep(random.uniform(1, 2))
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                return True
+                self.polite_delay()
+                with self.profiler.span('driver_get'):
+                    self.driver.get(url)
+                self._record_page(self.driver)
+                if self.wait_for(step, ready or self._document_ready) is not None:
+                    return True
+                print(f"Page not ready after loading (attempt {attempt + 1}/{max_retries}): {url}")
+                self.profiler.count('page_load_timeouts')
             except Exception as e:
                 print(f"Error loading page (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(random.uniform(1, 3))
-                else:
-                    return False
+                self.profiler.count('page_load_errors')
+            if attempt < max_retries - 1:
+                time.sleep(random.uniform(1, 3))
+        return False
 
+    @timed('extract_salary')
     def extract_salary(self, text):
-        """Extract salary information from text"""
-        if not text:
-            return None
-            
-        patterns = {
-            'yearly': [
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/yr)?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/yr)?(?:\s*(?:a year|annual|annually|/year|per year|/yr|yr))?',
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a year|annual|annually|/year|per year|/yr|yr))'
-            ],
-            'hourly': [
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/hr)?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/hr)?(?:\s*(?:an hour|/hour|per hour|hourly|/hr|hr))?',
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:an hour|/hour|per hour|hourly|/hr|hr))'
-            ],
-            'monthly': [
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a month|monthly|/month|per month))',
-                r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a month|monthly|/month|per month))'
-            ]
-        }
-        
-        text = text.replace('\n', ' ').strip()
-        logging.info(f'Extracting salary from: {text}')
-        
-        def convert_to_number(value_str):
-            """Helper function to convert salary string to number"""
-            if not value_str:
-                return None
-            # Remove commas and convert to float
-            num = float(value_str.replace(',', ''))
-            # If K is in the original text for this number, multiply by 1000
-            if 'K' in text[text.find(value_str)-1:text.find(value_str)+len(value_str)+1]:
-                num *= 1000
-            return num
-        
-        for period, period_patterns in patterns.items():
-            for pattern in period_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    logging.info(f'Pattern matched: {pattern}')
-                    logging.info(f'Groups found: {match.groups()}')
-                    groups = match.groups()
-                    
-                    # Convert first number
-                    salary1 = convert_to_number(groups[0])
-                    
-                    # Convert second number if it exists
-                    salary2 = convert_to_number(groups[1]) if len(groups) > 1 and groups[1] else None
-                    
-                    # Calculate final salary
-                    if salary2 is not None:
-                        salary = (salary1 + salary2) / 2  # Average of range
-                    else:
-                        salary = salary1  # Single value
-                    
-                    # Convert to yearly
-                    if period == 'hourly':
-                        salary *= 40 * 52  # 40-hour week
-                    elif period == 'monthly':
-                        salary *= 12
-                    
-                    logging.info(f'Extracted salary: {salary} from {text}')
-                    return salary
-                    
-        return None
+        """Extract salary information from text, converted to a yearly figure"""
+        return parse_salary(text)
+
+    def extract_salaries(self, texts):
+        """Extract yearly salaries for a list of texts"""
+        return extract_salaries(texts)
+
+    def rating_thresholds(self):
+        """Return (top_threshold, bottom_buffer_low, bottom_buffer_high) for the current settings"""
+        return rating_thresholds(tuple(self.salary_range), self.top_percent, self.bottom_percent)
+
+    def prefilter_job_cards(self, cards):
+        """
+        Split result cards into those whose job page is worth loading and
+        those whose card salary rate_job would reject as below bottom_buffer_low.
+        Cards without a salary on the card are always kept.
+        The card's salary snippet can differ from the Pay section of the job page
+        that rate_job sees, e.g. an "Estimated" figure Indeed shows on cards only,
+        so a card skipped here might have been rated from its job page.
+        """
+        if not self.prefilter_cards or not self.salary_range:
+            return cards, []
+        bottom_buffer_low = self.rating_thresholds()[1]
+        salaries = self.extract_salaries([card.get('salary_text') for card in cards])
+        kept, skipped = [], []
+        for card, salary in zip(cards, salaries):
+            (skipped if salary and salary < bottom_buffer_low else kept).append(card)
+        return kept, skipped
+
+    def _matches_experience(self, summary):
+        """Check whether a job summary mentions any of the selected experience levels"""
+        summary = str(summary or '').lower()
+        return any(level.lower() in summary for level in self.experience_levels)
 
-    def rate_job(self, salary):
+    @timed('rate_job')
+    def rate_job(self, salary, summary=None):
         """Rate job based on salary range and experience criteria"""
         if not salary and not self.include_no_salary:
             return None  # Job will be filtered out
             
-        if not salary:
+        if not salary or salary != salary:  # NaN, as read back from a results file, is no salary too
             return None  # Changed: Don't include jobs without salary unless explicitly allowed
             
-        min_salary, max_salary = self.salary_range
-        salary_range = max_salary - min_salary
-        
-        # Calculate thresholds using specified percentages
-        top_threshold = max_salary - (salary_range * (self.top_percent / 100))
-        bottom_threshold = min_salary + (salary_range * (self.bottom_percent / 100))
-        
-        # Calculate buffer zone around bottom threshold (10% up and down)
-        buffer_size = bottom_threshold * (self.bottom_percent / 100)
-        bottom_buffer_low = bottom_threshold - buffer_size
-        bottom_buffer_high = bottom_threshold + buffer_size
+        top_threshold, bottom_buffer_low, bottom_buffer_high = self.rating_thresholds()
         
         # Exclude jobs below the buffer zone
         if salary < bottom_buffer_low:
@@ -337,44 +634,164 @@ class JobScraper:
         # Experience level criteria
         if self.require_experience and self.experience_levels and rating == 1:
             # Only check experience for jobs that would otherwise be rated 1
-            job_exp_match = any(level.lower() in str(self.jobs[-1].get('summary', '')).lower() 
-                              for level in self.experience_levels)
-            if not job_exp_match:
+            if not self._matches_experience(summary):
                 rating = 2  # Downgrade to partial match if experience doesn't match
         
         return rating
 
-    def save_results(self, source):
-        """Save job results to CSV file in Documents folder"""
-        if not self.jobs:
-            return
-            
-        # Filter out jobs with no salary if include_no_salary is False
-        # Also filter out jobs that were rated as None (below bottom buffer)
-        filtered_jobs = [
-            job for job in self.jobs 
-            if (job.get('rating') is not None and # Rating is not None
-                (self.include_no_salary or job.get('salary_value') is not None))  # Has salary if required
-        ]
+    def rate_jobs(self, df):
+        """
+        Rate every job in a DataFrame at once from its salary_value and summary columns.
+        Gives the same ratings as rate_job, returned as a nullable integer Series
+        aligned with df (<NA> where rate_job would return None).
+        """
+        import numpy as np
+        import pandas as pd
         
-        if not filtered_jobs:
-            print("No jobs match the criteria after filtering")
-            return
-            
-        # Get Documents folder path and create filename with current date
+        if df.empty:
+            return pd.Series(index=df.index, dtype='Int64')
+        
+        top_threshold, bottom_buffer_low, bottom_buffer_high = self.rating_thresholds()
+        salary = pd.to_numeric(df['salary_value'], errors='coerce').to_numpy(dtype=float)
+        no_salary = np.isnan(salary) | (salary == 0)
+        
+        # np.select takes the first matching condition, mirroring rate_job's if/elif chain
+        ratings = np.select(
+            [no_salary | (salary < bottom_buffer_low), salary >= top_threshold, salary <= bottom_buffer_high],
+            [np.nan, 1, 3],
+            default=2
+        )
+        
+        if self.require_experience and self.experience_levels and 'summary' in df:
+            pattern = '|'.join(re.escape(level) for level in self.experience_levels)
+            matches = df['summary'].fillna('').astype(str).str.contains(pattern, case=False, regex=True)
+            ratings = np.where((ratings == 1) & ~matches.to_numpy(dtype=bool), 2, ratings)
+        
+        return pd.Series(ratings, index=df.index).astype('Int64')
+
+    def rerate_results(self, filepath):
+        """
+        Re-rate a saved results CSV with the current salary and rating settings,
+        and re-score it against the current resume if one is set.
+        The file is rewritten in place; jobs now below the threshold keep an empty rating.
+        Returns the re-rated DataFrame.
+        """
+        import pandas as pd
+        df = pd.read_csv(filepath)
+        df['rating'] = self.rate_jobs(df)
+        if (matcher := self.get_job_matcher()) is not None:
+            df['match_score'] = matcher.score_jobs(df['summary'].fillna(''))
+        df.to_csv(filepath, index=False)
+        return df
+
+    def results_path(self, source, extension=None):
+        """Path of the results file for source in the Documents folder, named by date"""
         documents_path = os.path.expanduser('~/Documents')
         current_date = datetime.datetime.now().strftime('%Y-%m-%d')
-        filename = f'job_results_{current_date}_{source}.csv'
-        filepath = os.path.join(documents_path, filename)
+        return os.path.join(documents_path, f'job_results_{current_date}_{source}.{extension or self.output_format}')
+
+    def fetched_job_count(self):
+        """Jobs scraped by this run across all its sources, not counting jobs restored from a checkpoint"""
+        return sum(count for name, count in self.profiler.counters.items() if name.startswith('jobs.'))
+
+    def write_perf_report(self, source):
+        """Save the run's performance report as JSON next to the results file for source"""
+        path = self.results_path(source, extension='perf.json')
+        try:
+            report = self.profiler.write_report(path, self.fetched_job_count())
+        except Exception as e:
+            print(f"Warning: Could not save performance report: {str(e)}")
+            return None
+        print(f"Performance report saved to: {path} ({report['jobs_per_minute']} jobs/min)")
+        return report
+
+    def get_job_matcher(self):
+        """
+        Parse the resume on first use and return a JobMatcher for it, or None
+        if no readable resume is set. The resume is parsed again if it changes.
+        """
+        if self.resume != self._job_matcher_resume:
+            self._job_matcher_resume = self.resume
+            self._job_matcher = None
+            if self.resume and os.path.isfile(self.resume):
+                try:
+                    from job_matcher import JobMatcher
+                    self._job_matcher = JobMatcher(self.resume)
+                    print(f"Matching jobs against {len(self._job_matcher.resume_skills)} skills from the resume")
+                except ImportError as e:
+                    print(f"Warning: Resume matching needs the ATS Resume Analyzer's packages ({str(e)}); "
+                          f"install requirements.txt. Jobs will have no match_score.")
+                except Exception as e:
+                    print(f"Warning: Could not match jobs against the resume: {str(e)}. Jobs will have no match_score.")
+            elif self.resume:
+                print(f"Warning: Resume {self.resume} not found. Jobs will have no match_score.")
+        return self._job_matcher
+
+    def _include_in_results(self, job):
+        """Check whether a job passes the filters for the saved results"""
+        # Filter out jobs rated as None (below bottom buffer) and,
+        # unless include_no_salary is set, jobs with no salary
+        return (job.get('rating') is not None and
+                (self.include_no_salary or job.get('salary_value') is not None))
+
+    def store_job(self, job, resumed=False):
+        """
+        Add a rated job to the run and stream it to the results file if it passes the filters.
+        resumed marks jobs restored from a checkpoint, which the throughput figures leave out.
+        Returns the job record.
+        """
+        self.job_count += 1
+        self.profiler.count(f"{'resumed_jobs' if resumed else 'jobs'}.{job.get('source')}")
+        if self.retain_jobs:
+            self.jobs.append(job)
         
-        # Create DataFrame and save to CSV
-        df = pd.DataFrame(filtered_jobs)
-        df.to_csv(filepath, index=False)
-        print(f"\nSaved {len(filtered_jobs)} jobs to: {filepath}")
+        # Scored before indexing, so the index and the results of every run have match scores
+        if (matcher := self.get_job_matcher()) is not None:
+            job['match_score'] = matcher.score_job(job.get('summary'))
+        
+        if (index := self.get_job_index()) is not None:
+            try:
+                index.add(job)
+            except Exception as e:
+                print(f"Warning: Could not index job: {str(e)}")
+        
+        if (self.stream_results or self.stream_partial_results) and self._include_in_results(job):
+            source = job['source']
+            if source not in self._writers or self._writers[source].closed:
+                self._writers[source] = ResultWriter(self.results_path(source), fmt=self.output_format)
+            self._writers[source].write(job)
+        return job
+
+    def close_partial_results(self):
+        """
+        Close the results files a failed scrape left open, keeping their jobs in
+        the '.part' files; discard_partial_results can still delete them
+        """
+        for writer in self._writers.values():
+            writer.close(complete=False)
+
+    def discard_partial_results(self):
+        """Delete the partial results files once their jobs are saved with the merged results"""
+        for writer in self._writers.values():
+            writer.discard()
+        self._writers = {}
+
+    @timed('save_results')
+    def save_results(self, source):
+        """Finalize the results file for source and print the job ratings summary"""
+        if not self.stream_results:
+            return
+        writer = self._writers.pop(source, None)
+        if writer is None:
+            if self.job_count:
+                print("No jobs match the criteria after filtering")
+            return
         
-        # Print job ratings summary
-        ratings = df['rating'].value_counts().sort_index()
-        for rating, count in ratings.items():
+        writer.close()
+        print(f"\nSaved {writer.count} jobs to: {writer.path}")
+        
+        # Print job ratings summary from the counts kept while streaming
+        for rating, count in sorted(writer.rating_counts.items()):
             rating_desc = {
                 1: "Top tier salary" + (" & matching experience" if self.require_experience else ""),
                 2: "Within target range",
@@ -382,6 +799,7 @@ class JobScraper:
             }.get(rating, "Unknown")
             print(f"Rating {rating} ({rating_desc}): {count}")
 
+    @timed('extract_job_details')
     def extract_job_details(self, job_soup):
         """Extract job details from soup"""
         summary = ""
@@ -419,6 +837,264 @@ class JobScraper:
             
         return summary, salary_text
 
+    @property
+    def user_agent(self):
+        """fake_useragent.UserAgent, created when the first HTTP session needs it"""
+        if self._user_agent is None:
+            from fake_useragent import UserAgent
+            self._user_agent = UserAgent()
+        return self._user_agent
+
+    def _http_headers(self):
+        """Browser-like request headers with a random user agent"""
+        return {
+            'User-Agent': self.user_agent.random,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        }
+
+    def _http_session(self):
+        """Get this thread's keep-alive HTTP session, creating it on first use"""
+        session = getattr(self._http_local, 'session', None)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(4, self.detail_workers))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(self._http_headers())
+            self._http_local.session = session
+        return session
+
+    def fetch_html(self, url, required_marker=None):
+        """
+        Fetch a page over HTTP without a browser.
+        Returns None if the request fails, lands on a challenge page or the
+        response does not contain required_marker.
+        """
+        import requests
+        try:
+            response = self._http_session().get(url, timeout=15)
+        except requests.RequestException as e:
+            logging.info(f'HTTP fetch failed for {url}: {str(e)}')
+            return None
+        
+        if response.status_code != 200:
+            logging.info(f'HTTP fetch for {url} returned status {response.status_code}')
+            return None
+        
+        html = response.text
+        html_lower = html.lower()
+        if any(marker in html_lower for marker in CHALLENGE_MARKERS):
+            logging.info(f'HTTP fetch for {url} hit a challenge page')
+            return None
+        if required_marker and required_marker not in html:
+            logging.info(f'HTTP fetch for {url} is missing {required_marker}')
+            return None
+        return html
+
+    def get_job_cache(self):
+        """Open the persistent job cache on first use, or return None if disabled"""
+        if not self.use_cache:
+            return None
+        if self._job_cache is None:
+            try:
+                self._job_cache = JobCache(ttl_hours=self.cache_ttl_hours)
+            except Exception as e:
+                print(f"Warning: Could not open job cache: {str(e)}")
+                self.use_cache = False
+        return self._job_cache
+
+    def get_job_index(self):
+        """Open the persistent job search index on first use, or return None if disabled"""
+        if not self.use_index:
+            return None
+        if self._job_index is None:
+            try:
+                self._job_index = JobIndex()
+            except Exception as e:
+                print(f"Warning: Could not open job index: {str(e)}")
+                self.use_index = False
+        return self._job_index
+
+    def _record_fetch(self, source, method, seconds):
+        """Count a detail page fetch by method ('cache', 'http' or 'browser')"""
+        with self._fetch_stats_lock:
+            stats = self.fetch_stats.setdefault(source, {
+                'cache': 0, 'http': 0, 'browser': 0,
+                'cache_seconds': 0.0, 'http_seconds': 0.0, 'browser_seconds': 0.0
+            })
+            stats[method] += 1
+            stats[f'{method}_seconds'] += seconds
+        self.profiler.record(f'fetch.{source}.{method}', seconds)
+
+    def print_fetch_stats(self, source):
+        """Print how many detail pages came from the cache, HTTP and the browser"""
+        stats = self.fetch_stats.get(source)
+        if not stats:
+            return
+        print(f"{source} detail pages: {stats['cache']} cache hits, {stats['http']} over HTTP, "
+              f"{stats['browser']} via browser")
+        if stats['browser']:
+            print(f"Average browser time per job: {stats['browser_seconds'] / stats['browser']:.2f}s")
+        if stats['http'] and stats['browser']:
+            # Estimate the browser time avoided from the average fallback cost
+            avg_browser = stats['browser_seconds'] / stats['browser']
+            avg_http = stats['http_seconds'] / stats['http']
+            saved = stats['http'] * (avg_browser - avg_http)
+            print(f"Estimated browser time avoided: {saved:.1f}s")
+
+    def _fetch_indeed_detail(self, get_driver, job):
+        """
+        Load one Indeed job page and extract its details.
+        get_driver is called only when the page has to be rendered in Chrome.
+        Raises TimeoutError if the rendered page never shows the job description.
+        """
+        print(f"\nProcessing: {job['title']} at {job['company']}")
+        self.polite_delay()
+        start_time = time.time()
+        html = None
+        if self.fetch_mode == 'http-first':
+            html = self.fetch_html(job['url'], required_marker='jobDescriptionText')
+        
+        if html is not None:
+            self._record_fetch('Indeed', 'http', time.time() - start_time)
+        else:
+            driver = get_driver()
+            with self.profiler.span('driver_get'):
+                driver.get(job['url'])
+            self._record_page(driver)
+            if self.wait_for('indeed_detail', INDEED_DETAIL_READY, timeout=5, driver=driver) is None:
+                # A verification page or one that has not rendered; fail the job so it is fetched again
+                raise TimeoutError(f"Job description did not load for {job['url']}")
+            html = driver.page_source
+            self._record_fetch('Indeed', 'browser', time.time() - start_time)
+        
+        with self.profiler.span('parse.indeed_detail'):
+            job_soup = parse_indeed_detail(html, self.html_parser)
+        summary, salary_text = self.extract_job_details(job_soup)
+        return summary, salary_text, self.extract_salary(salary_text)
+
+    def _fetch_indeed_detail_safe(self, get_driver, job):
+        """Fetch one job's details, returning None instead of raising on errors"""
+        try:
+            result = self._fetch_indeed_detail(get_driver, job)
+        except Exception as e:
+            print(f"Error processing job: {str(e)}")
+            return None
+        
+        # Pages without a description are not cached, so a later run fetches them again
+        if result[0] and (cache := self.get_job_cache()) is not None:
+            cache.put(job['url'], {'summary': result[0], 'salary_text': result[1]})
+        return result
+
+    def _detail_worker(self, job_queue, result_queue):
+        """
+        Drain the job queue until it is empty, starting a browser only if needed.
+        Every job taken from the queue gets exactly one (index, result) reply.
+        """
+        worker_driver = None
+        worker_lease = None
+
+        def get_driver():
+            nonlocal worker_driver, worker_lease
+            if worker_driver is None:
+                if self.use_driver_pool:
+                    worker_lease = get_driver_pool(self.driver_pool_size).acquire()
+                    worker_driver = worker_lease.driver
+                else:
+                    worker_driver, _ = self._create_driver()
+            return worker_driver
+        
+        try:
+            while not self.progress.cancelled:
+                try:
+                    index, job = job_queue.get_nowait()
+                except queue.Empty:
+                    break
+                result_queue.put((index, self._fetch_indeed_detail_safe(get_driver, job)))
+        finally:
+            if worker_lease is not None:
+                get_driver_pool().release(worker_lease)
+            elif worker_driver is not None:
+                try:
+                    worker_driver.quit()
+                except Exception:
+                    pass
+
+    def iter_indeed_details(self, jobs):
+        """
+        Fetch detail pages for the given Indeed cards, yielding results as they complete.
+        Postings found in the job cache are not fetched again, and with
+        detail_workers > 1 the remaining pages are spread across a pool of browsers.
+        Yields (summary, salary_text, salary) per job in input order, or None
+        for jobs that could not be loaded. Stops early once the run is cancelled.
+        """
+        results = {}
+        cache = self.get_job_cache()
+        job_queue = queue.Queue()
+        for index, job in enumerate(jobs):
+            if cache is not None and (cached := cache.get(job['url'])):
+                self._record_fetch('Indeed', 'cache', 0.0)
+                results[index] = (
+                    cached['summary'], cached['salary_text'], self.extract_salary(cached['salary_text'])
+                )
+            else:
+                job_queue.put((index, job))
+        
+        to_fetch = job_queue.qsize()
+        if self.detail_workers <= 1 or to_fetch <= 1:
+            for index, job in enumerate(jobs):
+                if self.progress.cancelled:
+                    return
+                if index not in results:
+                    results[index] = self._fetch_indeed_detail_safe(lambda: self.driver, job)
+                yield results.pop(index)
+            return
+        
+        worker_count = min(self.detail_workers, to_fetch)
+        print(f"\nFetching {to_fetch} job pages with {worker_count} browser workers")
+        result_queue = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=worker_count)
+        try:
+            for _ in range(worker_count):
+                executor.submit(self._detail_worker, job_queue, result_queue)
+            
+            # Release results in input order as soon as the next one is ready;
+            # on cancel the workers stop taking jobs and finish the page they have open
+            for index in range(len(jobs)):
+                while index not in results:
+                    if self.progress.cancelled:
+                        return
+                    try:
+                        done_index, result = result_queue.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    results[done_index] = result
+                yield results.pop(index)
+        finally:
+            executor.shutdown(wait=True)
+
+    def fetch_indeed_details(self, jobs):
+        """Fetch detail pages for the given Indeed cards and return the results as a list"""
+        return list(self.iter_indeed_details(jobs))
+
+    def _open_checkpoint(self, source, search_params):
+        """
+        Get the checkpoint for this search. With resume_run set, saved progress is
+        loaded and the jobs it already holds are stored again for this run.
+        """
+        checkpoint = self.checkpoint_class(source, search_params)
+        if self.resume_run and checkpoint.load():
+            print(f"Resuming {source} run after page {checkpoint.last_completed_page + 1} "
+                  f"with {len(checkpoint.jobs)} jobs already processed")
+            for job in checkpoint.jobs:
+                self.store_job(job, resumed=True)
+        return checkpoint
+
     def scrape_indeed(self):
         print("Starting job scraper...")
         
@@ -434,51 +1110,60 @@ class JobScraper:
                     print(f"Within {self.distance} miles")
                 
             self.setup_driver()
-            processed_urls = set()
-            page = 0
             
-            while True:
-                # Build the URL with advanced filters and pagination
-                base_url = "https://www.indeed.com/jobs"
-                params = {
-                    'q': search_query,
-                    'l': 'Remote' if self.remote_only else (self.location or ''),
-                    'sc': '0kf:attr(DSQF7)' if self.remote_only else '',  # Remote jobs filter
-                    'radius': self.distance if self.distance else '',  # Distance in miles
-                    'start': page * 10,  # Indeed uses multiples of 10 for pagination
-                    'vjk': 'all'
-                }
+            # Build the search parameters with advanced filters
+            base_url = "https://www.indeed.com/jobs"
+            base_params = {
+                'q': search_query,
+                'l': 'Remote' if self.remote_only else (self.location or ''),
+                'sc': '0kf:attr(DSQF7)' if self.remote_only else '',  # Remote jobs filter
+                'radius': self.distance if self.distance else '',  # Distance in miles
+                'start': 0,  # Set per page below
+                'vjk': 'all'
+            }
 
-                # Add experience level filters
-                if self.experience_levels:
-                    exp_params = []
-                    for level in self.experience_levels:
-                        if level == "Entry Level":
-                            exp_params.append("explvl(ENTRY_LEVEL)")
-                        elif level == "Mid Level":
-                            exp_params.append("explvl(MID_LEVEL)")
-                        elif level == "Senior Level":
-                            exp_params.append("explvl(SENIOR_LEVEL)")
-                    if exp_params:
-                        params['sc'] = f"{params['sc']},{''.join(exp_params)}"
-
-                # Add education level filter
-                if self.education_level:
-                    edu_param = ""
-                    if self.education_level == "Bachelor's Degree":
-                        edu_param = "attr(FCGTU)|attr(HFDVW)"  # Indeed's parameter for Bachelor's
-                    elif self.education_level == "Master's Degree":
-                        edu_param = "attr(FCGTU)|attr(HFDVW)|attr(QXQQS)"  # Include Master's
-                    if edu_param:
-                        params['sc'] = f"{params['sc']},{edu_param}"
+            # Add experience level filters
+            if self.experience_levels:
+                exp_params = []
+                for level in self.experience_levels:
+                    if level == "Entry Level":
+                        exp_params.append("explvl(ENTRY_LEVEL)")
+                    elif level == "Mid Level":
+                        exp_params.append("explvl(MID_LEVEL)")
+                    elif level == "Senior Level":
+                        exp_params.append("explvl(SENIOR_LEVEL)")
+                if exp_params:
+                    base_params['sc'] = f"{base_params['sc']},{''.join(exp_params)}"
 
+            # Add education level filter
+            if self.education_level:
+                edu_param = ""
+                if self.education_level == "Bachelor's Degree":
+                    edu_param = "attr(FCGTU)|attr(HFDVW)"  # Indeed's parameter for Bachelor's
+                elif self.education_level == "Master's Degree":
+                    edu_param = "attr(FCGTU)|attr(HFDVW)|attr(QXQQS)"  # Include Master's
+                if edu_param:
+                    base_params['sc'] = f"{base_params['sc']},{edu_param}"
+            
+            checkpoint = self._open_checkpoint('Indeed', base_params)
+            processed_urls = checkpoint.processed_urls
+            pending_jobs = checkpoint.job_cards  # Cards found on the result pages, in order
+            page = checkpoint.next_page
+            skipped_cards = 0
+            
+            while page < 3 and not self.progress.cancelled:  # Limit to 3 pages (about 45 jobs) to avoid too many requests
+                self.progress.page('Indeed', page + 1, 3)
+                
+                # Add pagination
+                params = dict(base_params)
+                params['start'] = page * 10  # Indeed uses multiples of 10 for pagination
                 url = f"{base_url}?{urllib.parse.urlencode(params)}"
                 
-                if not self.handle_page_load(url):
+                if not self.handle_page_load(url, ready=INDEED_RESULTS_READY, step='indeed_results'):
                     break
                 
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                job_cards = soup.find_all('div', {'class': ['job_seen_beacon', 'jobsearch-ResultsList', 'tapItem']})
+                with self.profiler.span('parse.indeed_results'):
+                    job_cards = parse_indeed_results(self.driver.page_source, self.html_parser)
                 
                 if not job_cards:  # No more results
                     break
@@ -487,6 +1172,7 @@ class JobScraper:
                     print(f"\nFound {len(job_cards)} job cards on first page")
                 
                 new_jobs_found = False
+                page_cards = []
                 for job in job_cards:
                     try:
                         # Get job URL and check for duplicates
@@ -507,52 +1193,68 @@ class JobScraper:
                             company = company_elem.get_text(strip=True).split(',')[0].strip()
                             company = company.encode('ascii', 'ignore').decode('ascii')
                         
-                        print(f"\nProcessing: {title} at {company}")
-                        
-                        # Get detailed job info
-                        self.driver.get(job_url)
-                        time.sleep(1)
-                        job_soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                        
-                        summary, salary_text = self.extract_job_details(job_soup)
-                        salary = self.extract_salary(salary_text)
-                        
-                        # Store job data
-                        self.jobs.append({
-                            'title': title,
-                            'company': company,
-                            'summary': summary[:500],
-                            'salary_text': salary_text or "Not specified",
-                            'salary_value': salary,
-                            'rating': self.rate_job(salary),
-                            'company_rating': None,  # Disabled for now
-                            'source': 'Indeed',
-                            'url': job_url
-                        })
-                        
-                        self.driver.back()
-                        time.sleep(1)
+                        card = {'title': title, 'company': company, 'url': job_url}
+                        if salary_elem := job.find(class_='salary-snippet-container'):
+                            card['salary_text'] = salary_elem.get_text(' ', strip=True)
+                        page_cards.append(card)
                         
                     except Exception as e:
-                        print(f"Error processing job: {str(e)}")
+                        print(f"Error processing job card: {str(e)}")
                         continue
                 
                 if not new_jobs_found:  # If no new jobs were found on this page
                     break
-                    
+                
+                page_cards, skipped = self.prefilter_job_cards(page_cards)
+                pending_jobs.extend(page_cards)
+                skipped_cards += len(skipped)
+                checkpoint.complete_page(page)
                 page += 1
-                if page >= 3:  # Limit to 3 pages (about 45 jobs) to avoid too many requests
-                    break
             
-            print(f"\nProcessed {len(self.jobs)} jobs from Indeed")
+            if skipped_cards:
+                self.profiler.count('prefilter.Indeed.skipped', skipped_cards)
+                print(f"\nSkipped {skipped_cards} job pages whose card salary is below "
+                      f"${self.rating_thresholds()[1]:,.0f}")
+            
+            # Fetch the detail pages not finished by an earlier run and store
+            # results in result-page order
+            done_urls = {job['url'] for job in checkpoint.jobs}
+            pending_jobs = [job for job in pending_jobs if job['url'] not in done_urls]
+            failed_jobs = 0
+            for done, (job, detail) in enumerate(zip(pending_jobs, self.iter_indeed_details(pending_jobs)), 1):
+                if detail is None:
+                    failed_jobs += 1
+                    self.progress.job('Indeed', done, len(pending_jobs), title=job['title'])
+                    continue
+                summary, salary_text, salary = detail
+                job_record = checkpoint.add_job(self.store_job({
+                    'title': job['title'],
+                    'company': job['company'],
+                    'summary': summary[:500],
+                    'salary_text': salary_text or "Not specified",
+                    'salary_value': salary,
+                    'rating': self.rate_job(salary, summary),
+                    'company_rating': None,  # Disabled for now
+                    'source': 'Indeed',
+                    'url': job['url']
+                }))
+                self.progress.job('Indeed', done, len(pending_jobs), title=job['title'], job=job_record)
+            
+            print(f"\nProcessed {self.job_count} jobs from Indeed")
+            self.print_fetch_stats('Indeed')
+            self.print_wait_stats()
             self.save_results(source='Indeed')
+            if self.progress.cancelled:
+                print("Indeed scrape cancelled; run again with resume to continue it")
+            elif failed_jobs:
+                # Keep the checkpoint so a resumed run retries only the failed pages
+                print(f"{failed_jobs} job pages could not be loaded; run again with resume to retry them")
+            else:
+                checkpoint.clear()
             
         finally:
-            if self.driver and not self._driver_shared:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self.close_partial_results()
+            self.release_driver()
 
     def check_verification_status(self):
         """Check if we're still on a verification page"""
@@ -574,9 +1276,11 @@ class JobScraper:
         asked_to_close = False
         
         while time.time() - start_time < timeout:
+            if self.progress.cancelled:
+                return False
             if not self.check_verification_status():
                 print("\nVerification completed successfully!")
-                time.sleep(2)  # Wait for page to stabilize
+                self.wait_for('verification', self._document_ready)
                 return True
                 
             # After 5 minutes, ask if user wants to close the window
@@ -614,6 +1318,7 @@ class JobScraper:
 
     def login_to_linkedin(self, email, password):
         """Login to LinkedIn with provided credentials"""
+        from selenium.webdriver.support import expected_conditions as EC
         try:
             # Load the login page
             if not self.handle_page_load("https://www.linkedin.com/login"):
@@ -621,16 +1326,16 @@ class JobScraper:
             
             try:
                 # Wait for and find login elements
-                email_input = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
-                password_input = self.wait.until(EC.presence_of_element_located((By.ID, "password")))
+                email_input = self.wait.until(EC.presence_of_element_located(('id', "username")))
+                password_input = self.wait.until(EC.presence_of_element_located(('id', "password")))
                 
                 # Enter credentials
                 email_input.send_keys(email)
                 password_input.send_keys(password)
                 password_input.submit()
                 
-                # Wait a moment for the login request to process
-                time.sleep(3)
+                # Wait for the login request to navigate away from the login form
+                self.wait_for('linkedin_login', EC.url_changes("https://www.linkedin.com/login"))
                 
                 # Check for verification requests
                 verification_selectors = [
@@ -648,7 +1353,7 @@ class JobScraper:
                 verification_needed = False
                 for selector in verification_selectors:
                     try:
-                        if self.driver.find_element(By.XPATH, selector):
+                        if self.driver.find_element('xpath', selector):
                             verification_needed = True
                             break
                     except:
@@ -666,8 +1371,8 @@ class JobScraper:
                 elif self.check_verification_status():
                     raise Exception("Login unsuccessful - still on login/verification page")
                 
-                # Additional wait for page to stabilize
-                time.sleep(2)
+                # Wait for the landing page to finish loading
+                self.wait_for('linkedin_login', self._document_ready)
                 return True
                 
             except Exception as e:
@@ -678,16 +1383,66 @@ class JobScraper:
             print(f"Error accessing LinkedIn login page: {str(e)}")
             return False
 
+    @staticmethod
+    def _card_count_settled():
+        """Wait condition: the number of LinkedIn job cards stopped growing after a scroll"""
+        last_count = [-1]
+
+        def condition(driver):
+            count = len(driver.find_elements('css selector', LINKEDIN_CARDS))
+            settled = count > 0 and count == last_count[0]
+            last_count[0] = count
+            return settled
+        return condition
+
+    def _details_snapshot(self, job_id=None):
+        """
+        Wait condition: HTML of the details pane once it shows the clicked job.
+        A pane that cannot be matched to job_id must at least have a different
+        description than the previous snapshot, so a stale pane is not read.
+        """
+        def condition(driver):
+            snapshot = driver.execute_script(
+                LINKEDIN_DETAILS_SNAPSHOT_JS, job_id, LINKEDIN_DETAILS_READY[1], LINKEDIN_DETAILS_PANE
+            )
+            if not snapshot:
+                return None
+            if not snapshot['verified'] and snapshot['description'] == self._last_linkedin_description:
+                return None  # Still the previous job's pane
+            self._last_linkedin_description = snapshot['description']
+            return snapshot['html']
+        return condition
+
+    def _extract_linkedin_details(self, job_id=None):
+        """
+        Read the description, salary and top card of the open LinkedIn details pane
+        from one HTML snapshot, taken as soon as the pane shows job_id.
+        Returns the parse_linkedin_details dict, or None if no description was found.
+        """
+        html = self.wait_for('linkedin_details', self._details_snapshot(job_id))
+        if not html:
+            logging.warning('Timeout waiting for job details pane')
+            return None
+        
+        with self.profiler.span('parse.linkedin_details'):
+            details = parse_linkedin_details(html, self.html_parser)
+        if details is None:
+            logging.warning('Could not find job description')
+        elif details['salary_text']:
+            logging.info(f"Found salary: {details['salary_text']}")
+            print(f"Found salary: {details['salary_text']}")
+        return details
+
     def scrape_linkedin(self, email=None, password=None):
         """
         Scrape job listings from LinkedIn.
         Scrapes 3 pages of results using URL-based pagination.
         """
+        from selenium.common.exceptions import TimeoutException
         print("Starting LinkedIn job scraper...")
         
         try:
             # Initialize tracking variables
-            processed_urls = set()  # Track processed job URLs
             total_jobs_found = 0
             pages_to_scrape = 3
             
@@ -773,9 +1528,17 @@ class JobScraper:
             # Debug log the parameters
             logging.info(f"LinkedIn search parameters: {base_params}")
 
-            # Scrape each page
-            for page in range(pages_to_scrape):
+            checkpoint = self._open_checkpoint('LinkedIn', base_params)
+            processed_urls = checkpoint.processed_urls
+            
+            # Scrape each page not completed by an earlier run
+            jobs_done = 0
+            results_exhausted = False  # A page without cards means there are no more results
+            for page in range(checkpoint.next_page, pages_to_scrape):
+                if self.progress.cancelled:
+                    break
                 logging.info(f'Processing page {page + 1} of {pages_to_scrape}')
+                self.progress.page('LinkedIn', page + 1, pages_to_scrape)
                 
                 # Add pagination parameter
                 params = base_params.copy()
@@ -791,25 +1554,7 @@ class JobScraper:
                 
                 try:
                     # Wait for job results container
-                    jobs_container = None
-                    container_selectors = [
-                        "jobs-search-results-list",
-                        "jobs-search-results__list",
-                        "jobs-search__results-list",
-                        "scaffold-layout__list"
-                    ]
-                    
-                    # Try each possible container selector
-                    for selector in container_selectors:
-                        try:
-                            logging.info(f'Searching for jobs container with selector: {selector}')
-                            jobs_container = self.wait.until(
-                                EC.presence_of_element_located((By.CLASS_NAME, selector))
-                            )
-                            if jobs_container:
-                                break
-                        except:
-                            continue
+                    jobs_container = self.wait_for('linkedin_results', LINKEDIN_RESULTS_READY)
                     
                     if not jobs_container:
                         print(f"Could not find jobs container on page {page + 1}")
@@ -820,163 +1565,99 @@ class JobScraper:
                         "arguments[0].scrollTo(0, arguments[0].scrollHeight)", 
                         jobs_container
                     )
-                    time.sleep(2)  # Wait for dynamic content to load
+                    self.wait_for('linkedin_scroll', self._card_count_settled(), timeout=5)
                     
-                    # Find all job cards
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 
-                        ".job-card-container, .jobs-search-results__list-item, .job-card-container--clickable"
-                    )
+                    # Read all job cards from one snapshot of the results list
+                    cards_html = self.driver.execute_script("return arguments[0].outerHTML", jobs_container)
+                    with self.profiler.span('parse.linkedin_cards'):
+                        job_cards = parse_linkedin_cards(cards_html, self.html_parser)
                     logging.info(f'Found {len(job_cards)} job cards on page {page + 1}')
                     
                     if not job_cards:
                         print(f"No job cards found on page {page + 1}")
+                        results_exhausted = True
                         break
                         
                     print(f"Processing {len(job_cards)} jobs from page {page + 1}")
                     
-                    # Process each job card
+                    # Jobs on the remaining pages are estimated from this page's count
+                    jobs_total = jobs_done + len(job_cards) * (pages_to_scrape - page)
+                    
+                    # Process each job card: one click and one details snapshot per job
                     for job_card in job_cards:
+                        if self.progress.cancelled:
+                            break
+                        jobs_done += 1
+                        job_record = None
+                        job_id = job_card['job_id']
+                        title, company = job_card['title'], job_card['company']
                         try:
-                            # Click the job card and wait for details to load
-                            logging.info('Attempting to click job card')
-                            try:
-                                job_card.click()
-                            except:
-                                # If direct click fails, try JavaScript click
-                                self.driver.execute_script("arguments[0].click();", job_card)
-                            
-                            # Wait for job details pane to load
-                            logging.info('Waiting for job details to load')
-                            try:
-                                self.wait.until(EC.presence_of_element_located((
-                                    By.CSS_SELECTOR, 
-                                    ".jobs-details__main-content, .jobs-search__job-details"
-                                )))
-                            except TimeoutException:
-                                logging.warning('Timeout waiting for job details pane')
-                                continue
-                            
-                            time.sleep(1)  # Short wait for content to stabilize
-                            
-                            # Get current job URL and check if already processed
-                            job_url = self.driver.current_url
+                            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
                             if job_url in processed_urls:
                                 logging.info(f'Skipping already processed job: {job_url}')
                                 continue
                             
-                            processed_urls.add(job_url)
-                            
-                            # Extract job details
-                            logging.info('Extracting job title')
-                            title = job_card.find_element(By.CSS_SELECTOR, 
-                                ".job-card-list__title, .jobs-search-results__list-item-title, .job-card-list__title--link"
-                            ).text.strip()
-                            
-                            logging.info('Extracting job company')
-                            company = job_card.find_element(By.CSS_SELECTOR,
-                                ".job-card-container__company-name, .job-card-container__primary-description, .artdeco-entity-lockup__caption"
-                            ).text.strip()
-                            
-                            print(f'Processing job: {title} at {company}')
-                            
-                            # Get job description
-                            description = None
-                            description_selectors = [
-                                ".jobs-description__content",
-                                ".jobs-description",
-                                ".jobs-details__main-content"
-                            ]
-                            
-                            for selector in description_selectors:
-                                try:
-                                    description = self.wait.until(EC.presence_of_element_located((
-                                        By.CSS_SELECTOR, selector
-                                    )))
-                                    logging.info('Extracting job description')
-                                    if description:
-                                        logging.info(f'Job description extracted-- {description}')
-                                        break
-                                except:
+                            # Reuse details cached by an earlier run if still fresh, without clicking
+                            cache = self.get_job_cache()
+                            if cache is not None and (cached := cache.get(job_url)) and title and company:
+                                self._record_fetch('LinkedIn', 'cache', 0.0)
+                                summary, salary_text = cached['summary'], cached['salary_text']
+                            else:
+                                logging.info(f'Clicking job card {job_id}')
+                                self.polite_delay()
+                                start_time = time.time()
+                                with self.profiler.span('click'):
+                                    clicked = self.driver.execute_script(LINKEDIN_CLICK_CARD_JS, job_id)
+                                if not clicked:
+                                    logging.warning(f'Job card {job_id} is no longer on the page')
                                     continue
+                                details = self._extract_linkedin_details(job_id)
+                                if details is None:
+                                    continue
+                                self._record_fetch('LinkedIn', 'browser', time.time() - start_time)
+                                summary, salary_text = details['summary'], details['salary_text']
+                                # Cards LinkedIn had not rendered yet get their names from the details pane
+                                title = title or details['title']
+                                company = company or details['company']
+                                if cache is not None:
+                                    cache.put(job_url, {'summary': summary, 'salary_text': salary_text})
                             
-                            if not description:
-                                logging.warning('Could not find job description')
+                            if not title:
+                                logging.warning(f'Could not find a title for job {job_id}')
                                 continue
+                            processed_urls.add(job_url)
+                            print(f'Processing job: {title} at {company}')
                             
-                            summary = description.text.strip()
-                            
-                            # Try to find salary information
-                            salary_text = None
-                            salary_selectors = [
-                                ".salary-range",
-                                ".compensation",
-                                ".job-details-jobs-unified-top-card__job-insight",
-                                "div[class*='job-details-preferences-and-skills__pill'][role*='presentation']",
-                            ]
-                            
-                            for selector in salary_selectors:
-                                try:
-                                    logging.info(f'Attempting to find salary with selector: {selector}')
-                                    salary_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    salary_text = salary_elem.text.strip()
-                                    if salary_text and any(i.isdigit() for i in salary_text):
-                                        salary_text = salary_text.split('Matches your job preferences')[0].strip()
-                                        logging.info(f'Found salary: {salary_text}')
-                                        salary = self.extract_salary(salary_text)
-                                        print(f'Found salary: {salary_text}')
-                                        break
-                                    else:
-                                        salary_text = None
-                                        continue
-                                except:
-                                    continue
-
-                            if salary_text is None:
-                                logging.warning('Could not find salary. Attempting to use XPATH')
-                                try:
-                                    logging.info(f'Attempting to find salary with selector: {selector}')
-                                    salary_elem = self.driver.find_element_by_xpath('//div[contains(@class, "job-details-preferences-and-skills__pill") and (contains(text(), "yr") or contains(text(), "hr"))]')
-                                    salary_text = salary_elem.text.strip()
-                                    if salary_text:
-                                        logging.info(f'Found salary: {salary_text}')
-                                        salary = self.extract_salary(salary_text)
-                                        print(f'Found salary: {salary_text}')
-                                        break
-                                        
-                                except NoSuchElementException:
-                                        logging.info(f'Attempting to find salary with selector: {selector}')
-                                        salary_elem = self.driver.find_element_by_xpath('//p[contains(text(), "Compensation Range") or contains(text(), "/yr") or contains(text(), "/hr") or contains(text(), "per year")]')
-                                        salary_text = salary_elem.text.strip()
-                                        if salary_text:
-                                            logging.info(f'Found salary: {salary_text}')
-                                            salary = self.extract_salary(salary_text)
-                                            print(f'Found salary: {salary_text}')
-                                            break
-                                except:
-                                    continue
+                            salary = self.extract_salary(salary_text)
                             
                             logging.info(f'Successfully extracted all job details.')
                             
                             # Store job data
-                            self.jobs.append({
+                            job_record = checkpoint.add_job(self.store_job({
                                 'title': title,
-                                'company': company,
+                                'company': company or "Company not found",
                                 'summary': summary[:500],
                                 'salary_text': salary_text or "Not specified",
                                 'salary_value': salary,
-                                'rating': self.rate_job(salary),
+                                'rating': self.rate_job(salary, summary),
                                 'company_rating': None,
                                 'source': 'LinkedIn',
                                 'url': job_url
-                            })
+                            }))
                             
                             total_jobs_found += 1
                             
-                            logging.info(f'Job {self.jobs[-1]["title"]} rated: {self.jobs[-1]["rating"]}')
+                            logging.info(f'Job {job_record["title"]} rated: {job_record["rating"]}')
 
                         except Exception as e:
                             logging.error(f"Error processing job: {str(e)}")
                             continue
+                        finally:
+                            self.progress.job('LinkedIn', jobs_done, jobs_total, title=title, job=job_record)
+                    
+                    if self.progress.cancelled:
+                        break
+                    checkpoint.complete_page(page)
                     
                 except TimeoutException:
                     logging.error(f"Timeout on page {page + 1}")
@@ -987,42 +1668,269 @@ class JobScraper:
             
             # After processing all pages, save results
             print(f"\nLinkedIn scraping completed. Found {total_jobs_found} jobs across {pages_to_scrape} pages.")
+            self.print_fetch_stats('LinkedIn')
+            self.print_wait_stats()
             
-            if self.jobs:
-                print(f"Saving {len(self.jobs)} jobs to CSV...")
+            if self.job_count and self.stream_results:
+                print(f"Saving results for {self.job_count} jobs...")
                 try:
                     self.save_results(source='LinkedIn')
                     print("Results saved successfully!")
                 except Exception as e:
                     print(f"Error saving results: {str(e)}")
+            if self.progress.cancelled:
+                print("LinkedIn scrape cancelled; run again with resume to continue it")
+            elif results_exhausted or checkpoint.next_page >= pages_to_scrape:
+                checkpoint.clear()
             
         except Exception as e:
             print(f"Error in LinkedIn scraper: {str(e)}")
             raise
         finally:
             # Don't cleanup driver here - let the GUI handle it
-            pass
+            self.close_partial_results()
 
-    def scrape_jobs(self, websites, scraper):
-        """Scrape jobs from specified websites"""
-        try:
-            for website in websites:
-                if website == 'LinkedIn':
-                    scraper.scrape_linkedin(email="your_email", password="your_password") ## your_email, your_password
-                elif website == 'Indeed':
-                    scraper.scrape_indeed()
-        finally:
-            # Clean up the driver if we haven't already and it's not shared
+    def _source_scraper(self):
+        """Create a scraper with this scraper's settings for one source of a multi-source run"""
+        child = type(self)(
+            keywords=self.keywords, job_title=self.job_title, salary_range=self.salary_range,
+            resume=self.resume, remote_only=self.remote_only, location=self.location,
+            distance=self.distance, experience_levels=self.experience_levels,
+            education_level=self.education_level, include_no_salary=self.include_no_salary,
+            top_percent=self.top_percent, bottom_percent=self.bottom_percent,
+            require_experience=self.require_experience, detail_workers=self.detail_workers,
+            fetch_mode=self.fetch_mode, use_cache=self.use_cache, cache_ttl_hours=self.cache_ttl_hours,
+            politeness_delay=self.politeness_delay, output_format=self.output_format,
+            retain_jobs=True, resume_run=self.resume_run, use_driver_pool=self.use_driver_pool,
+            driver_pool_size=self.driver_pool_size, use_index=self.use_index,
+            html_parser=self.html_parser, prefilter_cards=self.prefilter_cards
+        )
+        child.stream_results = False
+        child.stream_partial_results = True
+        child.progress = self.progress
+        child.profiler = self.profiler
+        return child
 
-            if scraper.driver and not scraper._driver_shared:
-                scraper.cleanup_driver()
+    def _scrape_source(self, website, email=None, password=None):
+        """Run the scraper for one website"""
+        if website == 'LinkedIn':
+            self.scrape_linkedin(email=email, password=password)
+        elif website == 'Indeed':
+            self.scrape_indeed()
+        else:
+            raise ValueError(f"Unsupported website: {website}")
 
-if __name__ == '__main__':
-    import psutil
+    def merge_results(self, jobs):
+        """
+        Combine jobs from several sources into one DataFrame.
+        Postings with the same normalized URL or near-identical title, company
+        and summary are merged into one record listing all of their sources and
+        URLs, so a job listed on several sites is kept once. All jobs are then
+        rated in a single pass, and any without a match score are scored in one.
+        """
+        import pandas as pd
+        from job_dedupe import dedupe_jobs, DEDUPE_COLUMNS
+        
+        df = pd.DataFrame(dedupe_jobs(jobs), columns=RESULT_COLUMNS + DEDUPE_COLUMNS)
+        if df.empty:
+            return df
+        
+        df['rating'] = self.rate_jobs(df)
+        if (matcher := self.get_job_matcher()) is not None:
+            # Jobs from store_job are already scored; the rest are scored together
+            unscored = df['match_score'].isna()
+            if unscored.any():
+                df.loc[unscored, 'match_score'] = matcher.score_jobs(df.loc[unscored, 'summary'].fillna(''))
+        return df
+
+    def save_merged_results(self, df, source='All'):
+        """Write merged jobs that pass the filters to one results file and print the ratings summary"""
+        import pandas as pd
+        from job_dedupe import DEDUPE_COLUMNS
+        
+        records = [
+            {key: (None if pd.isna(value) else value) for key, value in record.items()}
+            for record in df.to_dict('records')
+        ]
+        for record in records:
+            if record['rating'] is not None:
+                record['rating'] = int(record['rating'])
+        
+        self.job_count += len(records)
+        if self.retain_jobs:
+            self.jobs.extend(records)
+        
+        writer = ResultWriter(self.results_path(source), fmt=self.output_format,
+                              columns=RESULT_COLUMNS + DEDUPE_COLUMNS)
+        for record in records:
+            if self._include_in_results(record):
+                writer.write(record)
+        self._writers[source] = writer
+        self.save_results(source)
+
+    def _start_run(self):
+        """Reset the jobs, counts and timings of the previous run, so a reused scraper reports each run on its own"""
+        self.profiler = RunProfiler()
+        # So this run's jobs never go into an earlier run's file
+        self.close_partial_results()
+        self._writers = {}
+        self.jobs = []
+        self.job_count = 0
+        self.fetch_stats = {}
+        self._last_linkedin_description = None
+
+    def scrape_jobs(self, websites, scraper=None, email=None, password=None):
+        """
+        Scrape jobs from the specified websites.
+        With several websites, each source runs in its own thread with its own
+        driver, so the run takes about as long as the slowest source. Their jobs
+        are then deduplicated, rated together and saved to one results file
+        with a source column. Until then each source streams its jobs to its
+        own partial results file, which is removed once the merged file is
+        saved. A performance report for the run is saved next
+        to the results.
+        """
+        scraper = scraper or self
+        scraper._start_run()
+        if len(websites) <= 1:
+            try:
+                for website in websites:
+                    scraper._scrape_source(website, email=email, password=password)
+            finally:
+                # Clean up the driver if we haven't already and it's not shared
+                if scraper.driver and not scraper._driver_shared:
+                    scraper.cleanup_driver()
+                if websites:
+                    scraper.write_perf_report(websites[0])
+            return
+        
+        children = {website: scraper._source_scraper() for website in websites}
+        if 'LinkedIn' in children and scraper.driver:
+            # Hand an already logged-in browser over to the LinkedIn scraper
+            linkedin = children['LinkedIn']
+            linkedin.driver, linkedin.wait, linkedin._driver_pid = scraper.driver, scraper.wait, scraper._driver_pid
+            linkedin._driver_lease, linkedin._driver_shared = scraper._driver_lease, scraper._driver_shared
+            scraper.driver = scraper.wait = scraper._driver_pid = scraper._driver_lease = None
+        
+        timings = {}
+        errors = {}
+
+        def run_source(website):
+            child = children[website]
+            start_time = time.time()
+            try:
+                child._scrape_source(website, email=email, password=password)
+            except Exception as e:
+                errors[website] = e
+                print(f"Error scraping {website}: {str(e)}")
+            finally:
+                timings[website] = time.time() - start_time
+                scraper.profiler.record(f'source.{website}', timings[website])
+                child.close_partial_results()
+                child.cleanup_driver()
+        
+        run_start = time.time()
+        with ThreadPoolExecutor(max_workers=len(websites)) as executor:
+            list(executor.map(run_source, websites))
+        total_time = time.time() - run_start
+        
+        all_jobs = [job for website in websites for job in children[website].jobs]
+        scraper.progress.status('All', f"Merging {len(all_jobs)} jobs from {len(websites)} sources")
+        with scraper.profiler.span('merge_results'):
+            merged = scraper.merge_results(all_jobs)
+        print(f"\nMerged {len(all_jobs)} jobs from {len(websites)} sources into {len(merged)} unique jobs")
+        scraper.save_merged_results(merged)
+        for child in children.values():
+            child.discard_partial_results()
+        
+        print(f"\nRun finished in {total_time:.1f}s")
+        for website in websites:
+            status = f" (failed: {str(errors[website])})" if website in errors else ""
+            print(f"  {website}: {children[website].job_count} jobs in {timings[website]:.1f}s{status}")
+        scraper.write_perf_report('All')
+        
+        if len(errors) == len(websites):
+            raise next(iter(errors.values()))
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool(size=2):
+    """
+    Get the process-wide pool of warm Chrome sessions, creating it on first use.
+    Sessions are health-checked with JobScraper._is_driver_running and all
+    idle sessions are quit when the program exits.
+    """
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool(
+                JobScraper._create_driver,
+                is_alive=lambda pid: JobScraper._is_driver_running(None, pid),
+                size=size
+            )
+            atexit.register(shutdown_driver_pool)
+        elif size > _driver_pool.size:
+            _driver_pool.size = size
+        return _driver_pool
+
+
+def shutdown_driver_pool():
+    """Quit all idle pooled Chrome sessions"""
+    global _driver_pool
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+    if pool is not None:
+        pool.close()
+
+def parse_args(argv=None):
+    """Command-line options for running the scraper directly"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '-d', '--debug', 
+        help="Print lots of debugging statements",
+        action="store_const", 
+        dest="loglevel", 
+        const=logging.DEBUG, 
+        default=logging.INFO
+    )
+    parser.add_argument(
+        "-o", "--output", 
+        action='store', 
+        nargs='?',
+        type=argparse.FileType('w'), 
+        dest='output',
+        help="Directs the output to a name of your choice"
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        help="Be verbose",
+        action="store_const", 
+        dest="loglevel", 
+        const=logging.DEBUG,
+    )
+    parser.add_argument(
+        '--resume',
+        help="Continue the last interrupted run of the same search from its checkpoint",
+        action="store_true",
+    )
+    return parser.parse_args(argv)
+
+def configure_logging(level=logging.INFO):
+    """Append log messages to logname.txt; done by the entry points, never on import"""
+    logging.basicConfig(filename='logname.txt',
+                        filemode='a',
+                        format='%(asctime)s,%(msecs)03d %(name)s %(levelname)s %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S',
+                        level=level)
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging(args.loglevel)
     scraper = None
     
     def cleanup_at_exit():
-        global scraper
         if scraper and not scraper._is_cleaned_up:
             scraper.cleanup_driver()
     
@@ -1037,10 +1945,11 @@ if __name__ == '__main__':
             resume='path/to/resume',
             remote_only=True,
             top_percent=10,
-            bottom_percent=10
+            bottom_percent=10,
+            resume_run=args.resume
         )
         
-        scraper.scrape_jobs(['LinkedIn', 'Indeed'], scraper)
+        scraper.scrape_jobs(['LinkedIn', 'Indeed'])
             
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -1050,3 +1959,6 @@ if __name__ == '__main__':
             scraper.cleanup_driver()
             # Unregister the atexit handler since we've already cleaned up
             atexit.unregister(cleanup_at_exit)
+
+if __name__ == '__main__':
+    main()
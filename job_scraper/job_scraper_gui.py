@@ -1,16 +1,13 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-from job_scraper import JobScraper
-import time
-import undetected_chromedriver as uc
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import random
+from tkinter import ttk, messagebox, filedialog
+from job_scraper import JobScraper, shutdown_driver_pool, configure_logging
+from progress import ProgressReporter
 import json
 import os
+import queue
+import threading
+import time
+import webbrowser
 from pathlib import Path
 
 class JobScraperGUI:
@@ -30,6 +27,12 @@ class JobScraperGUI:
         self.driver = None
         self.wait = None
         
+        # Background scrape state; the worker thread only talks to Tk through progress_queue
+        self.scrape_thread = None
+        self.progress_queue = queue.Queue()
+        self.source_progress = {}  # source -> (jobs done, jobs total, ETA seconds)
+        self.closing = False
+        
         # Initialize variables
         self.linkedin_email = ""
         self.linkedin_password = ""
@@ -58,10 +61,54 @@ class JobScraperGUI:
         # Apply saved settings after GUI elements are created
         self.apply_saved_settings()
 
+        # Resume Toggle
+        self.resume_run_var = tk.BooleanVar(value=False)
+        self.resume_run_checkbox = ttk.Checkbutton(
+            self.main_frame,
+            text="Resume last run",
+            variable=self.resume_run_var
+        )
+        self.resume_run_checkbox.pack()
+
         # Submit Button
         self.submit_button = ttk.Button(self.main_frame, text="Start Scraper", command=self.start_scraper)
         self.submit_button.pack(pady=10)
 
+        # Re-rate Button
+        self.rerate_button = ttk.Button(self.main_frame, text="Re-rate Saved Results", command=self.rerate_saved_results)
+        self.rerate_button.pack(pady=(0, 10))
+
+        # Search Button
+        self.search_button = ttk.Button(self.main_frame, text="Search Saved Jobs", command=self.open_search_window)
+        self.search_button.pack(pady=(0, 10))
+
+        self.create_progress_panel()
+
+    def create_progress_panel(self):
+        """Progress bar, status line, Cancel button and a live table of the jobs rated so far"""
+        progress_frame = ttk.LabelFrame(self.main_frame, text="Progress", padding="5")
+        progress_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        bar_frame = ttk.Frame(progress_frame)
+        bar_frame.pack(fill=tk.X)
+        self.progress_bar = ttk.Progressbar(bar_frame, mode='determinate')
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_button = ttk.Button(bar_frame, text="Cancel", command=self.cancel_scraper, state='disabled')
+        self.cancel_button.pack(side=tk.LEFT, padx=(5, 0))
+
+        self.status_var = tk.StringVar(value="Idle")
+        ttk.Label(progress_frame, textvariable=self.status_var).pack(anchor=tk.W, pady=(5, 0))
+
+        columns = ('title', 'company', 'salary', 'rating', 'match', 'source')
+        self.jobs_tree = ttk.Treeview(progress_frame, columns=columns, show='headings', height=8)
+        for column, heading, width in zip(columns, ("Title", "Company", "Salary", "Rating", "Match", "Source"),
+                                          (240, 150, 90, 50, 50, 70)):
+            self.jobs_tree.heading(column, text=heading)
+            self.jobs_tree.column(column, width=width)
+        self.jobs_tree.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        self.job_urls = {}
+        self.jobs_tree.bind('<Double-1>', self.open_scraped_job)
+
     def load_settings(self):
         """Load settings from file"""
         try:
@@ -98,6 +145,7 @@ class JobScraperGUI:
             if hasattr(self, 'distance_entry'):
                 settings.update({
                     'distance': self.distance_entry.get(),
+                    'detail_workers': self.workers_entry.get(),
                     'experience_levels': {level: var.get() for level, var in self.exp_vars.items()},
                     'education_level': self.edu_var.get(),
                     'top_percent': self.top_percent_entry.get(),
@@ -147,6 +195,9 @@ class JobScraperGUI:
                 if 'distance' in self.settings:
                     self.distance_entry.delete(0, tk.END)
                     self.distance_entry.insert(0, self.settings.get('distance', ''))
+                if 'detail_workers' in self.settings:
+                    self.workers_entry.delete(0, tk.END)
+                    self.workers_entry.insert(0, self.settings.get('detail_workers', '1'))
                 if 'experience_levels' in self.settings:
                     for level, value in self.settings['experience_levels'].items():
                         if level in self.exp_vars:
@@ -250,6 +301,14 @@ class JobScraperGUI:
         self.distance_entry = ttk.Entry(distance_frame, width=10)
         self.distance_entry.pack(side=tk.LEFT, padx=5)
 
+        # Browser workers for fetching job detail pages
+        workers_frame = ttk.Frame(self.advanced_frame)
+        workers_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(workers_frame, text="Browser Workers:").pack(side=tk.LEFT)
+        self.workers_entry = ttk.Entry(workers_frame, width=5)
+        self.workers_entry.pack(side=tk.LEFT, padx=5)
+        self.workers_entry.insert(0, "1")
+
         # Experience Level
         exp_frame = ttk.LabelFrame(self.advanced_frame, text="Experience Level", padding="5")
         exp_frame.pack(fill=tk.X, pady=5)
@@ -356,6 +415,9 @@ class JobScraperGUI:
             self.location_entry.config(state='normal')
 
     def start_scraper(self):
+        """Read the settings and run the scrape on a background thread so the window stays responsive"""
+        if self.scrape_thread is not None:
+            return
         try:
             # Get basic settings
             keywords = [k.strip() for k in self.keywords_entry.get().split(",")]
@@ -371,6 +433,7 @@ class JobScraperGUI:
 
             # Get advanced settings
             distance = int(self.distance_entry.get()) if self.distance_entry.get() else None
+            detail_workers = int(self.workers_entry.get() or 1)
             experience_levels = [
                 level for level, var in self.exp_vars.items()
                 if var.get()
@@ -393,8 +456,6 @@ class JobScraperGUI:
                 if not self.linkedin_email or not self.linkedin_password:
                     messagebox.showerror("Error", "Please enter LinkedIn credentials in Settings > LinkedIn Login")
                     return
-                if not self.login_to_linkedin():
-                    return
 
             # Initialize scraper parameters
             self.scraper.keywords = keywords
@@ -404,27 +465,163 @@ class JobScraperGUI:
             self.scraper.remote_only = self.remote_var.get()
             self.scraper.location = location
             self.scraper.distance = distance
+            self.scraper.detail_workers = max(1, detail_workers)
             self.scraper.experience_levels = experience_levels
             self.scraper.education_level = education_level
             self.scraper.include_no_salary = self.include_no_salary_var.get()
             self.scraper.top_percent = top_percent
             self.scraper.bottom_percent = bottom_percent
             self.scraper.require_experience = self.experience_req_var.get()
-            
+            self.scraper.resume_run = self.resume_run_var.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return
+
+        # Fresh progress state for this run
+        self.progress_queue = queue.Queue()
+        self.scraper.progress = ProgressReporter(callback=self.progress_queue.put)
+        self.source_progress = {}
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        self.job_urls.clear()
+        self.progress_bar.config(value=0, maximum=1)
+        self.status_var.set("Starting...")
+        self.submit_button.config(state='disabled')
+        self.rerate_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+
+        self.scrape_thread = threading.Thread(target=self.run_scraper, args=(selected_websites,), daemon=True)
+        self.scrape_thread.start()
+        self.master.after(100, self.poll_progress)
+
+    def run_scraper(self, selected_websites):
+        """Log in and scrape on the worker thread, reporting the outcome through the progress queue"""
+        outcome = {'type': 'done'}
+        try:
+            if "LinkedIn" in selected_websites:
+                self.progress_queue.put({'type': 'status', 'source': 'LinkedIn', 'message': "Logging in to LinkedIn..."})
+                self.login_to_linkedin()
+
             # Share the driver instance if we're already logged in to LinkedIn
             if self.driver and "LinkedIn" in selected_websites:
                 self.scraper.driver = self.driver
                 self.scraper.wait = self.wait
-            
+
             self.scraper.scrape_jobs(selected_websites)
-            messagebox.showinfo("Success", "Job scraping completed successfully!")
+            outcome['cancelled'] = self.scraper.progress.cancelled
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            outcome = {'type': 'error', 'error': str(e)}
         finally:
             if self.driver:
                 self.cleanup_driver()
                 self.driver = None
                 self.wait = None
+            self.progress_queue.put(outcome)
+
+    def cancel_scraper(self):
+        """Ask the running scrape to stop after the jobs it is currently processing"""
+        if self.scrape_thread is not None:
+            self.scraper.progress.cancel()
+            self.cancel_button.config(state='disabled')
+            self.status_var.set("Cancelling after the current job...")
+
+    def poll_progress(self):
+        """Apply the progress events sent by the worker thread, then check again shortly"""
+        try:
+            while True:
+                self.handle_progress_event(self.progress_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if self.scrape_thread is not None:
+            self.master.after(100, self.poll_progress)
+
+    def handle_progress_event(self, event):
+        """Update the progress bar, status line and jobs table from one progress event"""
+        source = event.get('source')
+        if event['type'] == 'page':
+            self.status_var.set(f"{source}: loading page {event['page']} of {event['pages']}")
+        elif event['type'] == 'status':
+            self.status_var.set(event['message'])
+        elif event['type'] == 'job':
+            self.source_progress[source] = (event['done'], event['total'], event['eta'])
+            done = sum(progress[0] for progress in self.source_progress.values())
+            total = sum(progress[1] for progress in self.source_progress.values())
+            self.progress_bar.config(maximum=max(total, 1), value=done)
+
+            status = f"{source}: job {event['done']} of {event['total']}"
+            if event['title']:
+                status += f" - {event['title']}"
+            # Sources run in parallel, so the run ends with the slowest one
+            etas = [progress[2] for progress in self.source_progress.values() if progress[2] is not None]
+            if etas:
+                status += f" (about {format_duration(max(etas))} left)"
+            self.status_var.set(status if not self.scraper.progress.cancelled else "Cancelling after the current job...")
+
+            if job := event['job']:
+                self.add_job_row(job)
+        elif event['type'] in ('done', 'error'):
+            self.finish_scrape(event)
+
+    def add_job_row(self, job):
+        """Show a rated job in the live jobs table"""
+        salary = f"${job['salary_value']:,.0f}" if job.get('salary_value') else ""
+        match = f"{job['match_score']:.0f}" if job.get('match_score') is not None else ""
+        item = self.jobs_tree.insert('', tk.END, values=(
+            job.get('title'), job.get('company'), salary, job.get('rating') or "", match, job.get('source')
+        ))
+        self.jobs_tree.see(item)
+        self.job_urls[item] = job.get('url')
+
+    def open_scraped_job(self, event):
+        if (item := self.jobs_tree.focus()) in self.job_urls and self.job_urls[item]:
+            webbrowser.open(self.job_urls[item])
+
+    def finish_scrape(self, event):
+        """Re-enable the controls once the worker thread has finished"""
+        self.scrape_thread = None
+        self.submit_button.config(state='normal')
+        self.rerate_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+        if self.closing:
+            return
+
+        if event['type'] == 'error':
+            self.status_var.set("Scrape failed")
+            messagebox.showerror("Error", f"An error occurred: {event['error']}")
+        elif event.get('cancelled'):
+            self.status_var.set(f"Cancelled after {len(self.job_urls)} jobs")
+            messagebox.showinfo("Cancelled", "Job scraping was cancelled. Jobs found so far were saved; "
+                                "tick Resume last run to continue.")
+        else:
+            self.progress_bar.config(value=self.progress_bar['maximum'])
+            self.status_var.set(f"Finished: {len(self.job_urls)} jobs")
+            messagebox.showinfo("Success", "Job scraping completed successfully!")
+
+    def rerate_saved_results(self):
+        """Re-rate a saved results file with the current rating settings, without scraping"""
+        filepath = filedialog.askopenfilename(
+            title="Select Results File",
+            initialdir=os.path.expanduser('~/Documents'),
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not filepath:
+            return
+            
+        try:
+            self.scraper.salary_range = (
+                int(self.salary_min_entry.get() or 0),
+                int(self.salary_max_entry.get() or 0)
+            )
+            self.scraper.top_percent = float(self.top_percent_entry.get() or 10)
+            self.scraper.bottom_percent = float(self.bottom_percent_entry.get() or 10)
+            self.scraper.experience_levels = [level for level, var in self.exp_vars.items() if var.get()]
+            self.scraper.require_experience = self.experience_req_var.get()
+            
+            df = self.scraper.rerate_results(filepath)
+            counts = df['rating'].value_counts().sort_index()
+            summary = "\n".join(f"Rating {rating}: {count}" for rating, count in counts.items())
+            messagebox.showinfo("Re-rate Complete", f"Re-rated {len(df)} jobs.\n\n{summary}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not re-rate results: {str(e)}")
 
     def get_job_summary(self, job):
         """Format job details for display"""
@@ -457,6 +654,79 @@ class JobScraperGUI:
         # Join with newlines and spaces between tags
         return "\n\n".join(details)
 
+    def open_search_window(self):
+        """Open a window that searches every job scraped so far without a new scrape"""
+        index = self.scraper.get_job_index()
+        if index is None:
+            messagebox.showerror("Error", "The job index is not available")
+            return
+
+        search_window = tk.Toplevel(self.master)
+        search_window.title("Search Saved Jobs")
+
+        query_frame = ttk.Frame(search_window, padding="5")
+        query_frame.pack(fill=tk.X)
+        ttk.Label(query_frame, text="Keywords:").grid(row=0, column=0, sticky=tk.W)
+        keywords_entry = ttk.Entry(query_frame, width=30)
+        keywords_entry.grid(row=0, column=1, padx=5, sticky=tk.W)
+        ttk.Label(query_frame, text="Skills (comma-separated):").grid(row=1, column=0, sticky=tk.W)
+        skills_entry = ttk.Entry(query_frame, width=30)
+        skills_entry.grid(row=1, column=1, padx=5, sticky=tk.W)
+        ttk.Label(query_frame, text="Salary Range:").grid(row=2, column=0, sticky=tk.W)
+        salary_frame = ttk.Frame(query_frame)
+        salary_frame.grid(row=2, column=1, padx=5, sticky=tk.W)
+        min_salary_entry = ttk.Entry(salary_frame, width=12)
+        min_salary_entry.pack(side=tk.LEFT)
+        ttk.Label(salary_frame, text=" to ").pack(side=tk.LEFT)
+        max_salary_entry = ttk.Entry(salary_frame, width=12)
+        max_salary_entry.pack(side=tk.LEFT)
+
+        status_var = tk.StringVar(value=f"{len(index)} jobs indexed")
+        ttk.Label(search_window, textvariable=status_var).pack(anchor=tk.W, padx=5)
+
+        columns = ('title', 'company', 'salary', 'source', 'last_seen')
+        results_tree = ttk.Treeview(search_window, columns=columns, show='headings', height=15)
+        for column, heading, width in zip(columns, ("Title", "Company", "Salary", "Source", "Last Seen"),
+                                          (260, 160, 90, 70, 80)):
+            results_tree.heading(column, text=heading)
+            results_tree.column(column, width=width)
+        results_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        urls = {}
+
+        def run_search(event=None):
+            try:
+                min_salary = float(min_salary_entry.get()) if min_salary_entry.get().strip() else None
+                max_salary = float(max_salary_entry.get()) if max_salary_entry.get().strip() else None
+            except ValueError:
+                messagebox.showerror("Error", "Salary must be a number", parent=search_window)
+                return
+            skills = [skill.strip() for skill in skills_entry.get().split(",") if skill.strip()]
+
+            start_time = time.perf_counter()
+            jobs = index.search(keywords=keywords_entry.get().strip() or None, skills=skills,
+                                min_salary=min_salary, max_salary=max_salary)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+            results_tree.delete(*results_tree.get_children())
+            urls.clear()
+            for job in jobs:
+                salary = f"${job['salary_value']:,.0f}" if job['salary_value'] else ""
+                item = results_tree.insert('', tk.END, values=(
+                    job['title'], job['company'], salary, job['source'], job['last_seen']
+                ))
+                urls[item] = job['url']
+            status_var.set(f"{len(jobs)} matching jobs ({elapsed_ms:.1f} ms)")
+
+        def open_job(event):
+            if (item := results_tree.focus()) in urls:
+                webbrowser.open(urls[item])
+
+        ttk.Button(query_frame, text="Search", command=run_search).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        for entry in (keywords_entry, skills_entry, min_salary_entry, max_salary_entry):
+            entry.bind('<Return>', run_search)
+        results_tree.bind('<Double-1>', open_job)
+        run_search()
+
     def open_linkedin_login_window(self):
         # Create a new window for LinkedIn login
         login_window = tk.Toplevel(self.master)
@@ -483,27 +753,11 @@ class JobScraperGUI:
         ttk.Button(login_window, text="Save", command=save_credentials).pack(pady=10)
 
     def setup_driver(self):
-        """Set up undetected ChromeDriver"""
+        """Lease a warm ChromeDriver from the scraper's driver pool"""
         try:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
-                self.driver = None
-                self.wait = None
-
-            options = uc.ChromeOptions()
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-extensions')
-            
-            self.driver = uc.Chrome(options=options)
-            self.wait = WebDriverWait(self.driver, 10)
-            self.scraper.driver = self.driver
-            self.scraper.wait = self.wait
+            self.scraper.setup_driver()
+            self.driver = self.scraper.driver
+            self.wait = self.scraper.wait
             return self.driver
         except Exception as e:
             print(f"Error setting up ChromeDriver: {str(e)}")
@@ -513,21 +767,12 @@ class JobScraperGUI:
         """Handle page load with retries"""
         if not self.driver or not self.wait:
             self.setup_driver()
-            
-        for attempt in range(max_retries):
-            try:
-                self.driver.get(url)
-                time.sleep(random.uniform(1, 2))
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                return True
-            except Exception as e:
-                print(f"Error loading page (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(random.uniform(1, 3))
-                else:
-                    return False
+        return self.scraper.handle_page_load(url, max_retries=max_retries)
 
     def login_to_linkedin(self):
+        """Log in to LinkedIn in a pooled browser; raises if the login fails"""
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
+        from selenium.webdriver.support import expected_conditions as EC
         try:
             # Set up the driver if not already set up
             if not self.driver or not self.wait:
@@ -539,61 +784,45 @@ class JobScraperGUI:
             
             try:
                 # Wait for and find login elements
-                email_input = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
-                password_input = self.wait.until(EC.presence_of_element_located((By.ID, "password")))
+                email_input = self.wait.until(EC.presence_of_element_located(('id', "username")))
+                password_input = self.wait.until(EC.presence_of_element_located(('id', "password")))
                 
                 # Enter credentials
                 email_input.send_keys(self.linkedin_email)
                 password_input.send_keys(self.linkedin_password)
                 password_input.submit()
                 
-                # Wait for login to complete
+                # Wait for login to complete and the landing page to load
                 self.wait.until(EC.url_changes("https://www.linkedin.com/login"))
-                time.sleep(2)  # Additional wait for page to stabilize
+                self.scraper.wait_for('linkedin_login', self.scraper._document_ready)
                 
                 return True
             except (TimeoutException, NoSuchElementException) as e:
                 raise Exception(f"Login elements not found: {str(e)}")
                 
         except Exception as e:
-            messagebox.showerror("Login Error", f"Failed to log in to LinkedIn: {str(e)}")
             if self.driver:
-                self.driver.quit()
-                self.driver = None
-                self.wait = None
-            return False
+                self.cleanup_driver()
+            raise Exception(f"Failed to log in to LinkedIn: {str(e)}")
 
     def cleanup_driver(self):
-        """Clean up the driver instance safely."""
-        if hasattr(self, 'driver') and self.driver and not self._driver_shared:
-            try:
-                # Store window handles before quitting
-                try:
-                    handles = self.driver.window_handles
-                    if handles:
-                        # Switch to main window and execute script to prevent auto-close
-                        self.driver.switch_to.window(handles[0])
-                        self.driver.execute_script("window.onbeforeunload = function() { return null; };")
-                except Exception:
-                    pass  # Ignore any errors when trying to access window handles
-                
-                # Close all windows first
-                try:
-                    self.driver.close()
-                except Exception:
-                    pass
-
-                # Then quit the driver
-                try:
-                    self.driver.quit()
-                except Exception:
-                    pass
-            finally:
-                self.driver = None
-                self.wait = None
+        """Return the driver to the scraper's driver pool."""
+        try:
+            if hasattr(self, 'scraper') and self.driver is self.scraper.driver:
+                self.scraper.release_driver()
+        finally:
+            self.driver = None
+            self.wait = None
 
     def on_closing(self):
         """Handle window closing event"""
+        # Let a running scrape stop cleanly first; its browsers are released by the worker thread
+        if self.scrape_thread is not None:
+            self.closing = True
+            self.scraper.progress.cancel()
+            self.status_var.set("Stopping the scrape before closing...")
+            self.master.after(200, self.on_closing)
+            return
         try:
             # Save settings before closing
             self.save_settings()
@@ -603,11 +832,18 @@ class JobScraperGUI:
                 self.scraper.cleanup_driver()
             if hasattr(self, 'driver'):
                 self.cleanup_driver()
+            shutdown_driver_pool()
         finally:
             # Destroy the window
             self.master.destroy()
 
+def format_duration(seconds):
+    """Format a number of seconds as e.g. '2m 05s'"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
 if __name__ == '__main__':
+    configure_logging()
     try:
         root = tk.Tk()
         gui = JobScraperGUI(root)
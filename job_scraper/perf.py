@@ -0,0 +1,106 @@
+"""Timing spans and counters for one scrape run, summarized into a JSON performance report."""
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+
+
+def percentile(sorted_values, fraction):
+    """Linearly interpolated percentile of an already sorted list, e.g. fraction=0.95"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class RunProfiler:
+    """
+    Collects how long each stage of a scrape run takes, plus event counters.
+
+    Stages are timed with span() or the timed() method decorator and may nest
+    (a page load includes its driver.get and wait), so stage totals can add
+    up to more than the run time. Safe to share between the threads and
+    source scrapers of one run.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.datetime.now()
+        self._start = time.perf_counter()
+        self.timings = {}  # stage -> durations in seconds
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, stage):
+        """Time the enclosed block as one occurrence of stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self.timings.setdefault(stage, []).append(seconds)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def elapsed(self):
+        """Seconds since the run started"""
+        return time.perf_counter() - self._start
+
+    def stage_stats(self, prefix=''):
+        """Count, total, p50, p95 and max seconds per stage whose name starts with prefix"""
+        with self._lock:
+            timings = {stage: sorted(values) for stage, values in self.timings.items() if stage.startswith(prefix)}
+        return {
+            stage: {
+                'count': len(values),
+                'total': round(sum(values), 4),
+                'p50': round(percentile(values, 0.5), 4),
+                'p95': round(percentile(values, 0.95), 4),
+                'max': round(values[-1], 4),
+            }
+            for stage, values in sorted(timings.items())
+        }
+
+    def report(self, jobs):
+        """The run summary as a JSON-serializable dict; jobs is the number of jobs processed"""
+        elapsed = self.elapsed()
+        with self._lock:
+            counters = dict(sorted(self.counters.items()))
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'elapsed_seconds': round(elapsed, 3),
+            'jobs': jobs,
+            'jobs_per_minute': round(jobs / elapsed * 60, 2) if elapsed > 0 else None,
+            'stages': self.stage_stats(),
+            'counters': counters,
+        }
+
+    def write_report(self, path, jobs):
+        """Write the report as JSON to path and return it"""
+        report = self.report(jobs)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def timed(stage):
+    """Method decorator that records every call as a span of self.profiler"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,57 @@
+"""Progress events and cancellation shared by the scrapers of one run."""
+import threading
+import time
+
+
+class ProgressReporter:
+    """
+    Sends progress events for a scrape to a callback and carries the run's cancel flag.
+
+    Events are dicts with a 'type' ('page', 'job' or 'status') and the
+    'source' they belong to. The callback is called from the scraping
+    threads, so it should only hand the event over, e.g. with queue.put.
+    One reporter is shared by all source scrapers of a multi-source run.
+    """
+
+    def __init__(self, callback=None, cancel_event=None):
+        self.callback = callback
+        self.cancel_event = cancel_event or threading.Event()
+        self._job_rates = {}  # source -> (first done count, time it was reported)
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        """Ask every scraper using this reporter to stop after its current job"""
+        self.cancel_event.set()
+
+    def emit(self, event_type, source, **details):
+        if self.callback is None:
+            return
+        try:
+            self.callback({'type': event_type, 'source': source, **details})
+        except Exception as e:
+            print(f"Warning: Could not report progress: {str(e)}")
+
+    def page(self, source, page, pages):
+        """Report that result page number page (1-based) of pages is being loaded"""
+        self.emit('page', source, page=page, pages=pages)
+
+    def job(self, source, done, total, title=None, job=None):
+        """
+        Report that done of total jobs are finished. job is the stored record,
+        or None if the job was skipped. The ETA in seconds is estimated from
+        the rate since the first job event of the source.
+        """
+        now = time.time()
+        with self._lock:
+            first_done, first_time = self._job_rates.setdefault(source, (done, now))
+        eta = None
+        if done > first_done:
+            eta = (now - first_time) / (done - first_done) * max(0, total - done)
+        self.emit('job', source, done=done, total=total, title=title, job=job, eta=eta)
+
+    def status(self, source, message):
+        self.emit('status', source, message=message)
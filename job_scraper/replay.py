@@ -0,0 +1,462 @@
+"""
+Record the pages a scrape sees and replay them offline, to benchmark the
+scraping pipeline without network access.
+
+    python replay.py record fixtures/ --websites Indeed LinkedIn --job-title "BI Developer" --salary 100000 130000
+    python replay.py bench fixtures/ --repeat 5 --json bench.json
+    python replay.py parsers fixtures/
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.parse
+
+from job_scraper import (
+    JobScraper, LINKEDIN_CLICK_CARD_JS, LINKEDIN_DETAILS_SNAPSHOT_JS, configure_logging,
+    parse_linkedin_cards, parse_linkedin_details
+)
+from checkpoints import ScrapeCheckpoint
+from html_parsing import available_parsers, parse_indeed_results, parse_indeed_detail
+
+CARDS_SNAPSHOT_JS = "return arguments[0].outerHTML"
+
+# JobScraper settings saved with the fixtures, so a replay repeats the recorded search
+RECORDED_SETTINGS = (
+    'keywords', 'job_title', 'salary_range', 'remote_only', 'location', 'distance',
+    'experience_levels', 'education_level', 'include_no_salary', 'top_percent',
+    'bottom_percent', 'require_experience', 'prefilter_cards'
+)
+
+
+class MemoryCheckpoint(ScrapeCheckpoint):
+    """
+    Checkpoint that is never loaded or written, so recording and replaying
+    neither touch the user's checkpoints nor time checkpoint writes.
+    """
+
+    def load(self):
+        return False
+
+    def save(self):
+        pass
+
+    def clear(self):
+        pass
+
+
+class FixtureStore:
+    """
+    A directory of recorded HTML, one file per page, indexed in index.json.
+    Keys are 'page <url>' for page sources, 'cards <url>' for LinkedIn result
+    list snapshots and 'details <job id>' for LinkedIn details pane snapshots.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pages = {}  # Pages read so far, so replays do not touch the disk twice
+        index_path = os.path.join(path, 'index.json')
+        if os.path.exists(index_path):
+            with open(index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {'websites': [], 'settings': {}, 'pages': {}}
+
+    def save(self, key, html):
+        filename = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.html'
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        with self._lock:
+            self.index['pages'][key] = filename
+            self._pages[key] = html
+            self.write_index()
+
+    def get(self, key):
+        """Recorded HTML for key, or None if it was never recorded"""
+        if key in self._pages:
+            return self._pages[key]
+        if (filename := self.index['pages'].get(key)) is None:
+            return None
+        with open(os.path.join(self.path, filename), encoding='utf-8') as f:
+            html = self._pages[key] = f.read()
+        return html
+
+    def write_index(self):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2)
+
+    def __len__(self):
+        return len(self.index['pages'])
+
+
+class RecordingDriver:
+    """Wraps a real WebDriver and saves every page source and LinkedIn snapshot the scraper reads"""
+
+    def __init__(self, driver, fixtures):
+        self._driver = driver
+        self._fixtures = fixtures
+        self._url = None
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        self._url = url
+        return self._driver.get(url)
+
+    @property
+    def page_source(self):
+        html = self._driver.page_source
+        self._fixtures.save(f'page {self._url}', html)
+        return html
+
+    def execute_script(self, script, *args):
+        result = self._driver.execute_script(script, *args)
+        if script == CARDS_SNAPSHOT_JS and result:
+            self._fixtures.save(f'cards {self._url}', result)
+        elif script == LINKEDIN_DETAILS_SNAPSHOT_JS and result:
+            self._fixtures.save(f'details {args[0]}', result['html'])
+        return result
+
+
+class ReplayElement:
+    """Stand-in for a WebElement of a replayed page"""
+
+    def __init__(self, html):
+        self.html = html
+        self.text = ''
+
+    def click(self):
+        pass
+
+    def send_keys(self, *keys):
+        pass
+
+    def get_attribute(self, name):
+        return None
+
+
+class ReplayDriver:
+    """
+    Fake WebDriver that serves recorded pages instead of loading them.
+    Every wait is satisfied at once if the page was recorded; pages that were
+    not recorded are empty, which ends a scrape the same way as no results.
+    """
+
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
+        self.current_url = 'about:blank'
+        self.window_handles = ['replay']
+        self.current_window_handle = 'replay'
+        self._job_id = None
+        self.page_loads = 0
+
+    def get(self, url):
+        self.current_url = url
+        self._job_id = None
+        self.page_loads += 1
+
+    def _document(self):
+        return (self.fixtures.get(f'page {self.current_url}')
+                or self.fixtures.get(f'cards {self.current_url}') or '')
+
+    @property
+    def page_source(self):
+        return self._document() or '<html><body></body></html>'
+
+    def find_element(self, by=None, value=None):
+        from selenium.common.exceptions import NoSuchElementException
+        if not self._document():
+            raise NoSuchElementException(f'{value} not in replayed page {self.current_url}')
+        return ReplayElement(self._document())
+
+    def find_elements(self, by=None, value=None):
+        return [ReplayElement(document)] if (document := self._document()) else []
+
+    def execute_script(self, script, *args):
+        if script == CARDS_SNAPSHOT_JS:
+            return args[0].html if isinstance(args[0], ReplayElement) else None
+        if script == LINKEDIN_CLICK_CARD_JS:
+            self._job_id = args[0]
+            return self.fixtures.get(f'details {args[0]}') is not None
+        if script == LINKEDIN_DETAILS_SNAPSHOT_JS:
+            # Recorded panes were matched to their job when they were recorded
+            html = self.fixtures.get(f'details {self._job_id}')
+            return {'html': html, 'verified': True, 'description': None} if html else None
+        if 'readyState' in script:
+            return 'complete'
+        return None
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class RecordingScraper(JobScraper):
+    """JobScraper that renders every page in its own Chrome and records it to fixtures"""
+    checkpoint_class = MemoryCheckpoint
+
+    def __init__(self, fixtures=None, **kwargs):
+        kwargs.update(use_driver_pool=False, fetch_mode='browser', use_cache=False)
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+
+    def _create_driver(self):
+        driver, pid = JobScraper._create_driver()
+        return RecordingDriver(driver, self.fixtures), pid
+
+    def _source_scraper(self):
+        child = super()._source_scraper()
+        child.fixtures = self.fixtures
+        return child
+
+
+class ReplayScraper(JobScraper):
+    """JobScraper that replays recorded pages and writes its results to output_dir"""
+    checkpoint_class = MemoryCheckpoint
+
+    def __init__(self, fixtures=None, output_dir=None, **kwargs):
+        kwargs.update(use_driver_pool=False, fetch_mode='browser', use_cache=False,
+                      use_index=False, politeness_delay=(0, 0))
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+        self.output_dir = output_dir
+
+    def _create_driver(self):
+        return ReplayDriver(self.fixtures), None
+
+    @staticmethod
+    def _card_count_settled():
+        # Recorded card lists are complete; there is nothing left to load by scrolling
+        return lambda driver: True
+
+    def results_path(self, source, extension=None):
+        return os.path.join(self.output_dir, os.path.basename(super().results_path(source, extension)))
+
+    def _source_scraper(self):
+        child = super()._source_scraper()
+        child.fixtures, child.output_dir = self.fixtures, self.output_dir
+        return child
+
+
+def record(fixtures, websites, settings, email=None, password=None):
+    """
+    Run a live scrape with the given JobScraper settings and save every page
+    it reads, along with the scraper's RECORDED_SETTINGS (defaults included).
+    """
+    scraper = RecordingScraper(fixtures, **settings)
+    fixtures.index['websites'] = websites
+    fixtures.index['settings'] = {name: getattr(scraper, name) for name in RECORDED_SETTINGS}
+    fixtures.write_index()
+    try:
+        scraper.scrape_jobs(websites, email=email, password=password)
+    finally:
+        scraper.cleanup_driver()
+    return scraper.job_count
+
+
+def replay_once(fixtures, output_dir, quiet=True):
+    """Replay the recorded scrape once; returns (jobs processed, seconds, scraper)"""
+    settings = {name: value for name, value in fixtures.index['settings'].items() if name in RECORDED_SETTINGS}
+    scraper = ReplayScraper(fixtures, output_dir, **settings)
+    output = io.StringIO() if quiet else None
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        scraper.scrape_jobs(fixtures.index['websites'])
+    elapsed = time.perf_counter() - start_time
+    return scraper.job_count, elapsed, scraper
+
+
+def bench(fixtures, repeat=5, quiet=True):
+    """
+    Replay the recorded scrape repeat times and measure jobs per second, then
+    once more under tracemalloc for the peak and retained memory per job.
+    Returns the results as a dict.
+    """
+    output_dir = tempfile.mkdtemp(prefix='job_scraper_bench_')
+    try:
+        replay_once(fixtures, output_dir, quiet)  # Warm up imports and caches
+        runs = []
+        scraper = None
+        for _ in range(repeat):
+            jobs, elapsed, scraper = replay_once(fixtures, output_dir, quiet)
+            runs.append(elapsed)
+
+        tracemalloc.start()
+        try:
+            jobs, _, traced_scraper = replay_once(fixtures, output_dir, quiet)
+            retained, peak = tracemalloc.get_traced_memory()
+            del traced_scraper
+        finally:
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    runs.sort()
+    median = runs[len(runs) // 2]
+    return {
+        'websites': fixtures.index['websites'],
+        'pages': len(fixtures),
+        'jobs': jobs,
+        'repeat': repeat,
+        'median_seconds': round(median, 4),
+        'best_seconds': round(runs[0], 4),
+        'jobs_per_second': round(jobs / median, 1) if median else None,
+        'peak_kb_per_job': round(peak / 1024 / jobs, 1) if jobs else None,
+        'retained_kb_per_job': round(retained / 1024 / jobs, 1) if jobs else None,
+        'stages': scraper.profiler.stage_stats() if scraper else {},
+    }
+
+
+def _page_kind(key):
+    """Which parser a recorded page goes through"""
+    kind, _, target = key.partition(' ')
+    if kind == 'cards':
+        return 'linkedin_cards'
+    if kind == 'details':
+        return 'linkedin_details'
+    if 'indeed.' in urllib.parse.urlparse(target).netloc:
+        return 'indeed_results' if urllib.parse.urlparse(target).path == '/jobs' else 'indeed_detail'
+    return None
+
+
+# page kind -> parse(html, parser, strained); LinkedIn snapshots are already just the list or pane
+PAGE_PARSERS = {
+    'indeed_results': parse_indeed_results,
+    'indeed_detail': parse_indeed_detail,
+    'linkedin_cards': lambda html, parser, strained: parse_linkedin_cards(html, parser),
+    'linkedin_details': lambda html, parser, strained: parse_linkedin_details(html, parser),
+}
+
+
+def bench_parsers(fixtures, repeat=5, parsers=None):
+    """
+    Parse every recorded page with each HTML backend, in full and strained
+    to the needed sections, and measure the median parse time and the
+    average tracemalloc peak per page. Returns one dict per kind, backend and mode.
+    """
+    pages = {}
+    for key in fixtures.index['pages']:
+        if kind := _page_kind(key):
+            pages.setdefault(kind, []).append(fixtures.get(key))
+
+    results = []
+    for kind, htmls in sorted(pages.items()):
+        parse = PAGE_PARSERS[kind]
+        modes = (False, True) if kind.startswith('indeed') else (False,)
+        for parser in parsers or available_parsers():
+            for strained in modes:
+                runs = []
+                for _ in range(repeat):
+                    start_time = time.perf_counter()
+                    for html in htmls:
+                        parse(html, parser, strained)
+                    runs.append((time.perf_counter() - start_time) / len(htmls))
+                runs.sort()
+
+                peaks = []
+                tracemalloc.start()
+                try:
+                    for html in htmls:
+                        tracemalloc.reset_peak()
+                        before = tracemalloc.get_traced_memory()[0]
+                        parse(html, parser, strained)
+                        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+                finally:
+                    tracemalloc.stop()
+
+                results.append({
+                    'page': kind,
+                    'parser': parser,
+                    'mode': 'strained' if strained else 'full',
+                    'pages': len(htmls),
+                    'avg_page_kb': round(sum(len(html) for html in htmls) / len(htmls) / 1024, 1),
+                    'median_ms_per_page': round(runs[len(runs) // 2] * 1000, 3),
+                    'peak_kb_per_page': round(sum(peaks) / len(peaks) / 1024, 1),
+                })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record scrapes to HTML fixtures and benchmark replays of them")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="Run a live scrape and save the pages it reads")
+    record_parser.add_argument('fixtures', help="Directory for the recorded pages")
+    record_parser.add_argument('--websites', nargs='+', default=['Indeed'], choices=['Indeed', 'LinkedIn'])
+    record_parser.add_argument('--job-title', default=None)
+    record_parser.add_argument('--keywords', nargs='*', default=[])
+    record_parser.add_argument('--salary', nargs=2, type=int, metavar=('MIN', 'MAX'), default=(100000, 130000))
+    record_parser.add_argument('--location', default=None, help="Search this location instead of remote jobs")
+    record_parser.add_argument('--linkedin-email', default=None)
+
+    bench_parser = subparsers.add_parser('bench', help="Replay recorded pages and report throughput and memory per job")
+    bench_parser.add_argument('fixtures', help="Directory of recorded pages")
+    bench_parser.add_argument('--repeat', type=int, default=5)
+    bench_parser.add_argument('--json', dest='json_path', default=None, help="Also write the results to this JSON file")
+    bench_parser.add_argument('--verbose', action='store_true', help="Show the scraper's output")
+
+    parsers_parser = subparsers.add_parser('parsers', help="Compare HTML parse time and memory per page for each backend")
+    parsers_parser.add_argument('fixtures', help="Directory of recorded pages")
+    parsers_parser.add_argument('--repeat', type=int, default=5)
+    parsers_parser.add_argument('--json', dest='json_path', default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    fixtures = FixtureStore(args.fixtures)
+    if args.command == 'record':
+        configure_logging()
+        password = None
+        if args.linkedin_email:
+            import getpass
+            password = getpass.getpass("LinkedIn password: ")
+        settings = {
+            'keywords': args.keywords, 'job_title': args.job_title, 'salary_range': list(args.salary),
+            'remote_only': args.location is None, 'location': args.location,
+        }
+        jobs = record(fixtures, args.websites, settings, email=args.linkedin_email, password=password)
+        print(f"Recorded {len(fixtures)} pages ({jobs} jobs) to {args.fixtures}")
+        return
+
+    if not len(fixtures):
+        parser.error(f"No recorded pages in {args.fixtures}")
+    if args.command == 'parsers':
+        results = bench_parsers(fixtures, repeat=args.repeat)
+        print(f"{'page':<18}{'parser':<13}{'mode':<10}{'pages':>6}{'KB/page':>9}{'ms/page':>9}{'peak KB':>9}")
+        for row in results:
+            print(f"{row['page']:<18}{row['parser']:<13}{row['mode']:<10}{row['pages']:>6}{row['avg_page_kb']:>9}"
+                  f"{row['median_ms_per_page']:>9}{row['peak_kb_per_page']:>9}")
+        if args.json_path:
+            with open(args.json_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+        return
+
+    results = bench(fixtures, repeat=args.repeat, quiet=not args.verbose)
+    print(f"{results['jobs']} jobs from {results['pages']} recorded pages ({', '.join(results['websites'])})")
+    print(f"  median {results['median_seconds']:.3f}s, best {results['best_seconds']:.3f}s "
+          f"over {results['repeat']} runs: {results['jobs_per_second']} jobs/s")
+    print(f"  memory per job: {results['peak_kb_per_job']} KB peak, {results['retained_kb_per_job']} KB retained")
+    print("  slowest stages (total seconds per run):")
+    for stage, stats in sorted(results['stages'].items(), key=lambda item: -item[1]['total'])[:8]:
+        print(f"    {stage}: {stats['total']:.4f}s over {stats['count']} calls, p95 {stats['p95'] * 1000:.2f} ms")
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
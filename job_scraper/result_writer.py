@@ -0,0 +1,148 @@
+"""Streaming writer that appends scraped jobs to a results file as they are rated."""
+import csv
+import importlib.util
+import json
+import os
+
+RESULT_COLUMNS = [
+    'title', 'company', 'summary', 'salary_text', 'salary_value',
+    'rating', 'company_rating', 'match_score', 'source', 'url'
+]
+
+# Column types for Parquet output; any other column is written as a string
+NUMERIC_COLUMNS = {
+    'salary_value': 'float64',
+    'rating': 'int64',
+    'company_rating': 'float64',
+    'match_score': 'float64',
+}
+
+SUPPORTED_FORMATS = ('csv', 'jsonl', 'parquet')
+
+
+def check_format(fmt):
+    """Raise ValueError if fmt is not a supported results format or needs a library that is not installed"""
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported results format: {fmt}")
+    if fmt == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        raise ValueError("The parquet results format requires pyarrow (pip install pyarrow)")
+
+
+class ResultWriter:
+    """
+    Append job records to a results file one at a time.
+
+    Records are written to '<path>.part' and flushed to disk every flush_every
+    records, so a crash loses at most the unflushed tail and the partial file is
+    left behind for inspection. close() flushes the last records and atomically
+    renames the file to its final path; close(complete=False) leaves it as the
+    partial file. Rating counts are kept as records are
+    written so the run summary does not need to re-read the results.
+    """
+
+    def __init__(self, path, fmt=None, flush_every=10, columns=None):
+        self.path = path
+        self.format = (fmt or os.path.splitext(path)[1].lstrip('.') or 'csv').lower()
+        check_format(self.format)
+        self.temp_path = path + '.part'
+        self.columns = list(columns or RESULT_COLUMNS)
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self.rating_counts = {}
+        self._unflushed = []
+        self._closed = False
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if self.format == 'parquet':
+            # Parquet row groups are written on each flush
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._pa = pa
+            self._schema = pa.schema([
+                (column, getattr(pa, NUMERIC_COLUMNS.get(column, 'string'))())
+                for column in self.columns
+            ])
+            self._parquet = pq.ParquetWriter(self.temp_path, self._schema)
+            self._file = None
+        else:
+            self._file = open(self.temp_path, 'w', newline='', encoding='utf-8')
+            if self.format == 'csv':
+                self._csv = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore')
+                self._csv.writeheader()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def write(self, record):
+        """Append one job record, flushing to disk every flush_every records"""
+        if self._closed:
+            raise ValueError("Cannot write to a closed ResultWriter")
+
+        self._unflushed.append(record)
+        self.count += 1
+        rating = record.get('rating')
+        self.rating_counts[rating] = self.rating_counts.get(rating, 0) + 1
+
+        if len(self._unflushed) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records and force them to disk"""
+        if not self._unflushed:
+            return
+        records, self._unflushed = self._unflushed, []
+
+        if self.format == 'parquet':
+            columns = {
+                column: [self._parquet_value(record.get(column), column) for record in records]
+                for column in self.columns
+            }
+            self._parquet.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+            return
+
+        if self.format == 'csv':
+            self._csv.writerows(records)
+        else:
+            for record in records:
+                row = {column: record.get(column) for column in self.columns}
+                self._file.write(json.dumps(row) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @staticmethod
+    def _parquet_value(value, column):
+        """Coerce a value to the column's Parquet type"""
+        if value is None:
+            return None
+        if column in NUMERIC_COLUMNS:
+            return int(value) if NUMERIC_COLUMNS[column] == 'int64' else float(value)
+        return str(value)
+
+    def _close_file(self):
+        if self.format == 'parquet':
+            self._parquet.close()
+        else:
+            self._file.close()
+        self._closed = True
+
+    def close(self, complete=True):
+        """
+        Flush remaining records and atomically move the file into place.
+        With complete=False the records are kept in the partial file instead.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._close_file()
+        if complete:
+            os.replace(self.temp_path, self.path)
+
+    def discard(self):
+        """Close the partial file, if still open, and delete it instead of moving it into place"""
+        if not self._closed:
+            self._close_file()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
@@ -0,0 +1,106 @@
+"""
+Salary strings as shown on Indeed and LinkedIn, with what the original
+extractor and the current parse_salary return for each.
+"""
+import re
+
+# Rows of (text, original extract_salary result, parse_salary result, reason for a difference)
+HOURLY_RANGE = "ranges with an hourly period were not converted to yearly"
+MONTHLY_RANGE = "ranges with a monthly period were not converted to yearly"
+LOWERCASE_K = "a lowercase k suffix was ignored"
+
+CORPUS = [
+    ("$100,000 - $130,000 a year", 115000.0, 115000.0, None),
+    ("$95,000 a year", 95000.0, 95000.0, None),
+    ("From $85,000 a year", 85000.0, 85000.0, None),
+    ("Up to $140,000 a year", 140000.0, 140000.0, None),
+    ("$120,000 - $150,000 per year", 135000.0, 135000.0, None),
+    ("$110,000 annually", 110000.0, 110000.0, None),
+    ("$98,500.50 - $120,000.00 a year", 109250.25, 109250.25, None),
+    ("Pay\n$105,000 - $125,000 a year", 115000.0, 115000.0, None),
+    ("$100K/yr - $120K/yr", 110000.0, 110000.0, None),
+    ("$150K/yr - $180K/yr Matches your job preferences", 165000.0, 165000.0, None),
+    ("$120K - $140K", 130000.0, 130000.0, None),
+    ("$90K/yr", 90000.0, 90000.0, None),
+    ("Compensation Range: $130,000 - $160,000", 145000.0, 145000.0, None),
+    ("$100,000 - $130,000", 115000.0, 115000.0, None),
+    ("$45 an hour", 93600.0, 93600.0, None),
+    ("$50 per hour", 104000.0, 104000.0, None),
+    ("$60/hr", 124800.0, 124800.0, None),
+    ("$55 hourly", 114400.0, 114400.0, None),
+    ("$8,000 a month", 96000.0, 96000.0, None),
+    ("$9,500 per month", 114000.0, 114000.0, None),
+    ("$45 - $55 an hour", 50.0, 104000.0, HOURLY_RANGE),
+    ("$60 - $70 per hour", 65.0, 135200.0, HOURLY_RANGE),
+    ("$50/hr - $65/hr", 119600.0, 119600.0, None),
+    ("$8,000 - $10,000 a month", 9000.0, 108000.0, MONTHLY_RANGE),
+    ("$150k - $180k", 165.0, 165000.0, LOWERCASE_K),
+    ("$120k a year", 120.0, 120000.0, LOWERCASE_K),
+    ("Not specified", None, None, None),
+    ("Competitive salary", None, None, None),
+    ("Full-time", None, None, None),
+    ("", None, None, None),
+    ("401(k) matching up to $5,000", None, None, None),
+]
+
+
+def original_extract_salary(text):
+    """JobScraper.extract_salary before the single-pattern rewrite, without its logging"""
+    if not text:
+        return None
+        
+    patterns = {
+        'yearly': [
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/yr)?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/yr)?(?:\s*(?:a year|annual|annually|/year|per year|/yr|yr))?',
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a year|annual|annually|/year|per year|/yr|yr))'
+        ],
+        'hourly': [
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/hr)?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:/hr)?(?:\s*(?:an hour|/hour|per hour|hourly|/hr|hr))?',
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:an hour|/hour|per hour|hourly|/hr|hr))'
+        ],
+        'monthly': [
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?\s*-\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a month|monthly|/month|per month))',
+            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)[K]?(?:\s*(?:a month|monthly|/month|per month))'
+        ]
+    }
+    
+    text = text.replace('\n', ' ').strip()
+    
+    def convert_to_number(value_str):
+        """Helper function to convert salary string to number"""
+        if not value_str:
+            return None
+        # Remove commas and convert to float
+        num = float(value_str.replace(',', ''))
+        # If K is in the original text for this number, multiply by 1000
+        if 'K' in text[text.find(value_str)-1:text.find(value_str)+len(value_str)+1]:
+            num *= 1000
+        return num
+    
+    for period, period_patterns in patterns.items():
+        for pattern in period_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                groups = match.groups()
+                
+                # Convert first number
+                salary1 = convert_to_number(groups[0])
+                
+                # Convert second number if it exists
+                salary2 = convert_to_number(groups[1]) if len(groups) > 1 and groups[1] else None
+                
+                # Calculate final salary
+                if salary2 is not None:
+                    salary = (salary1 + salary2) / 2  # Average of range
+                else:
+                    salary = salary1  # Single value
+                
+                # Convert to yearly
+                if period == 'hourly':
+                    salary *= 40 * 52  # 40-hour week
+                elif period == 'monthly':
+                    salary *= 12
+                
+                return salary
+                
+    return None
@@ -0,0 +1,124 @@
+"""Saving, loading and resuming scrape checkpoints."""
+import contextlib
+import io
+import json
+import os
+
+import pytest
+
+from checkpoints import ScrapeCheckpoint
+from progress import ProgressReporter
+
+PARAMS = {'q': 'BI Developer', 'l': 'Remote', 'start': 0}
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return ScrapeCheckpoint('Indeed', PARAMS, directory=str(tmp_path))
+
+
+def test_save_load_clear(tmp_path, checkpoint):
+    checkpoint.processed_urls.update({'https://example.com/1', 'https://example.com/2'})
+    checkpoint.job_cards.append({'title': 'BI Developer', 'url': 'https://example.com/2'})
+    checkpoint.complete_page(0)
+    checkpoint.add_job({'title': 'Analyst', 'url': 'https://example.com/1'})
+    assert not os.path.exists(checkpoint.path + '.tmp')
+
+    # Same search with the parameters in another order
+    loaded = ScrapeCheckpoint('Indeed', dict(reversed(PARAMS.items())), directory=str(tmp_path))
+    assert loaded.path == checkpoint.path
+    assert loaded.load()
+    assert loaded.next_page == 1
+    assert loaded.processed_urls == checkpoint.processed_urls
+    assert loaded.job_cards == checkpoint.job_cards
+    assert loaded.jobs == checkpoint.jobs
+
+    loaded.clear()
+    assert not os.path.exists(checkpoint.path)
+    loaded.clear()  # Clearing twice is fine
+    assert not ScrapeCheckpoint('Indeed', PARAMS, directory=str(tmp_path)).load()
+
+
+def test_other_search_has_its_own_file(tmp_path, checkpoint):
+    checkpoint.complete_page(0)
+    assert ScrapeCheckpoint('LinkedIn', PARAMS, directory=str(tmp_path)).path != checkpoint.path
+    assert ScrapeCheckpoint('Indeed', {**PARAMS, 'q': 'Analyst'}, directory=str(tmp_path)).path != checkpoint.path
+
+
+@pytest.mark.parametrize('content', ['{"last_completed_page": 2', '', '[1, 2]', 'null'])
+def test_corrupt_file_is_ignored(checkpoint, content, capsys):
+    os.makedirs(os.path.dirname(checkpoint.path), exist_ok=True)
+    with open(checkpoint.path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    assert not checkpoint.load()
+    assert checkpoint.next_page == 0
+    assert 'Warning' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('state', [
+    {'source': 'LinkedIn', 'search_params': PARAMS},
+    {'source': 'Indeed', 'search_params': {**PARAMS, 'q': 'Analyst'}},
+    {'source': 'Indeed'},
+])
+def test_checkpoint_of_another_search_is_ignored(checkpoint, state):
+    os.makedirs(os.path.dirname(checkpoint.path), exist_ok=True)
+    with open(checkpoint.path, 'w', encoding='utf-8') as f:
+        json.dump({**state, 'last_completed_page': 2, 'jobs': [{'title': 'Other'}]}, f)
+    assert not checkpoint.load()
+    assert checkpoint.next_page == 0
+    assert checkpoint.jobs == []
+
+
+class TestResume:
+    """A replayed scrape cancelled part way through and resumed from its checkpoint"""
+
+    @pytest.fixture(autouse=True)
+    def replay_fixtures(self):
+        pytest.importorskip('selenium')
+        from replay import RECORDED_SETTINGS, FixtureStore
+        from test_replay import FIXTURES_DIR
+        self.fixtures = FixtureStore(FIXTURES_DIR)
+        self.settings = {name: value for name, value in self.fixtures.index['settings'].items()
+                         if name in RECORDED_SETTINGS}
+
+    def run(self, tmp_path, website, resume_run=False, cancel_after=None):
+        from replay import ReplayScraper
+
+        class DiskCheckpoint(ScrapeCheckpoint):
+            def __init__(self, source, search_params):
+                super().__init__(source, search_params, directory=str(tmp_path / 'checkpoints'))
+
+        scraper = ReplayScraper(self.fixtures, str(tmp_path), resume_run=resume_run, **self.settings)
+        scraper.checkpoint_class = DiskCheckpoint
+
+        def cancel(event):
+            if event['type'] == 'job' and event['job'] and event['done'] == cancel_after:
+                scraper.progress.cancel()
+        scraper.progress = ProgressReporter(callback=cancel)
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.scrape_jobs([website])
+        return scraper
+
+    @pytest.mark.parametrize('website', ['Indeed', 'LinkedIn'])
+    def test_resume_after_cancel(self, tmp_path, website):
+        from test_replay import INDEED_JOBS, LINKEDIN_JOBS, job_tuples
+        expected = INDEED_JOBS if website == 'Indeed' else LINKEDIN_JOBS
+
+        cancelled = self.run(tmp_path, website, cancel_after=2)
+        assert job_tuples(cancelled.jobs) == expected[:2]
+        assert len(os.listdir(tmp_path / 'checkpoints')) == 1
+
+        resumed = self.run(tmp_path, website, resume_run=True)
+        assert job_tuples(resumed.jobs) == expected
+        # The two stored jobs come from the checkpoint; only the rest are fetched again
+        assert resumed.profiler.counters[f'resumed_jobs.{website}'] == 2
+        assert resumed.profiler.counters[f'jobs.{website}'] == len(expected) - 2
+        assert resumed.fetch_stats[website]['browser'] == len(expected) - 2
+        assert os.listdir(tmp_path / 'checkpoints') == []
+
+    def test_without_resume_starts_over(self, tmp_path):
+        from test_replay import INDEED_JOBS, job_tuples
+        self.run(tmp_path, 'Indeed', cancel_after=2)
+        fresh = self.run(tmp_path, 'Indeed')
+        assert job_tuples(fresh.jobs) == INDEED_JOBS
+        assert 'resumed_jobs.Indeed' not in fresh.profiler.counters
@@ -0,0 +1,205 @@
+"""DriverPool leasing, recycling and resetting with fake browser sessions."""
+import itertools
+
+import pytest
+
+import job_scraper
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Records what the pool does to a browser session"""
+
+    def __init__(self, number):
+        self.number = number
+        self.window_handles = ['main']
+        self.current_window = 'main'
+        self.cookies = {'li_at': 'session'}
+        self.local_storage = {'key': 'value'}
+        self.url = 'https://www.linkedin.com/jobs'
+        self.quit_called = False
+        self.cdp_available = True
+        self.responsive = True
+        self.switch_to = self
+
+    @property
+    def current_url(self):
+        if not self.responsive:
+            raise ConnectionError('session is gone')
+        return self.url
+
+    def window(self, handle):
+        self.current_window = handle
+
+    def close(self):
+        self.window_handles.remove(self.current_window)
+
+    def execute_script(self, script):
+        if 'localStorage.clear()' in script:
+            self.local_storage = {}
+
+    def execute_cdp_cmd(self, command, params):
+        if not self.cdp_available:
+            raise RuntimeError('not a Chromium driver')
+        if command == 'Network.clearBrowserCookies':
+            self.cookies = {}
+
+    def delete_all_cookies(self):
+        self.cookies = {}
+
+    def get(self, url):
+        if not self.responsive:
+            raise ConnectionError('session is gone')
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.drivers = []
+        self._numbers = itertools.count(1)
+
+    def __call__(self):
+        driver = FakeDriver(next(self._numbers))
+        self.drivers.append(driver)
+        return driver, driver.number
+
+
+@pytest.fixture
+def factory():
+    return FakeFactory()
+
+
+def pool_for(factory, **kwargs):
+    pool = DriverPool(factory, **kwargs)
+    pool._memory_mb = lambda entry: None  # The fake sessions have no processes
+    return pool
+
+
+def test_lease_and_release_reuses_session(factory):
+    pool = pool_for(factory, size=2)
+    lease = pool.acquire()
+    assert lease.driver is factory.drivers[0]
+    pool.release(lease)
+
+    again = pool.acquire()
+    assert again.driver is factory.drivers[0]
+    assert again.leases == 2
+    assert len(factory.drivers) == 1
+    assert not factory.drivers[0].quit_called
+
+
+def test_release_resets_session(factory):
+    pool = pool_for(factory)
+    lease = pool.acquire()
+    driver = lease.driver
+    driver.window_handles.append('popup')
+    pool.release(lease)
+    assert driver.cookies == {}
+    assert driver.local_storage == {}
+    assert driver.window_handles == ['main']
+    assert driver.url == 'about:blank'
+
+
+def test_cookies_deleted_without_cdp(factory):
+    pool = pool_for(factory)
+    lease = pool.acquire()
+    lease.driver.cdp_available = False
+    pool.release(lease)
+    assert lease.driver.cookies == {}
+    assert not lease.driver.quit_called
+
+
+def test_session_that_fails_to_reset_is_quit(factory):
+    pool = pool_for(factory)
+    lease = pool.acquire()
+    lease.driver.responsive = False
+    pool.release(lease)
+    assert lease.driver.quit_called
+    assert pool.acquire().driver is factory.drivers[1]
+
+
+def test_overflow_session_is_quit_on_release(factory):
+    pool = pool_for(factory, size=1)
+    first, second = pool.acquire(), pool.acquire()
+    assert not first.overflow
+    assert second.overflow
+    pool.release(second)
+    pool.release(first)
+    assert second.driver.quit_called
+    assert not first.driver.quit_called
+    assert pool.acquire().driver is first.driver
+
+
+def test_recycle_after_max_pages(factory):
+    pool = pool_for(factory, max_pages=3)
+    lease = pool.acquire()
+    for _ in range(2):
+        pool.record_page(lease.driver)
+    pool.release(lease)
+    assert not lease.driver.quit_called
+
+    lease = pool.acquire()
+    pool.record_page(lease.driver)
+    pool.record_page(FakeDriver(99))  # Drivers from elsewhere are ignored
+    assert lease.pages == 3
+    pool.release(lease)
+    assert lease.driver.quit_called
+    assert pool.acquire().driver is factory.drivers[1]
+
+
+def test_recycle_over_memory_limit(factory):
+    pool = pool_for(factory, max_memory_mb=100)
+    pool._memory_mb = lambda entry: 150
+    lease = pool.acquire()
+    pool.release(lease)
+    assert lease.driver.quit_called
+
+
+@pytest.mark.parametrize('dead', ['process', 'session'])
+def test_dead_idle_session_is_replaced(factory, dead):
+    alive = set()
+    pool = pool_for(factory, is_alive=lambda pid: pid in alive)
+    alive.add(1)
+    lease = pool.acquire()
+    pool.release(lease)
+    if dead == 'process':
+        alive.clear()
+    else:
+        lease.driver.responsive = False
+
+    replacement = pool.acquire()
+    assert lease.driver.quit_called
+    assert replacement.driver is factory.drivers[1]
+
+
+def test_warm_and_close(factory):
+    pool = pool_for(factory, size=2)
+    pool.warm()
+    assert len(factory.drivers) == 2
+    lease = pool.acquire()
+    pool.close()
+    assert [driver.quit_called for driver in factory.drivers if driver is not lease.driver] == [True]
+    assert not lease.driver.quit_called
+    # A session leased before close is quit when it comes back
+    pool.release(lease)
+    assert all(driver.quit_called for driver in factory.drivers)
+
+
+def test_shutdown_driver_pool(factory, monkeypatch):
+    monkeypatch.setattr(job_scraper.JobScraper, '_create_driver', classmethod(lambda cls: factory()))
+    monkeypatch.setattr(job_scraper, '_driver_pool', None)
+    pool = job_scraper.get_driver_pool(size=1)
+    pool._memory_mb = lambda entry: None
+    assert job_scraper.get_driver_pool(size=3) is pool
+    assert pool.size == 3
+
+    pool.release(pool.acquire())
+    job_scraper.shutdown_driver_pool()
+    assert factory.drivers[0].quit_called
+    assert job_scraper._driver_pool is None
+    job_scraper.shutdown_driver_pool()  # Nothing left to shut down
+    assert job_scraper.get_driver_pool() is not pool
+    job_scraper.shutdown_driver_pool()
@@ -0,0 +1,37 @@
+"""The GUI window is built and laid out quickly on startup."""
+import time
+
+import pytest
+
+tk = pytest.importorskip('tkinter')
+
+# Building the window and its first layout pass; a few hundred milliseconds on a
+# desktop, with room for slow CI machines
+FIRST_PAINT_BUDGET_SECONDS = 2.0
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    # Settings are read from the home directory, so point it at an empty one
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('USERPROFILE', str(tmp_path))
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"No display: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def test_first_paint_within_budget(root):
+    from job_scraper_gui import JobScraperGUI
+
+    start_time = time.perf_counter()
+    gui = JobScraperGUI(root)
+    root.update_idletasks()
+    elapsed = time.perf_counter() - start_time
+
+    assert gui.status_var.get() == "Idle"
+    assert str(gui.submit_button['state']) != 'disabled'
+    assert elapsed < FIRST_PAINT_BUDGET_SECONDS
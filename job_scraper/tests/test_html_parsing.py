@@ -0,0 +1,70 @@
+"""Strained Indeed parses extract the same cards, summaries and salaries as full parses."""
+import pytest
+
+from html_parsing import available_parsers, parse_indeed_detail, parse_indeed_results
+from job_scraper import JobScraper, parse_salary
+from replay import FixtureStore, _page_kind
+from test_replay import FIXTURES_DIR
+
+FIXTURES = FixtureStore(str(FIXTURES_DIR))
+PAGES = {kind: [FIXTURES.get(key) for key in FIXTURES.index['pages'] if _page_kind(key) == kind]
+         for kind in ('indeed_results', 'indeed_detail')}
+
+# Pages the strainer has to fall back on a full parse for
+PAY_OUTSIDE_SECTIONS = ('<html><body><div class="jobsearch-JobComponent"><div class="js-match-insights-provider">'
+                        '<h3>Pay</h3><div>$118,000 - $126,000 a year</div></div>'
+                        '<div id="jobDescriptionText"><p>Power BI and SQL.</p></div></div></body></html>')
+NO_DESCRIPTION = ('<html><body><div class="jobsearch-JobComponent"><h2>Job details</h2>'
+                  '<div><h3>Pay</h3><div>$52 an hour</div></div>'
+                  '<div><b>Responsibilities</b><ul><li>Build dashboards</li></ul></div></div></body></html>')
+
+
+@pytest.fixture(params=available_parsers())
+def parser(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    return JobScraper(use_index=False, use_driver_pool=False)
+
+
+def card_fields(card):
+    link = card.find('a', {'class': ['jcs-JobTitle', 'jobTitle']}, href=True)
+    salary = card.find(class_='salary-snippet-container')
+    return (link.get_text(strip=True) if link else None, link['href'] if link else None,
+            salary.get_text(' ', strip=True) if salary else None)
+
+
+def detail_fields(scraper, soup):
+    summary, salary_text = scraper.extract_job_details(soup)
+    return summary, salary_text, parse_salary(salary_text)
+
+
+def test_fixtures_have_indeed_pages():
+    assert len(PAGES['indeed_results']) >= 2
+    assert len(PAGES['indeed_detail']) >= 5
+
+
+@pytest.mark.parametrize('page', range(len(PAGES['indeed_results'])))
+def test_results_page_parity(parser, page):
+    html = PAGES['indeed_results'][page]
+    strained = [card_fields(card) for card in parse_indeed_results(html, parser)]
+    full = [card_fields(card) for card in parse_indeed_results(html, parser, strained=False)]
+    assert strained == full
+
+
+@pytest.mark.parametrize('page', range(len(PAGES['indeed_detail'])))
+def test_detail_page_parity(scraper, parser, page):
+    html = PAGES['indeed_detail'][page]
+    strained = detail_fields(scraper, parse_indeed_detail(html, parser))
+    assert strained == detail_fields(scraper, parse_indeed_detail(html, parser, strained=False))
+    assert strained[0]
+
+
+@pytest.mark.parametrize('html, salary', [(PAY_OUTSIDE_SECTIONS, 122000), (NO_DESCRIPTION, 52 * 40 * 52)],
+                         ids=['pay_outside_sections', 'no_description'])
+def test_detail_fallback_parity(scraper, parser, html, salary):
+    strained = detail_fields(scraper, parse_indeed_detail(html, parser))
+    assert strained == detail_fields(scraper, parse_indeed_detail(html, parser, strained=False))
+    assert strained[2] == salary
@@ -0,0 +1,51 @@
+"""Indeed job pages that fail to load or have no description are not cached."""
+import pytest
+
+from job_cache import JobCache
+from job_scraper import JobScraper
+
+JOB = {'title': 'BI Developer', 'company': 'Acme', 'url': 'https://www.indeed.com/viewjob?jk=abc123'}
+DETAIL_PAGE = ('<html><body><div id="jobDetailsSection"><h3>Pay</h3><div>$110,000 - $120,000 a year</div></div>'
+               '<div id="jobDescriptionText"><p>Build Tableau dashboards.</p></div></body></html>')
+CHALLENGE_PAGE = '<html><body><h1>Verify you are human</h1></body></html>'
+
+
+class FakeDriver:
+    def __init__(self, html):
+        self.page_source = html
+
+    def get(self, url):
+        pass
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = JobScraper(fetch_mode='browser', use_index=False, use_driver_pool=False, politeness_delay=(0, 0))
+    scraper._job_cache = JobCache(str(tmp_path / 'cache.sqlite3'))
+    yield scraper
+    scraper._job_cache.close()
+
+
+def fetch(scraper, html, ready):
+    scraper.wait_for = lambda step, condition, timeout=10, driver=None: True if ready else None
+    return scraper._fetch_indeed_detail_safe(lambda: FakeDriver(html), JOB)
+
+
+def test_loaded_page_is_cached(scraper):
+    summary, salary_text, salary = fetch(scraper, DETAIL_PAGE, ready=True)
+    assert summary == 'Build Tableau dashboards.'
+    assert salary == 115000
+    assert scraper.get_job_cache().get(JOB['url']) == {'summary': summary, 'salary_text': salary_text}
+
+
+def test_page_that_never_loads_fails_and_is_not_cached(scraper):
+    assert fetch(scraper, CHALLENGE_PAGE, ready=False) is None
+    assert scraper.get_job_cache().get(JOB['url']) is None
+
+
+def test_page_without_description_is_not_cached(scraper):
+    summary, salary_text, salary = fetch(scraper, CHALLENGE_PAGE, ready=True)
+    assert (summary, salary_text, salary) == ('', None, None)
+    assert scraper.get_job_cache().get(JOB['url']) is None
+    # The next run fetches the page again instead of reusing the empty details
+    assert fetch(scraper, DETAIL_PAGE, ready=True)[0] == 'Build Tableau dashboards.'
@@ -0,0 +1,85 @@
+"""Merging the same posting found on several sources."""
+import pytest
+
+from job_dedupe import dedupe_jobs, find_duplicate_groups
+
+SUMMARY = ('We are hiring a BI developer to build Tableau and Power BI dashboards, model data in SQL Server, '
+           'automate reporting pipelines with Python and work with finance and sales stakeholders on KPIs. '
+           'You will own the semantic layer, review data quality and mentor two junior analysts.')
+
+
+def job(source, url, summary=SUMMARY, title='Senior BI Developer', company='Acme Analytics', salary=None):
+    return {'title': title, 'company': company, 'summary': summary, 'salary_value': salary,
+            'source': source, 'url': url}
+
+
+def test_empty():
+    assert dedupe_jobs([]) == []
+    assert find_duplicate_groups([]) == []
+
+
+def test_exact_cross_source_duplicate():
+    indeed = job('Indeed', 'https://www.indeed.com/viewjob?jk=abc', salary=120000.0)
+    linkedin = job('LinkedIn', 'https://www.linkedin.com/jobs/view/123/')
+    merged = dedupe_jobs([indeed, linkedin])
+    assert len(merged) == 1
+    assert merged[0]['sources'] == 'Indeed, LinkedIn'
+    assert merged[0]['urls'] == f"{indeed['url']} {linkedin['url']}"
+
+
+def test_same_url_with_tracking_parameters():
+    first = job('Indeed', 'https://www.indeed.com/viewjob?jk=abc&from=serp', summary='Short')
+    second = job('Indeed', 'https://indeed.com/viewjob?jk=abc&tk=xyz', summary='Completely different text')
+    merged = dedupe_jobs([first, second])
+    assert len(merged) == 1
+    # The same source is listed once
+    assert merged[0]['sources'] == 'Indeed'
+
+
+def test_near_duplicate_above_threshold():
+    edited = SUMMARY.replace('two junior analysts', 'three junior analysts')
+    jobs = [job('Indeed', 'https://www.indeed.com/viewjob?jk=abc'),
+            job('LinkedIn', 'https://www.linkedin.com/jobs/view/123/', summary=edited)]
+    assert find_duplicate_groups(jobs, threshold=0.7) == [[0, 1]]
+    # The same pair is kept apart when near-identical is not enough
+    assert find_duplicate_groups(jobs, threshold=0.99) == [[0], [1]]
+
+
+def test_different_jobs_below_threshold():
+    jobs = [
+        job('Indeed', 'https://www.indeed.com/viewjob?jk=abc'),
+        job('LinkedIn', 'https://www.linkedin.com/jobs/view/123/', title='Registered Nurse', company='City Hospital',
+            summary='Night shift nurse for the emergency department, caring for patients and supporting physicians.'),
+        job('LinkedIn', 'https://www.linkedin.com/jobs/view/456/', company='Globex',
+            summary='Senior BI developer for a retail analytics team using Looker, BigQuery and dbt every day.'),
+    ]
+    assert find_duplicate_groups(jobs) == [[0], [1], [2]]
+    assert [record['sources'] for record in dedupe_jobs(jobs)] == ['Indeed', 'LinkedIn', 'LinkedIn']
+
+
+@pytest.mark.parametrize('records, kept', [
+    # A record with a salary wins over a longer summary without one
+    ([job('Indeed', 'https://a.example/1', summary=SUMMARY + ' Extra words here.'),
+      job('LinkedIn', 'https://b.example/1', salary=110000.0)], 1),
+    # Between records with salaries, the longest summary wins
+    ([job('Indeed', 'https://a.example/1', salary=100000.0),
+      job('LinkedIn', 'https://b.example/1', summary=SUMMARY + ' Hybrid in Austin.', salary=105000.0)], 1),
+    ([job('Indeed', 'https://a.example/1', summary=SUMMARY + ' Hybrid in Austin.'),
+      job('LinkedIn', 'https://b.example/1')], 0),
+])
+def test_kept_record(records, kept):
+    merged = dedupe_jobs(records)
+    assert len(merged) == 1
+    expected = {**records[kept], 'sources': 'Indeed, LinkedIn', 'urls': 'https://a.example/1 https://b.example/1'}
+    assert merged[0] == expected
+
+
+def test_groups_keep_input_order():
+    jobs = [job('Indeed', 'https://a.example/1', title='Data Engineer', company='Initech',
+                summary='Spark and Kafka streaming pipelines on AWS for the payments platform team.'),
+            job('Indeed', 'https://a.example/2'),
+            job('LinkedIn', 'https://b.example/1', title='Data Engineer', company='Initech',
+                summary='Spark and Kafka streaming pipelines on AWS for the payments platform team.'),
+            job('LinkedIn', 'https://b.example/2')]
+    assert find_duplicate_groups(jobs) == [[0, 2], [1, 3]]
+    assert [record['url'] for record in dedupe_jobs(jobs)] == ['https://a.example/1', 'https://a.example/2']
@@ -0,0 +1,87 @@
+"""JobIndex search, including skills that the FTS5 tokenizer would otherwise reduce to one letter."""
+import sqlite3
+
+import pytest
+
+from job_index import JobIndex, _fts_phrase
+
+JOBS = [
+    {'title': 'C++ Engineer', 'summary': 'Low latency C++/Python systems', 'url': 'https://example.com/1'},
+    {'title': 'C# Developer', 'summary': 'Services on .NET and ASP.NET Core', 'url': 'https://example.com/2'},
+    {'title': 'Embedded C Developer', 'summary': 'Firmware in C', 'url': 'https://example.com/3'},
+    {'title': 'Network Engineer', 'summary': 'Cisco network design', 'url': 'https://example.com/4'},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobIndex(str(tmp_path / 'index.sqlite3'))
+    index.add_many(JOBS)
+    yield index
+    index.close()
+
+
+def urls(jobs):
+    return sorted(job['url'][-1] for job in jobs)
+
+
+@pytest.mark.parametrize('text, phrase', [
+    ('C++', '"cplusplus"'),
+    ('c#', '"csharp"'),
+    ('.NET', '"dotnet"'),
+    ('ASP.NET', '"asp net"'),
+    ('Machine Learning', '"machine learning"'),
+    ('++', None),
+])
+def test_fts_phrase(text, phrase):
+    assert _fts_phrase(text) == phrase
+
+
+@pytest.mark.parametrize('skill, found', [
+    ('C++', '1'),
+    ('C#', '2'),
+    ('.NET', '2'),
+    ('ASP.NET', '2'),
+    ('C', '3'),
+    ('network', '4'),
+])
+def test_search_symbol_skills(index, skill, found):
+    assert urls(index.search(skills=[skill])) == list(found)
+
+
+def test_search_keywords(index):
+    assert urls(index.search(keywords='C++ python')) == ['1']
+    assert urls(index.search(keywords='developer C#')) == ['2']
+
+
+def test_update_keeps_index_in_sync(index):
+    index.add({'title': 'Rust Engineer', 'summary': 'Rewriting C++ in Rust', 'url': 'https://example.com/2'})
+    assert urls(index.search(skills=['C#'])) == []
+    assert urls(index.search(skills=['C++'])) == ['1', '2']
+
+
+def test_old_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'index.sqlite3')
+    JobIndex(path).close()
+    # Turn it back into an index of the raw text, as written before SCHEMA_VERSION 1
+    with sqlite3.connect(path) as conn:
+        conn.executescript('''
+            DROP TRIGGER jobs_ai;
+            DELETE FROM jobs_fts;
+            CREATE TRIGGER jobs_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, title, company, summary)
+                VALUES (new.id, new.title, new.company, new.summary);
+            END;
+            PRAGMA user_version = 0;
+        ''')
+        conn.execute(
+            "INSERT INTO jobs (url_key, title, summary, url, first_seen, last_seen) "
+            "VALUES ('example.com/1', 'C++ Engineer', 'C++ systems', 'https://example.com/1', '2024-01-01', '2024-01-01')"
+        )
+
+    index = JobIndex(path)
+    assert urls(index.search(skills=['C++'])) == ['1']
+    assert urls(index.search(skills=['C'])) == []
+    index.add(JOBS[0])
+    assert urls(index.search(skills=['C++'])) == ['1']
+    index.close()
@@ -0,0 +1,50 @@
+"""Jobs are scored by the skills they share with the resume."""
+import pytest
+
+from job_matcher import JobMatcher
+from job_scraper import JobScraper
+from skill_matcher import SkillMatcher
+
+RESUME_SKILLS = ['Python', 'SQL', 'Tableau', 'Power BI', 'Mentoring']
+MATCHING_JOB = 'BI Developer building Tableau and Power BI dashboards on SQL Server with Python.'
+PARTIAL_JOB = 'Data engineer: Python, Spark and Kafka pipelines.'
+UNRELATED_JOB = 'Registered nurse for the night shift in a busy emergency department.'
+
+
+class FakeParser:
+    """Stands in for ATSParser with a resume whose skills are already known"""
+
+    def __init__(self, skills):
+        self.skill_matcher = SkillMatcher()
+        self.skills = skills
+
+    def parse_resume(self, path):
+        return {'skills': {'technical': [skill for skill in self.skills if skill != 'Mentoring'],
+                           'soft': [skill for skill in self.skills if skill == 'Mentoring']}}
+
+
+@pytest.fixture
+def matcher():
+    return JobMatcher('resume.docx', parser=FakeParser(RESUME_SKILLS))
+
+
+def test_matching_job_scores_higher(matcher):
+    matching, partial, unrelated = matcher.score_jobs([MATCHING_JOB, PARTIAL_JOB, UNRELATED_JOB])
+    assert matching > partial > unrelated == 0
+    assert 0 < matching <= 100
+
+
+def test_score_job_matches_score_jobs(matcher):
+    texts = [MATCHING_JOB, PARTIAL_JOB, UNRELATED_JOB, '', None]
+    assert [matcher.score_job(text) for text in texts] == list(matcher.score_jobs(texts))
+
+
+def test_resume_without_skills_scores_zero():
+    matcher = JobMatcher('resume.docx', parser=FakeParser([]))
+    assert list(matcher.score_jobs([MATCHING_JOB])) == [0]
+
+
+def test_missing_resume_warns(capsys):
+    scraper = JobScraper(resume='/nonexistent/resume.pdf', use_cache=False, use_index=False)
+    assert scraper.get_job_matcher() is None
+    assert 'no match_score' in capsys.readouterr().out
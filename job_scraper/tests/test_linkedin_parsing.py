@@ -0,0 +1,100 @@
+"""LinkedIn results and details snapshots are parsed from saved HTML, and stale panes are not read."""
+from pathlib import Path
+
+import pytest
+
+from job_scraper import JobScraper, parse_linkedin_cards, parse_linkedin_details
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'linkedin'
+PARSERS = ['html.parser', 'lxml']
+
+
+def fixture(name):
+    return (FIXTURES_DIR / name).read_text(encoding='utf-8')
+
+
+@pytest.fixture(params=PARSERS)
+def parser(request):
+    if request.param == 'lxml':
+        pytest.importorskip('lxml')
+    return request.param
+
+
+def test_cards_in_page_order(parser):
+    assert parse_linkedin_cards(fixture('cards.html'), parser) == [
+        {'job_id': '3901', 'title': 'BI Developer', 'company': 'Contoso'},
+        {'job_id': '3902', 'title': 'Analytics Engineer', 'company': 'Fabrikam'},
+        {'job_id': '3903', 'title': None, 'company': None},
+    ]
+
+
+def test_salary_pill_and_top_card(parser):
+    assert parse_linkedin_details(fixture('details_pill.html'), parser) == {
+        'summary': 'Senior Level BI Developer.\nSQL Server and SSRS.',
+        'salary_text': '$110K/yr - $125K/yr',
+        'title': 'BI Developer',
+        'company': 'Contoso',
+    }
+
+
+def test_compensation_paragraph(parser):
+    details = parse_linkedin_details(fixture('details_compensation.html'), parser)
+    assert details['salary_text'] == 'Compensation Range: $95,000 - $105,000 per year'
+    assert (details['title'], details['company']) == ('Tableau Consultant', 'Tailspin')
+
+
+def test_no_salary(parser):
+    details = parse_linkedin_details(fixture('details_no_salary.html'), parser)
+    assert details['summary'] == 'Excel and Power BI reporting.'
+    assert details['salary_text'] is None
+    assert (details['title'], details['company']) == ('Reporting Analyst', None)
+
+
+def test_pane_without_description(parser):
+    assert parse_linkedin_details(fixture('details_loading.html'), parser) is None
+
+
+class SnapshotDriver:
+    """Returns the queued details snapshots one poll at a time, then repeats the last one"""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.polls = 0
+
+    def execute_script(self, script, *args):
+        self.polls += 1
+        return self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+
+
+def snapshot(name, verified=False):
+    html = fixture(name)
+    return {'html': html, 'verified': verified, 'description': parse_linkedin_details(html)['summary']}
+
+
+@pytest.fixture
+def scraper():
+    return JobScraper(use_index=False, use_driver_pool=False)
+
+
+def test_stale_unverified_pane_is_skipped(scraper):
+    scraper._last_linkedin_description = snapshot('details_pill.html')['description']
+    condition = scraper._details_snapshot('3902')
+    assert condition(SnapshotDriver(snapshot('details_pill.html'))) is None
+    assert condition(SnapshotDriver(None)) is None
+    assert condition(SnapshotDriver(snapshot('details_no_salary.html'))) == fixture('details_no_salary.html')
+    assert scraper._last_linkedin_description == 'Excel and Power BI reporting.'
+
+
+def test_verified_pane_is_read_even_with_the_same_description(scraper):
+    scraper._last_linkedin_description = snapshot('details_pill.html')['description']
+    condition = scraper._details_snapshot('3901')
+    assert condition(SnapshotDriver(snapshot('details_pill.html', verified=True))) == fixture('details_pill.html')
+
+
+def test_extract_waits_for_the_next_pane(scraper):
+    pytest.importorskip('selenium')
+    scraper._last_linkedin_description = snapshot('details_pill.html')['description']
+    scraper.driver = SnapshotDriver(None, snapshot('details_pill.html'), snapshot('details_compensation.html'))
+    details = scraper._extract_linkedin_details('3904')
+    assert details['title'] == 'Tableau Consultant'
+    assert scraper.driver.polls == 3
@@ -0,0 +1,46 @@
+"""Indeed cards whose salary snippet is below the rating cutoff are skipped before their job page loads."""
+import pytest
+
+from job_scraper import JobScraper
+
+
+def card(job_id, salary_text=None):
+    return {'title': f'Job {job_id}', 'url': f'https://www.indeed.com/viewjob?jk={job_id}', 'salary_text': salary_text}
+
+
+@pytest.fixture
+def scraper():
+    return JobScraper(salary_range=[100000, 130000], use_index=False, use_driver_pool=False)
+
+
+def test_card_below_the_cutoff_is_skipped(scraper):
+    bottom_buffer_low = scraper.rating_thresholds()[1]
+    low = card('low', f'${bottom_buffer_low - 1000:,.0f} a year')
+    kept, skipped = scraper.prefilter_job_cards([low])
+    assert (kept, skipped) == ([], [low])
+    assert scraper.rate_job(scraper.extract_salaries([low['salary_text']])[0]) is None
+
+
+def test_card_without_salary_is_kept(scraper):
+    cards = [card('none'), card('empty', ''), card('text', 'Full-time')]
+    assert scraper.prefilter_job_cards(cards) == (cards, [])
+
+
+def test_split_keeps_card_order(scraper):
+    cards = [
+        card('a', '$125,000 a year'),
+        card('b', 'Estimated $60K - $70K a year'),
+        card('c'),
+        card('d', '$20 an hour'),
+        card('e', '$105,000 - $115,000 a year'),
+    ]
+    kept, skipped = scraper.prefilter_job_cards(cards)
+    assert [c['url'][-1] for c in kept] == ['a', 'c', 'e']
+    assert [c['url'][-1] for c in skipped] == ['b', 'd']
+
+
+@pytest.mark.parametrize('settings', [{'prefilter_cards': False}, {'salary_range': None}])
+def test_disabled_prefilter_keeps_every_card(settings):
+    scraper = JobScraper(**{'salary_range': [100000, 130000], 'use_index': False, 'use_driver_pool': False, **settings})
+    cards = [card('low', '$40,000 a year'), card('none')]
+    assert scraper.prefilter_job_cards(cards) == (cards, [])
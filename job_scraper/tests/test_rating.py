@@ -0,0 +1,72 @@
+"""rate_jobs rates a whole DataFrame exactly like rate_job rates one job at a time."""
+import random
+
+import pandas as pd
+import pytest
+
+from job_scraper import JobScraper
+
+SALARY_RANGE = (100000, 130000)
+SUMMARIES = [None, '', 'Senior Level BI role', 'senior level analyst', 'Mid Level developer', 'Entry Level']
+
+
+def scraper(require_experience, include_no_salary, experience_levels=('Senior Level',)):
+    return JobScraper(salary_range=SALARY_RANGE, require_experience=require_experience,
+                      include_no_salary=include_no_salary, experience_levels=list(experience_levels),
+                      use_cache=False, use_index=False)
+
+
+def salaries(job_scraper, rng, count):
+    """Random salaries around the range, plus every threshold and the missing values"""
+    top_threshold, bottom_buffer_low, bottom_buffer_high = job_scraper.rating_thresholds()
+    values = [None, float('nan'), 0, 0.0, top_threshold, bottom_buffer_low, bottom_buffer_high,
+              bottom_buffer_low - 0.01, bottom_buffer_high + 0.01, top_threshold - 0.01]
+    values += [rng.choice([rng.uniform(50000, 160000), float(rng.randrange(50000, 160000, 500))])
+               for _ in range(count)]
+    return values
+
+
+def assert_parity(job_scraper, salary_values, summaries):
+    df = pd.DataFrame({'salary_value': salary_values, 'summary': summaries})
+    expected = [job_scraper.rate_job(salary, summary) for salary, summary in zip(salary_values, summaries)]
+    ratings = job_scraper.rate_jobs(df)
+    assert str(ratings.dtype) == 'Int64'
+    assert [None if pd.isna(rating) else int(rating) for rating in ratings] == expected
+
+
+@pytest.mark.parametrize('include_no_salary', [False, True])
+@pytest.mark.parametrize('require_experience', [False, True])
+def test_rate_jobs_matches_rate_job(require_experience, include_no_salary):
+    job_scraper = scraper(require_experience, include_no_salary)
+    rng = random.Random(6)
+    salary_values = salaries(job_scraper, rng, 2000)
+    summaries = [rng.choice(SUMMARIES) for _ in salary_values]
+    assert_parity(job_scraper, salary_values, summaries)
+
+
+@pytest.mark.parametrize('salary', [None, float('nan'), 0])
+@pytest.mark.parametrize('include_no_salary', [False, True])
+def test_no_salary_is_not_rated(salary, include_no_salary):
+    job_scraper = scraper(False, include_no_salary)
+    assert job_scraper.rate_job(salary) is None
+    assert job_scraper.rate_jobs(pd.DataFrame({'salary_value': [salary], 'summary': ['']})).isna().all()
+
+
+def test_experience_downgrade():
+    job_scraper = scraper(True, False, experience_levels=['Senior Level', 'Lead'])
+    salary_values = [128000, 128000, 128000, 128000, 120000]
+    summaries = ['Senior Level engineer', 'tech LEAD', 'Mid level', None, 'Mid level']
+    assert [job_scraper.rate_job(s, summary) for s, summary in zip(salary_values, summaries)] == [1, 1, 2, 2, 2]
+    assert_parity(job_scraper, salary_values, summaries)
+
+
+def test_experience_levels_are_literal_text():
+    # Levels are matched as plain text, never as regular expressions
+    job_scraper = scraper(True, False, experience_levels=['C++ (Senior)'])
+    assert_parity(job_scraper, [128000, 128000], ['C++ (Senior) role', 'C (Senior) role'])
+
+
+def test_empty_frame():
+    ratings = scraper(True, True).rate_jobs(pd.DataFrame({'salary_value': [], 'summary': []}))
+    assert ratings.empty
+    assert str(ratings.dtype) == 'Int64'
@@ -0,0 +1,118 @@
+"""
+Offline regression test of the scraping pipeline: the recorded pages in
+fixtures/replay are replayed through scrape_indeed and scrape_linkedin.
+The fixtures were recorded with replay.py from a small hand-written site.
+"""
+import contextlib
+import csv
+import io
+import os
+
+import pytest
+
+pytest.importorskip('selenium')  # wait_for uses selenium's WebDriverWait
+
+from html_parsing import available_parsers
+from replay import RECORDED_SETTINGS, FixtureStore, ReplayScraper, bench, bench_parsers
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'replay')
+
+# Stored jobs in result-page order: (title, company, salary_value, rating)
+INDEED_JOBS = [
+    ('Senior BI Developer', 'Acme Analytics', 132500.0, 1),
+    ('BI Developer', 'Globex', 104000.0, 3),  # $45 - $55 an hour
+    ('Tableau Developer', 'Umbrella Corp', None, None),  # No Pay section
+    ('Power BI Developer', 'Hooli', 111500.0, 3),
+    ('Data Visualization Engineer', 'Stark Industries', None, None),
+]
+LINKEDIN_JOBS = [
+    ('BI Developer', 'Contoso', 117500.0, 2),
+    ('Analytics Engineer', 'Fabrikam', 135200.0, 1),  # $60/hr - $70/hr
+    ('Reporting Analyst', 'Northwind', 75000.0, None),  # Below the salary range
+    ('Tableau Consultant', 'Tailspin', None, None),
+]
+
+
+def saved(jobs):
+    """The jobs that make it into the results file: rated and with a salary"""
+    return [job for job in jobs if job[3] is not None and job[2] is not None]
+
+
+@pytest.fixture(scope='module')
+def fixtures():
+    return FixtureStore(FIXTURES_DIR)
+
+
+def replay(fixtures, output_dir, websites, **overrides):
+    """Replay websites with the recorded settings; returns the scraper and the saved result rows"""
+    settings = {name: value for name, value in fixtures.index['settings'].items() if name in RECORDED_SETTINGS}
+    settings.update(overrides)
+    scraper = ReplayScraper(fixtures, str(output_dir), **settings)
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper.scrape_jobs(websites)
+    source = websites[0] if len(websites) == 1 else 'All'
+    with open(scraper.results_path(source), newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    return scraper, rows
+
+
+def job_tuples(jobs):
+    return [(job['title'], job['company'], job['salary_value'], job['rating']) for job in jobs]
+
+
+def row_tuples(rows):
+    return [(row['title'], row['company'], float(row['salary_value']), int(row['rating'])) for row in rows]
+
+
+@pytest.mark.parametrize('detail_workers', [1, 3])
+def test_indeed(fixtures, tmp_path, detail_workers):
+    scraper, rows = replay(fixtures, tmp_path, ['Indeed'], detail_workers=detail_workers)
+    assert job_tuples(scraper.jobs) == INDEED_JOBS
+    assert row_tuples(rows) == saved(INDEED_JOBS)
+    assert all(row['source'] == 'Indeed' for row in rows)
+    # The card below the salary floor is never opened
+    assert scraper.profiler.counters['prefilter.Indeed.skipped'] == 1
+    assert not any('a1003' in job['url'] for job in scraper.jobs)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+
+@pytest.mark.parametrize('detail_workers', [1, 3])
+def test_linkedin(fixtures, tmp_path, detail_workers):
+    scraper, rows = replay(fixtures, tmp_path, ['LinkedIn'], detail_workers=detail_workers)
+    assert job_tuples(scraper.jobs) == LINKEDIN_JOBS
+    assert row_tuples(rows) == saved(LINKEDIN_JOBS)
+    assert [job['url'] for job in scraper.jobs][:2] == [
+        'https://www.linkedin.com/jobs/view/3901/', 'https://www.linkedin.com/jobs/view/3902/']
+
+
+@pytest.mark.parametrize('detail_workers', [1, 3])
+def test_both_sources(fixtures, tmp_path, detail_workers):
+    scraper, rows = replay(fixtures, tmp_path, ['Indeed', 'LinkedIn'], detail_workers=detail_workers)
+    assert scraper.job_count == len(INDEED_JOBS) + len(LINKEDIN_JOBS)
+    assert row_tuples(rows) == saved(INDEED_JOBS) + saved(LINKEDIN_JOBS)
+    assert [row['source'] for row in rows] == ['Indeed'] * 3 + ['LinkedIn'] * 2
+    # Only the merged results are left; the per-source partial files are removed
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(scraper.results_path('All', extension))
+                                            for extension in ('csv', 'perf.json')]
+
+
+@pytest.mark.parametrize('html_parser', available_parsers())
+def test_html_parsers(fixtures, tmp_path, html_parser):
+    scraper, _ = replay(fixtures, tmp_path, ['Indeed', 'LinkedIn'], html_parser=html_parser)
+    assert job_tuples(scraper.jobs) == INDEED_JOBS + LINKEDIN_JOBS
+
+
+def test_bench(fixtures):
+    results = bench(fixtures, repeat=1)
+    assert results['jobs'] == len(INDEED_JOBS) + len(LINKEDIN_JOBS)
+    assert results['pages'] == len(fixtures)
+    assert results['jobs_per_second'] > 0
+
+
+def test_bench_parsers(fixtures):
+    results = bench_parsers(fixtures, repeat=1, parsers=['html.parser'])
+    assert {(row['page'], row['mode']) for row in results} == {
+        ('indeed_detail', 'full'), ('indeed_detail', 'strained'),
+        ('indeed_results', 'full'), ('indeed_results', 'strained'),
+        ('linkedin_cards', 'full'), ('linkedin_details', 'full'),
+    }
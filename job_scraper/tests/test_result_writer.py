@@ -0,0 +1,153 @@
+"""ResultWriter output formats, the partial file and the scraper's handling of writers between runs."""
+import csv
+import json
+import os
+
+import pytest
+
+from checkpoints import ScrapeCheckpoint
+from job_scraper import JobScraper
+from result_writer import RESULT_COLUMNS, ResultWriter
+
+RECORDS = [
+    {'title': 'BI Developer', 'company': 'Acme', 'summary': 'Tableau, SQL', 'salary_text': '$120,000 a year',
+     'salary_value': 120000.0, 'rating': 1, 'company_rating': None, 'match_score': 62.5,
+     'source': 'Indeed', 'url': 'https://www.indeed.com/viewjob?jk=1'},
+    {'title': 'Data Analyst', 'company': 'Globex', 'summary': 'Excel', 'salary_text': 'Not specified',
+     'salary_value': None, 'rating': 2, 'company_rating': None, 'match_score': None,
+     'source': 'Indeed', 'url': 'https://www.indeed.com/viewjob?jk=2'},
+    {'title': 'Analytics Engineer', 'company': 'Initech', 'summary': 'dbt', 'salary_text': '$95,000 a year',
+     'salary_value': 95000.0, 'rating': 2, 'company_rating': None, 'match_score': 10.0,
+     'source': 'Indeed', 'url': 'https://www.indeed.com/viewjob?jk=3'},
+]
+
+
+def read_results(path, fmt):
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    if fmt == 'jsonl':
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+    import pyarrow.parquet as pq
+    return pq.read_table(path).to_pylist()
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl', 'parquet'])
+def test_round_trip(tmp_path, fmt):
+    if fmt == 'parquet':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'results.{fmt}')
+    writer = ResultWriter(path, fmt=fmt)
+    for record in RECORDS:
+        writer.write(record)
+    writer.close()
+
+    rows = read_results(path, fmt)
+    if fmt == 'csv':
+        # CSV has no types or nulls
+        expected = [{column: '' if record[column] is None else str(record[column]) for column in RESULT_COLUMNS}
+                    for record in RECORDS]
+    else:
+        expected = RECORDS
+    assert rows == expected
+
+
+def test_partial_file_until_close(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    writer = ResultWriter(path, flush_every=2)
+    writer.write(RECORDS[0])
+    assert read_results(writer.temp_path, 'jsonl') == []
+    writer.write(RECORDS[1])
+    # Flushed every flush_every records, before the file is complete
+    assert len(read_results(writer.temp_path, 'jsonl')) == 2
+    assert not os.path.exists(path)
+
+    writer.write(RECORDS[2])
+    writer.close()
+    assert len(read_results(path, 'jsonl')) == 3
+    assert not os.path.exists(writer.temp_path)
+    with pytest.raises(ValueError):
+        writer.write(RECORDS[0])
+
+
+def test_close_incomplete_keeps_partial_file(tmp_path):
+    path = str(tmp_path / 'results.csv')
+    writer = ResultWriter(path)
+    writer.write(RECORDS[0])
+    writer.close(complete=False)
+    assert writer.closed
+    assert not os.path.exists(path)
+    assert len(read_results(writer.temp_path, 'csv')) == 1
+
+    writer.discard()
+    assert not os.path.exists(writer.temp_path)
+
+
+def test_discard(tmp_path):
+    path = str(tmp_path / 'results.csv')
+    writer = ResultWriter(path)
+    writer.write(RECORDS[0])
+    writer.discard()
+    assert os.listdir(tmp_path) == []
+
+
+def test_rating_counts(tmp_path):
+    writer = ResultWriter(str(tmp_path / 'results.csv'))
+    for record in RECORDS:
+        writer.write(record)
+    writer.close()
+    assert writer.count == 3
+    assert writer.rating_counts == {1: 1, 2: 2}
+
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        ResultWriter(str(tmp_path / 'results.xlsx'))
+    with pytest.raises(ValueError):
+        JobScraper(output_format='xlsx')
+
+
+class SavedCheckpoint(ScrapeCheckpoint):
+    """Checkpoint holding one stored job and nothing on disk"""
+
+    def load(self):
+        self.jobs = [dict(RECORDS[0])]
+        return True
+
+    def save(self):
+        pass
+
+
+class FailingScraper(JobScraper):
+    checkpoint_class = SavedCheckpoint
+
+    def __init__(self, output_dir, **kwargs):
+        super().__init__(salary_range=(100000, 130000), resume_run=True, use_cache=False, use_index=False,
+                         use_driver_pool=False, **kwargs)
+        self.output_dir = output_dir
+
+    def results_path(self, source, extension=None):
+        return os.path.join(self.output_dir, os.path.basename(super().results_path(source, extension)))
+
+    def setup_driver(self):
+        pass
+
+    def handle_page_load(self, url, max_retries=3, ready=None, step='page_load'):
+        raise RuntimeError('driver crashed')
+
+
+def test_failed_scrape_closes_its_results_file(tmp_path):
+    scraper = FailingScraper(str(tmp_path))
+    with pytest.raises(RuntimeError):
+        scraper.scrape_jobs(['Indeed'])
+    writer = scraper._writers['Indeed']
+    assert writer.closed
+    assert len(read_results(writer.temp_path, 'csv')) == 1
+
+    # A reused scraper starts a new results file instead of appending to the failed run's
+    scraper._start_run()
+    assert scraper._writers == {}
+    scraper.store_job(dict(RECORDS[2]))
+    scraper.save_results('Indeed')
+    assert [row['url'] for row in read_results(writer.path, 'csv')] == [RECORDS[2]['url']]
@@ -0,0 +1,27 @@
+"""
+Speed of parse_salary and extract_salaries against the original extractor.
+Needs pytest-benchmark (pip install -r requirements-dev.txt): python -m pytest tests/test_salary_benchmark.py
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from job_scraper import extract_salaries, parse_salary
+from salary_corpus import CORPUS, original_extract_salary
+
+TEXTS = [text for text, _, _, _ in CORPUS] * 20
+
+
+@pytest.mark.benchmark(group='salary')
+def test_original_extract_salary(benchmark):
+    benchmark(lambda: [original_extract_salary(text) for text in TEXTS])
+
+
+@pytest.mark.benchmark(group='salary')
+def test_parse_salary(benchmark):
+    benchmark(lambda: [parse_salary(text) for text in TEXTS])
+
+
+@pytest.mark.benchmark(group='salary')
+def test_extract_salaries(benchmark):
+    benchmark(extract_salaries, TEXTS)
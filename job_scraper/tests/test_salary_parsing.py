@@ -0,0 +1,33 @@
+"""parse_salary against the original extractor over a corpus of real salary strings."""
+import pytest
+
+from job_scraper import JobScraper, extract_salaries, parse_salary
+from salary_corpus import CORPUS, original_extract_salary
+
+TEXTS = [text for text, _, _, _ in CORPUS]
+
+
+@pytest.mark.parametrize('text, original, expected, reason', CORPUS)
+def test_parse_salary(text, original, expected, reason):
+    assert parse_salary(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('text, original, expected, reason', CORPUS)
+def test_original_results(text, original, expected, reason):
+    assert original_extract_salary(text) == pytest.approx(original)
+
+
+@pytest.mark.parametrize('text, original, expected, reason', CORPUS)
+def test_only_intended_changes(text, original, expected, reason):
+    # Every result that differs from the original extractor names the bug it fixes
+    assert (original != expected) == (reason is not None)
+
+
+def test_extract_salaries_matches_parse_salary():
+    texts = TEXTS + TEXTS[:5]  # Repeated texts are parsed once
+    assert extract_salaries(texts) == [parse_salary(text) for text in texts]
+
+
+def test_extract_salary_method():
+    scraper = JobScraper(use_cache=False, use_index=False)
+    assert [scraper.extract_salary(text) for text in TEXTS] == [parse_salary(text) for text in TEXTS]
@@ -0,0 +1,31 @@
+"""Importing job_scraper stays cheap: heavy packages are imported where first needed."""
+import os
+
+import pytest
+
+from import_timing import import_times, loaded_packages
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time allowed for job_scraper; pandas alone takes about half a second
+IMPORT_BUDGET_SECONDS = 0.4
+# Resume parsing is only needed once a resume is matched against jobs
+RESUME_PACKAGES = {'nltk', 'pdfminer', 'docx2txt'}
+# Browser and data packages are only needed once a scrape runs or results are merged
+HEAVY_PACKAGES = {'selenium', 'undetected_chromedriver', 'pandas', 'numpy', 'scipy'}
+
+
+def test_import_does_not_load_resume_parsing():
+    assert not loaded_packages(import_times('job_scraper', PACKAGE_DIR)) & RESUME_PACKAGES
+
+
+def test_import_does_not_load_heavy_packages():
+    assert not loaded_packages(import_times('job_scraper', PACKAGE_DIR)) & HEAVY_PACKAGES
+
+
+def test_gui_startup_does_not_load_heavy_packages():
+    pytest.importorskip('tkinter')
+    assert not loaded_packages(import_times('job_scraper_gui', PACKAGE_DIR)) & HEAVY_PACKAGES
+
+
+def test_import_time_within_budget():
+    assert import_times('job_scraper', PACKAGE_DIR)['job_scraper'] < IMPORT_BUDGET_SECONDS